@@ -6,7 +6,7 @@ Discovers which behavioral code has corresponding entity specifications
 in the Loom. Reports gaps between implementation and specification.
 
 Usage:
-    python scripts/audit_coverage.py [--db PATH] [--check] [--verbose]
+    python scripts/audit_coverage.py [--db PATH] [--check] [--json] [--verbose]
 
 Categories:
     Behavioral: User-facing capability -> needs behavior + tool entities
@@ -16,13 +16,22 @@ Categories:
 
 import argparse
 import ast
+import hashlib
 import json
+import mmap
+import re
 import sqlite3
 import sys
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # Configuration: Module Classification
@@ -30,7 +39,7 @@ from typing import Any
 
 # Functions classified as behavioral (user-facing capability)
 # These should have behavior + tool entities
-BEHAVIORAL_FUNCTIONS = {
+BEHAVIORAL_FUNCTIONS: frozenset[str] = frozenset({
     # Attention Layer (Focus/Signal)
     "create_focus",
     "resolve_focus",
@@ -55,18 +64,18 @@ BEHAVIORAL_FUNCTIONS = {
     # Pulse
     "pulse_check_signals",
     "pulse_preview",
-}
+})
 
 # Function names that map to differently-named tools (canonical names)
 # Used when function name doesn't match tool name pattern
-FUNCTION_TO_TOOL = {
+FUNCTION_TO_TOOL: dict[str, str] = {
     "create_focus": "tool-engage",      # Canonical: engage > create-focus
     "resolve_focus": "tool-resolve",    # Canonical: resolve > resolve-focus
 }
 
 # Functions classified as primitive (kernel building blocks)
 # These should have primitive entities
-PRIMITIVE_FUNCTIONS = {
+PRIMITIVE_FUNCTIONS: frozenset[str] = frozenset({
     "sys_log",
     "identity_primitive",
     "ui_render",
@@ -77,16 +86,36 @@ PRIMITIVE_FUNCTIONS = {
     "fts_search",
     "write_file",
     "update_verifies_bond_metadata",
-}
+})
 
 # Functions classified as infrastructure (internal plumbing)
 # These don't need entities but should be documented
-INFRASTRUCTURE_FUNCTIONS = {
+INFRASTRUCTURE_FUNCTIONS: frozenset[str] = frozenset({
     "_resolve_entity",
     "_fire_entity_hooks",
     "_ensure_schema",
+})
+
+# Single lookup table: function name -> classification (one hash probe).
+# Later entries win, matching the behavioral > primitive > infrastructure
+# precedence of the original if/elif chain.
+CLASSIFICATION: dict[str, str] = {
+    **{name: "infrastructure" for name in INFRASTRUCTURE_FUNCTIONS},
+    **{name: "primitive" for name in PRIMITIVE_FUNCTIONS},
+    **{name: "behavioral" for name in BEHAVIORAL_FUNCTIONS},
 }
 
+# The sets are frozen, so their sizes are fixed at import
+_N_BEHAVIORAL = len(BEHAVIORAL_FUNCTIONS)
+_N_PRIMITIVE = len(PRIMITIVE_FUNCTIONS)
+
+# Per-user cache for results that survive between audit runs
+CACHE_DIR = Path.home() / ".cache" / "chora"
+
+# Parsed-function cache; bump the version when extraction rules change
+AST_CACHE_DIR = CACHE_DIR / "audit_ast"
+AST_CACHE_VERSION = 2
+
 # Modules to audit
 MODULES_TO_AUDIT = [
     "std.py",
@@ -106,7 +135,7 @@ MODULES_TO_AUDIT = [
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionInfo:
     """Information about a discovered function."""
     name: str
@@ -116,7 +145,7 @@ class FunctionInfo:
     is_public: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntityInfo:
     """Information about an entity from the Loom."""
     id: str
@@ -125,7 +154,7 @@ class EntityInfo:
     python_ref: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticSuggestion:
     """A semantic classification suggestion for an unclassified function."""
     func: FunctionInfo
@@ -135,25 +164,52 @@ class SemanticSuggestion:
     reasoning: str
 
 
-@dataclass
+# Cleared lists recycled across AuditResult instances (watch-mode re-runs)
+_LIST_POOL: list[list[Any]] = []
+_LIST_POOL_MAX = 64
+
+
+def _pooled_list() -> list[Any]:
+    """Take an empty list from the pool, or allocate one."""
+    return _LIST_POOL.pop() if _LIST_POOL else []
+
+
+def _release_list(lst: list[Any]) -> None:
+    """Clear a list and return it to the pool (bounded)."""
+    lst.clear()
+    if len(_LIST_POOL) < _LIST_POOL_MAX:
+        _LIST_POOL.append(lst)
+
+
+@dataclass(slots=True)
 class AuditResult:
     """Results of the audit."""
-    functions: list[FunctionInfo] = field(default_factory=list)
-    behaviors: list[EntityInfo] = field(default_factory=list)
-    primitives: list[EntityInfo] = field(default_factory=list)
-    tools: list[EntityInfo] = field(default_factory=list)
+    functions: list[FunctionInfo] = field(default_factory=_pooled_list)
+    behaviors: list[EntityInfo] = field(default_factory=_pooled_list)
+    primitives: list[EntityInfo] = field(default_factory=_pooled_list)
+    tools: list[EntityInfo] = field(default_factory=_pooled_list)
 
     # Gaps
-    behavioral_gaps: list[FunctionInfo] = field(default_factory=list)
-    primitive_gaps: list[FunctionInfo] = field(default_factory=list)
-    tool_gaps: list[EntityInfo] = field(default_factory=list)  # behaviors without tools
-    infrastructure: list[FunctionInfo] = field(default_factory=list)
-    unclassified: list[FunctionInfo] = field(default_factory=list)
+    behavioral_gaps: list[FunctionInfo] = field(default_factory=_pooled_list)
+    primitive_gaps: list[FunctionInfo] = field(default_factory=_pooled_list)
+    tool_gaps: list[EntityInfo] = field(default_factory=_pooled_list)  # behaviors without tools
+    infrastructure: list[FunctionInfo] = field(default_factory=_pooled_list)
+    unclassified: list[FunctionInfo] = field(default_factory=_pooled_list)
 
     # Semantic suggestions for unclassified functions
-    semantic_suggestions: list[SemanticSuggestion] = field(default_factory=list)
+    semantic_suggestions: list[SemanticSuggestion] = field(default_factory=_pooled_list)
     semantic_method: str = "unavailable"
 
+    def release(self) -> None:
+        """Return this result's lists to the pool once the caller is done with it."""
+        for name in (
+            "functions", "behaviors", "primitives", "tools",
+            "behavioral_gaps", "primitive_gaps", "tool_gaps",
+            "infrastructure", "unclassified", "semantic_suggestions",
+        ):
+            _release_list(getattr(self, name))
+            setattr(self, name, [])
+
 
 # =============================================================================
 # Code Discovery (AST)
@@ -161,40 +217,163 @@ class AuditResult:
 
 
 def extract_functions(module_path: Path) -> list[FunctionInfo]:
-    """Extract public functions from a Python module using AST."""
+    """
+    Extract public functions from a Python module using AST.
+
+    Results are cached under AST_CACHE_DIR keyed by the file's mtime and
+    size, so unchanged modules are not re-parsed on repeat runs.
+    """
     if not module_path.exists():
         return []
 
+    stat = module_path.stat()
+    path_digest = hashlib.blake2b(str(module_path.resolve()).encode(), digest_size=6).hexdigest()
+    cache_prefix = f"{module_path.stem}.{path_digest}."
+    cache_path = AST_CACHE_DIR / (
+        f"{cache_prefix}{stat.st_mtime_ns}.{stat.st_size}.v{AST_CACHE_VERSION}.json"
+    )
+    try:
+        with cache_path.open("rb") as f:
+            return [
+                FunctionInfo(sys.intern(name), module_path.stem, line_number, docstring, is_public)
+                for name, line_number, docstring, is_public in json.load(f)
+            ]
+    except (OSError, TypeError, ValueError):
+        pass  # Cache miss: parse below
+
+    functions = _parse_functions(module_path)
+
+    try:
+        AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in AST_CACHE_DIR.glob(f"{cache_prefix}*.json"):
+            stale.unlink(missing_ok=True)
+        with cache_path.open("w") as f:
+            # Plain JSON rows: safe to load and independent of how this script was imported
+            json.dump(
+                [(fn.name, fn.line_number, fn.docstring, fn.is_public) for fn in functions], f
+            )
+    except OSError:
+        pass  # Unwritable cache directory: just skip caching
+
+    return functions
+
+
+def _parse_functions(module_path: Path) -> list[FunctionInfo]:
+    """Parse a module and collect its top-level functions and methods."""
     try:
         source = module_path.read_text()
-        tree = ast.parse(source)
+        tree = ast.parse(source, feature_version=sys.version_info[:2])
     except SyntaxError:
         return []
 
-    functions = []
-    for node in ast.walk(tree):
+    # Only module-level functions and methods one class deep are auditable;
+    # walking tree.body avoids descending into every expression subtree.
+    candidates = []
+    for node in tree.body:
         if isinstance(node, ast.FunctionDef):
-            is_public = not node.name.startswith("_")
-            docstring = ast.get_docstring(node)
-
-            functions.append(FunctionInfo(
-                name=node.name,
-                module=module_path.stem,
-                line_number=node.lineno,
-                docstring=docstring,
-                is_public=is_public,
-            ))
+            candidates.append(node)
+        elif isinstance(node, ast.ClassDef):
+            candidates.extend(n for n in node.body if isinstance(n, ast.FunctionDef))
+
+    functions = []
+    for node in candidates:
+        is_public = not node.name.startswith("_")
+        docstring = ast.get_docstring(node)
+
+        functions.append(FunctionInfo(
+            # Interned so classification lookups can short-circuit on identity
+            name=sys.intern(node.name),
+            module=module_path.stem,
+            line_number=node.lineno,
+            docstring=docstring,
+            is_public=is_public,
+        ))
 
     return functions
 
 
-def discover_code(src_dir: Path) -> list[FunctionInfo]:
-    """Discover all functions in the codebase."""
-    all_functions = []
+# Top-level `class`/`def` lines, and indented `def` lines (methods or nested)
+_DEF_LINE_PATTERN = re.compile(
+    rb"^(?:(?P<kind>class|def)[ \t]+(?P<top>[A-Za-z_]\w*)"
+    rb"|(?P<indent>[ \t]+)def[ \t]+(?P<inner>[A-Za-z_]\w*))",
+    re.MULTILINE,
+)
+
+
+def extract_functions_fast(module_path: Path) -> list[FunctionInfo]:
+    """
+    Extract functions by scanning the module's bytes, without parsing.
+
+    Finds the same top-level functions and one-level class methods as
+    extract_functions, but leaves docstrings empty. Use it when docstrings
+    are not needed (no semantic classification).
+    """
+    if not module_path.exists():
+        return []
+
+    functions = []
+    with module_path.open("rb") as f:
+        if module_path.stat().st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            in_class = False
+            method_indent = None
+            line_number = 1
+            last_pos = 0
+            for match in _DEF_LINE_PATTERN.finditer(mm):
+                line_number += mm[last_pos:match.start()].count(b"\n")
+                last_pos = match.start()
+
+                if match.group("kind"):
+                    in_class = match.group("kind") == b"class"
+                    method_indent = None
+                    if in_class:
+                        continue
+                    name = match.group("top")
+                else:
+                    # Only the first indentation level inside a class body
+                    indent = match.group("indent")
+                    if not in_class:
+                        continue
+                    if method_indent is None:
+                        method_indent = indent
+                    elif indent != method_indent:
+                        continue
+                    name = match.group("inner")
+
+                decoded = sys.intern(name.decode())
+                functions.append(FunctionInfo(
+                    name=decoded,
+                    module=module_path.stem,
+                    line_number=line_number,
+                    docstring=None,
+                    is_public=not decoded.startswith("_"),
+                ))
+
+    return functions
+
+
+def discover_code(src_dir: Path, docstrings: bool = True) -> list[FunctionInfo]:
+    """
+    Discover all functions in the codebase.
+
+    With docstrings=False, modules are byte-scanned instead of parsed.
+    """
+    paths = [src_dir / module_name for module_name in MODULES_TO_AUDIT]
+
+    if not docstrings:
+        return [fn for path in paths for fn in extract_functions_fast(path)]
 
-    for module_name in MODULES_TO_AUDIT:
-        module_path = src_dir / module_name
-        functions = extract_functions(module_path)
+    # AST parsing is CPU-bound and holds the GIL, so fan out across
+    # processes; for a couple of files the fork cost outweighs the win.
+    if len(paths) <= 2:
+        per_module = [extract_functions(path) for path in paths]
+    else:
+        with ProcessPoolExecutor() as executor:
+            per_module = list(executor.map(extract_functions, paths))
+
+    all_functions = []
+    for functions in per_module:
         all_functions.extend(functions)
 
     return all_functions
@@ -215,52 +394,46 @@ def query_entities(db_path: Path) -> tuple[list[EntityInfo], list[EntityInfo], l
         return behaviors, primitives, tools
 
     conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-
-    # Query behaviors
-    cur = conn.execute("SELECT id, type, data_json FROM entities WHERE type = 'behavior'")
-    for row in cur.fetchall():
-        data = json.loads(row["data_json"])
-        behaviors.append(EntityInfo(
-            id=row["id"],
-            type=row["type"],
-            title=data.get("title"),
-        ))
-
-    # Query primitives
-    cur = conn.execute("SELECT id, type, data_json FROM entities WHERE type = 'primitive'")
-    for row in cur.fetchall():
-        data = json.loads(row["data_json"])
-        primitives.append(EntityInfo(
-            id=row["id"],
-            type=row["type"],
-            title=data.get("title"),
-            python_ref=data.get("python_ref"),
-        ))
-
-    # Query tools (excluding deprecated and internal)
-    cur = conn.execute("""
-        SELECT id, type, data_json FROM entities
-        WHERE type = 'tool'
-        AND COALESCE(json_extract(data_json, '$.status'), 'active') != 'deprecated'
-        AND COALESCE(json_extract(data_json, '$.internal'), json('false')) != json('true')
-    """)
-    for row in cur.fetchall():
-        data = json.loads(row["data_json"])
-        tools.append(EntityInfo(
-            id=row["id"],
-            type=row["type"],
-            title=data.get("title"),
-            python_ref=data.get("handler"),
-        ))
 
-    # Query behaviors with implements bonds (behaviors wired to tools)
+    # One scan over the type index; tools exclude deprecated and internal.
+    # Only the needed fields are projected, so rows never hit json.loads.
+    # Plain tuples (no row_factory), unpacked in SELECT column order.
     cur = conn.execute("""
-        SELECT b.from_id as behavior_id, b.to_id as tool_id
-        FROM bonds b
-        WHERE b.type = 'implements'
+        SELECT
+            id,
+            type,
+            json_extract(data_json, '$.title') AS title,
+            json_extract(data_json, '$.python_ref') AS python_ref,
+            json_extract(data_json, '$.handler') AS handler
+        FROM entities
+        WHERE type IN ('behavior', 'primitive')
+        OR (
+            type = 'tool'
+            AND COALESCE(json_extract(data_json, '$.status'), 'active') != 'deprecated'
+            AND COALESCE(json_extract(data_json, '$.internal'), json('false')) != json('true')
+        )
     """)
-    implements_bonds = {row["behavior_id"]: row["tool_id"] for row in cur.fetchall()}
+    for entity_id, entity_type, title, python_ref, handler in cur:
+        if entity_type == "behavior":
+            behaviors.append(EntityInfo(
+                id=entity_id,
+                type=entity_type,
+                title=title,
+            ))
+        elif entity_type == "primitive":
+            primitives.append(EntityInfo(
+                id=entity_id,
+                type=entity_type,
+                title=title,
+                python_ref=python_ref,
+            ))
+        else:
+            tools.append(EntityInfo(
+                id=entity_id,
+                type=entity_type,
+                title=title,
+                python_ref=handler,
+            ))
 
     conn.close()
 
@@ -275,15 +448,14 @@ def query_bonds(db_path: Path) -> dict[str, list[str]]:
         return bonds
 
     conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
 
     cur = conn.execute("""
         SELECT from_id, to_id FROM bonds WHERE type = 'implements'
     """)
-    for row in cur.fetchall():
-        if row["from_id"] not in bonds:
-            bonds[row["from_id"]] = []
-        bonds[row["from_id"]].append(row["to_id"])
+    for from_id, to_id in cur:
+        if from_id not in bonds:
+            bonds[from_id] = []
+        bonds[from_id].append(to_id)
 
     conn.close()
     return bonds
@@ -293,6 +465,64 @@ def query_bonds(db_path: Path) -> dict[str, list[str]]:
 # Semantic Classification (Tiered Resolution)
 # =============================================================================
 
+# Semantic tier: resolve chora-cvm/chora-inference from the workspace once,
+# at import, rather than mutating sys.path on every classification call
+_WORKSPACE = Path(__file__).parent.parent.parent.parent
+for _package in ("chora-cvm", "chora-inference"):
+    _package_src = str(_WORKSPACE / "packages" / _package / "src")
+    if _package_src not in sys.path:
+        sys.path.insert(0, _package_src)
+
+try:
+    from chora_cvm.semantic import semantic_search_batch
+    _SEMANTIC_OK = True
+except ImportError:
+    _SEMANTIC_OK = False
+
+# Re-running the audit re-embeds identical queries; cache results on disk
+SEMANTIC_CACHE_PATH = CACHE_DIR / "audit_semantic.sqlite"
+
+
+def open_semantic_cache(cache_path: Path = SEMANTIC_CACHE_PATH) -> sqlite3.Connection | None:
+    """Open (creating if needed) the semantic result cache, or None if unavailable."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_path))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, results_json TEXT NOT NULL)"
+        )
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def embeddings_signature(db_path: Path) -> str | None:
+    """
+    Summarize the Loom's embeddings table (row count, max rowid, latest update).
+
+    Mirrors the signature load_corpus_matrix uses, so cached results go stale
+    as soon as embeddings are added, removed or re-computed. None if the
+    table cannot be read.
+    """
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*), MAX(rowid), MAX(updated_at) FROM embeddings"
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return json.dumps(list(row))
+
+
+def semantic_cache_key(db_path: Path, signature: str, query: str) -> bytes:
+    """Key a cached search by the Loom, the state of its embeddings and the query text."""
+    return hashlib.blake2b(
+        f"{db_path.resolve()}|{signature}|{query}".encode(), digest_size=16
+    ).digest()
+
 
 def semantic_classify_functions(
     unclassified: list[FunctionInfo],
@@ -305,32 +535,61 @@ def semantic_classify_functions(
     Returns tuple of (suggestions, method) where method is "semantic" or "fallback".
     Gracefully degrades when chora-inference is unavailable.
     """
+    if not _SEMANTIC_OK:
+        # Graceful degradation - semantic classification unavailable
+        return [], "fallback"
+
     suggestions = []
 
     try:
-        # Try semantic tier
-        import sys
-        from pathlib import Path as P
-        workspace = P(__file__).parent.parent.parent.parent
-        sys.path.insert(0, str(workspace / "packages" / "chora-cvm" / "src"))
-        sys.path.insert(0, str(workspace / "packages" / "chora-inference" / "src"))
-
-        from chora_cvm.semantic import semantic_search
-
-        for func in unclassified[:20]:  # Limit to avoid excessive API calls
+        candidates = unclassified[:20]  # Limit to avoid excessive API calls
+        queries = []
+        for func in candidates:
             # Build query from function name + docstring
             query_parts = [func.name.replace("_", " ")]
             if func.docstring:
                 query_parts.append(func.docstring[:100])
-            query = " ".join(query_parts)
-
-            # Search for matching entities
-            result = semantic_search(str(db_path), query, limit=3)
-
-            if result.get("method") != "semantic":
-                continue
-
-            for match in result.get("results", []):
+            queries.append(" ".join(query_parts))
+
+        # Serve repeat queries from the on-disk cache, keyed on the current
+        # embeddings so changes to the Loom invalidate earlier results
+        signature = embeddings_signature(db_path)
+        cache = None
+        keys: list[bytes] = []
+        if signature is not None:
+            cache = open_semantic_cache()
+            keys = [semantic_cache_key(db_path, signature, query) for query in queries]
+        results_by_query: dict[int, list[dict[str, Any]]] = {}
+        if cache is not None:
+            for i, key in enumerate(keys):
+                cached = cache.execute(
+                    "SELECT results_json FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if cached is not None:
+                    results_by_query[i] = json.loads(cached[0])
+
+        # Embed and score every cache miss in a single batched search
+        misses = [i for i in range(len(queries)) if i not in results_by_query]
+        if misses:
+            batch = semantic_search_batch(
+                str(db_path), [queries[i] for i in misses], limit=3
+            )
+            if batch.get("method") == "semantic":
+                for i, results in zip(misses, batch["results"]):
+                    results_by_query[i] = results
+                    if cache is not None:
+                        cache.execute(
+                            "INSERT OR REPLACE INTO cache (key, results_json) VALUES (?, ?)",
+                            (keys[i], json.dumps(results)),
+                        )
+
+        if cache is not None:
+            # All new entries land in the one implicit transaction
+            cache.commit()
+            cache.close()
+
+        for i, func in enumerate(candidates):
+            for match in results_by_query.get(i, []):
                 similarity = match.get("similarity", 0)
                 if similarity < threshold:
                     continue
@@ -360,9 +619,6 @@ def semantic_classify_functions(
 
         return suggestions, "semantic"
 
-    except ImportError:
-        # Graceful degradation - semantic classification unavailable
-        return [], "fallback"
     except Exception:
         # Other errors - degrade gracefully
         return [], "fallback"
@@ -375,39 +631,51 @@ def semantic_classify_functions(
 
 def classify_function(func: FunctionInfo) -> str:
     """Classify a function as behavioral, primitive, or infrastructure."""
-    if func.name in BEHAVIORAL_FUNCTIONS:
-        return "behavioral"
-    elif func.name in PRIMITIVE_FUNCTIONS:
-        return "primitive"
-    elif func.name in INFRASTRUCTURE_FUNCTIONS:
-        return "infrastructure"
-    elif func.name.startswith("_"):
-        return "infrastructure"
-    else:
-        return "unclassified"
+    classification = CLASSIFICATION.get(func.name)
+    if classification is not None:
+        return classification
+    return "infrastructure" if func.name.startswith("_") else "unclassified"
 
 
-def run_audit(src_dir: Path, db_path: Path) -> AuditResult:
-    """Run the full audit."""
+def run_audit(
+    src_dir: Path,
+    db_path: Path,
+    docstrings: bool = True,
+    semantic: bool = True,
+) -> AuditResult:
+    """
+    Run the full audit.
+
+    Docstrings only feed semantic classification, so discovery skips the
+    AST parse when they are disabled or the semantic tier is unavailable.
+    semantic=False skips the suggestions pass (gaps do not depend on it).
+    """
     result = AuditResult()
 
     # Discover code
-    all_functions = discover_code(src_dir)
-    result.functions = [f for f in all_functions if f.is_public]
+    all_functions = discover_code(src_dir, docstrings=docstrings and semantic and _SEMANTIC_OK)
+    result.functions.extend(f for f in all_functions if f.is_public)
 
     # Query Loom
     behaviors, primitives, tools = query_entities(db_path)
-    result.behaviors = behaviors
-    result.primitives = primitives
-    result.tools = tools
+    result.behaviors.extend(behaviors)
+    result.primitives.extend(primitives)
+    result.tools.extend(tools)
 
     implements_bonds = query_bonds(db_path)
 
-    # Build lookup sets
-    primitive_refs = {p.python_ref for p in primitives if p.python_ref}
-    primitive_names = {p.python_ref.split(".")[-1] for p in primitives if p.python_ref}
-    tool_handlers = {t.python_ref for t in tools if t.python_ref}
-    tool_names = {t.python_ref.split(".")[-1] for t in tools if t.python_ref}
+    # Build lookup sets (one pass per entity list)
+    primitive_refs, primitive_names = set(), set()
+    for p in primitives:
+        if p.python_ref:
+            primitive_refs.add(p.python_ref)
+            primitive_names.add(p.python_ref.rpartition(".")[2])
+    tool_handlers, tool_names = set(), set()
+    for t in tools:
+        if t.python_ref:
+            tool_handlers.add(t.python_ref)
+            tool_names.add(t.python_ref.rpartition(".")[2])
+    tool_ids = {t.id for t in tools}
 
     # Classify functions and find gaps
     for func in all_functions:
@@ -422,7 +690,7 @@ def run_audit(src_dir: Path, db_path: Path) -> AuditResult:
             # Check if this function maps to a canonical tool with different name
             if not has_tool and func.name in FUNCTION_TO_TOOL:
                 canonical_tool = FUNCTION_TO_TOOL[func.name]
-                has_tool = any(t.id == canonical_tool for t in tools)
+                has_tool = canonical_tool in tool_ids
 
             if not has_tool:
                 result.behavioral_gaps.append(func)
@@ -448,9 +716,9 @@ def run_audit(src_dir: Path, db_path: Path) -> AuditResult:
             result.tool_gaps.append(behavior)
 
     # Semantic classification of unclassified functions
-    if result.unclassified:
+    if semantic and result.unclassified:
         suggestions, method = semantic_classify_functions(result.unclassified, db_path)
-        result.semantic_suggestions = suggestions
+        result.semantic_suggestions.extend(suggestions)
         result.semantic_method = method
 
     return result
@@ -462,98 +730,136 @@ def run_audit(src_dir: Path, db_path: Path) -> AuditResult:
 
 
 def print_report(result: AuditResult, verbose: bool = False) -> None:
-    """Print the audit report."""
+    """Print the audit report (buffered, written to stdout in one call)."""
+    out: list[str] = []
+    emit = out.append
     total_functions = len(result.functions)
-    behavioral_count = len(BEHAVIORAL_FUNCTIONS)
-    primitive_count = len(PRIMITIVE_FUNCTIONS)
+    behavioral_count = _N_BEHAVIORAL
+    primitive_count = _N_PRIMITIVE
     infra_count = len(result.infrastructure)
 
-    print()
-    print("Code Coverage Audit")
-    print("=" * 60)
-    print()
+    emit("")
+    emit("Code Coverage Audit")
+    emit("=" * 60)
+    emit("")
 
     # Summary
-    print("Summary")
-    print("-" * 40)
-    print(f"  Total public functions discovered: {total_functions}")
-    print(f"  Behavioral functions: {behavioral_count}")
-    print(f"  Primitive functions: {primitive_count}")
-    print(f"  Infrastructure functions: {infra_count}")
-    print(f"  Unclassified: {len(result.unclassified)}")
-    print()
+    emit("Summary")
+    emit("-" * 40)
+    emit(f"  Total public functions discovered: {total_functions}")
+    emit(f"  Behavioral functions: {behavioral_count}")
+    emit(f"  Primitive functions: {primitive_count}")
+    emit(f"  Infrastructure functions: {infra_count}")
+    emit(f"  Unclassified: {len(result.unclassified)}")
+    emit("")
 
     # Entity counts
-    print("Loom Entities")
-    print("-" * 40)
-    print(f"  Behavior entities: {len(result.behaviors)}")
-    print(f"  Primitive entities: {len(result.primitives)}")
-    print(f"  Tool entities: {len(result.tools)}")
-    print()
+    emit("Loom Entities")
+    emit("-" * 40)
+    emit(f"  Behavior entities: {len(result.behaviors)}")
+    emit(f"  Primitive entities: {len(result.primitives)}")
+    emit(f"  Tool entities: {len(result.tools)}")
+    emit("")
 
     # Gaps
-    print("Gaps Detected")
-    print("-" * 40)
+    emit("Gaps Detected")
+    emit("-" * 40)
 
     if result.behavioral_gaps:
-        print(f"\n  Behavioral gaps (missing tool entities): {len(result.behavioral_gaps)}")
+        emit(f"\n  Behavioral gaps (missing tool entities): {len(result.behavioral_gaps)}")
         for func in result.behavioral_gaps:
-            print(f"    - {func.name} ({func.module}.py:{func.line_number})")
+            emit(f"    - {func.name} ({func.module}.py:{func.line_number})")
 
     if result.primitive_gaps:
-        print(f"\n  Primitive gaps (missing primitive entities): {len(result.primitive_gaps)}")
+        emit(f"\n  Primitive gaps (missing primitive entities): {len(result.primitive_gaps)}")
         for func in result.primitive_gaps:
-            print(f"    - {func.name} ({func.module}.py:{func.line_number})")
+            emit(f"    - {func.name} ({func.module}.py:{func.line_number})")
 
     if result.tool_gaps:
-        print(f"\n  Behaviors without tool wiring: {len(result.tool_gaps)}")
+        emit(f"\n  Behaviors without tool wiring: {len(result.tool_gaps)}")
         for behavior in result.tool_gaps:
-            print(f"    - {behavior.id}")
+            emit(f"    - {behavior.id}")
 
     if not (result.behavioral_gaps or result.primitive_gaps or result.tool_gaps):
-        print("  No gaps detected!")
+        emit("  No gaps detected!")
 
-    print()
+    emit("")
 
     # Semantic suggestions for unclassified functions
     if result.semantic_suggestions:
-        print("Semantic Classification Suggestions")
-        print("-" * 40)
-        print(f"  Method: {result.semantic_method}")
-        print()
+        emit("Semantic Classification Suggestions")
+        emit("-" * 40)
+        emit(f"  Method: {result.semantic_method}")
+        emit("")
         for suggestion in result.semantic_suggestions:
             sim_pct = f"{suggestion.similarity:.0%}"
-            print(f"  {suggestion.func.name} -> {suggestion.suggested_type} ({sim_pct})")
-            print(f"    {suggestion.reasoning}")
-        print()
+            emit(f"  {suggestion.func.name} -> {suggestion.suggested_type} ({sim_pct})")
+            emit(f"    {suggestion.reasoning}")
+        emit("")
     elif result.semantic_method == "fallback" and result.unclassified:
-        print("Semantic Classification")
-        print("-" * 40)
-        print("  (chora-inference unavailable - using fallback)")
-        print()
+        emit("Semantic Classification")
+        emit("-" * 40)
+        emit("  (chora-inference unavailable - using fallback)")
+        emit("")
 
     # Unclassified (if verbose)
     if verbose and result.unclassified:
-        print("Unclassified Functions (need manual review)")
-        print("-" * 40)
+        emit("Unclassified Functions (need manual review)")
+        emit("-" * 40)
         for func in result.unclassified:
-            print(f"  - {func.name} ({func.module}.py:{func.line_number})")
-        print()
+            emit(f"  - {func.name} ({func.module}.py:{func.line_number})")
+        emit("")
 
     # Coverage calculation
-    total_behavioral = len(BEHAVIORAL_FUNCTIONS)
+    total_behavioral = _N_BEHAVIORAL
     covered_behavioral = total_behavioral - len(result.behavioral_gaps)
     behavioral_coverage = (covered_behavioral / total_behavioral * 100) if total_behavioral else 0
 
-    total_primitives = len(PRIMITIVE_FUNCTIONS)
+    total_primitives = _N_PRIMITIVE
     covered_primitives = total_primitives - len(result.primitive_gaps)
     primitive_coverage = (covered_primitives / total_primitives * 100) if total_primitives else 0
 
-    print("Coverage")
-    print("-" * 40)
-    print(f"  Behavioral code -> tool entities: {covered_behavioral}/{total_behavioral} ({behavioral_coverage:.0f}%)")
-    print(f"  Primitive code -> primitive entities: {covered_primitives}/{total_primitives} ({primitive_coverage:.0f}%)")
-    print()
+    emit("Coverage")
+    emit("-" * 40)
+    emit(f"  Behavioral code -> tool entities: {covered_behavioral}/{total_behavioral} ({behavioral_coverage:.0f}%)")
+    emit(f"  Primitive code -> primitive entities: {covered_primitives}/{total_primitives} ({primitive_coverage:.0f}%)")
+    emit("")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def emit_json(result: AuditResult) -> bytes:
+    """
+    Serialize the audit result for machine consumers (CI log collectors).
+
+    Uses orjson when installed (it serializes the dataclasses natively),
+    falling back to the stdlib json module with the same output shape.
+    """
+    payload = {
+        "summary": {
+            "functions": len(result.functions),
+            "behavioral": _N_BEHAVIORAL,
+            "primitive": _N_PRIMITIVE,
+            "infrastructure": len(result.infrastructure),
+            "unclassified": len(result.unclassified),
+            "behavioral_covered": _N_BEHAVIORAL - len(result.behavioral_gaps),
+            "primitive_covered": _N_PRIMITIVE - len(result.primitive_gaps),
+        },
+        "entities": {
+            "behaviors": len(result.behaviors),
+            "primitives": len(result.primitives),
+            "tools": len(result.tools),
+        },
+        "behavioral_gaps": result.behavioral_gaps,
+        "primitive_gaps": result.primitive_gaps,
+        "tool_gaps": result.tool_gaps,
+        "unclassified": result.unclassified,
+        "semantic_method": result.semantic_method,
+        "semantic_suggestions": result.semantic_suggestions,
+    }
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, default=asdict).encode()
 
 
 def check_mode(result: AuditResult) -> int:
@@ -589,6 +895,16 @@ def main():
         action="store_true",
         help="Exit with code 1 if gaps found (for CI)",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit the audit result as JSON instead of the text report",
+    )
+    parser.add_argument(
+        "--no-docstrings",
+        action="store_true",
+        help="Skip docstring extraction (fast byte scan; weaker semantic suggestions)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -602,19 +918,28 @@ def main():
     db_path = args.db if args.db.is_absolute() else workspace / args.db
     src_dir = args.src if args.src.is_absolute() else workspace / args.src
 
-    # Run audit
-    result = run_audit(src_dir, db_path)
-
-    # Report
-    print_report(result, verbose=args.verbose)
-
-    # Check mode
+    # Check mode: only the gaps decide the exit code, so skip the semantic
+    # pass; the report is printed only when the check fails, so CI logs
+    # still say what is missing
     if args.check:
+        result = run_audit(src_dir, db_path, docstrings=False, semantic=False)
         exit_code = check_mode(result)
         if exit_code:
+            print_report(result, verbose=args.verbose)
             print("Gaps detected. Run without --check for details.")
+        result.release()
         sys.exit(exit_code)
 
+    # Run audit
+    result = run_audit(src_dir, db_path, docstrings=not args.no_docstrings)
+
+    # Report
+    if args.json:
+        sys.stdout.buffer.write(emit_json(result) + b"\n")
+    else:
+        print_report(result, verbose=args.verbose)
+    result.release()
+
 
 if __name__ == "__main__":
     main()
@@ -10,15 +10,141 @@ Checks:
 5. Documentation coverage across the hierarchy
 
 Usage:
-    python3 packages/chora-cvm/scripts/audit_docs.py [--verbose]
+    python3 packages/chora-cvm/scripts/audit_docs.py [--verbose] [--no-cache]
 """
 
 import argparse
+import hashlib
+import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: cache writes go unlocked
+    fcntl = None
+
+# On-disk scan cache: per-doc regex results survive between runs
+CACHE_PATH = Path.home() / ".cache" / "chora" / "audit_docs.json"
+CACHE_VERSION = 3
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 2000
+
+
+@lru_cache(maxsize=512)
+def _read_text_cached(path: str, key: tuple) -> str:
+    """Decode a file once per (mtime_ns, size) stat key."""
+    return Path(path).read_text()
+
+
+def read_text(path: Path) -> str:
+    """Read a doc, reusing the decoded text if the file is unchanged."""
+    st = path.stat()
+    return _read_text_cached(str(path), (st.st_mtime_ns, st.st_size))
+
+
+class ScanCache:
+    """
+    Persistent cache of per-document scan results.
+
+    Entries are keyed by (scan kind, path) and validated by (mtime_ns, size);
+    when the stat key changes but the BLAKE2 content hash does not (a touch
+    without an edit) the entry is revalidated instead of rescanned. Entries
+    expire after CACHE_TTL_SECONDS and the oldest are evicted past
+    CACHE_MAX_ENTRIES.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self.path = path
+        self.entries = self._load()
+        self.dirty = False
+
+    def _load(self) -> Dict[tuple, tuple]:
+        # Stored as JSON rows [kind, path, mtime_ns, size, digest, result, ts];
+        # scan results are plain strings, lists and bools
+        try:
+            with self.path.open("rb") as f:
+                payload = json.load(f)
+            if payload.get("version") != CACHE_VERSION:
+                return {}
+            return {
+                (kind, path): ((mtime_ns, size), digest, result, ts)
+                for kind, path, mtime_ns, size, digest, result, ts in payload["entries"]
+            }
+        except Exception:
+            return {}
+
+    def scan(self, path: Path, kind: str, scanner: Callable[[str], Any]) -> Any:
+        """Return scanner(text of path), reusing a still-valid cached result."""
+        st = path.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        key = (kind, str(path))
+        now = time.time()
+
+        entry = self.entries.get(key)
+        if entry is not None and now - entry[3] < CACHE_TTL_SECONDS:
+            if entry[0] == stat_key:
+                return entry[2]
+            content = read_text(path)
+            digest = _content_hash(content)
+            if digest == entry[1]:
+                self.entries[key] = (stat_key, digest, entry[2], entry[3])
+                self.dirty = True
+                return entry[2]
+        else:
+            content = read_text(path)
+            digest = _content_hash(content)
+
+        result = scanner(content)
+        self.entries[key] = (stat_key, digest, result, now)
+        self.dirty = True
+        return result
+
+    def save(self) -> None:
+        """Merge with the on-disk cache under a lock and write it back."""
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(f"{self.path}.lock", "w") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                entries = self._load()
+                entries.update(self.entries)
+                if len(entries) > CACHE_MAX_ENTRIES:
+                    newest = sorted(entries.items(), key=lambda kv: kv[1][3])
+                    entries = dict(newest[-CACHE_MAX_ENTRIES:])
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                rows = [
+                    [kind, path, stat_key[0], stat_key[1], digest, result, ts]
+                    for (kind, path), (stat_key, digest, result, ts) in entries.items()
+                ]
+                with tmp_path.open("w") as f:
+                    json.dump({"version": CACHE_VERSION, "entries": rows}, f)
+                os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # A read-only home just means no cache
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+# Set by main(); None means every scan reads and parses the doc
+_scan_cache: "ScanCache | None" = None
+
+
+def scan_doc(path: Path, kind: str, scanner: Callable[[str], Any]) -> Any:
+    """Run scanner over a doc's text, through the scan cache when enabled."""
+    if _scan_cache is None:
+        return scanner(read_text(path))
+    return _scan_cache.scan(path, kind, scanner)
 
 
 def find_packages(root: Path) -> List[Path]:
@@ -27,67 +153,151 @@ def find_packages(root: Path) -> List[Path]:
     if not packages_dir.exists():
         return []
 
-    packages = []
-    for item in packages_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
+    # DirEntry.is_dir() is answered from readdir for non-symlinks; Path.is_dir()
+    # would stat every child
+    with os.scandir(packages_dir) as it:
+        names = [
+            entry.name for entry in it
+            if entry.is_dir() and not entry.name.startswith('.')
             # Skip old/archived workspaces for primary audit
-            if "old" not in item.name.lower():
-                packages.append(item)
-    return sorted(packages)
+            and "old" not in entry.name.lower()
+        ]
+    return [packages_dir / name for name in sorted(names)]
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """One stat() answering both "exists?" and "how big?"."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+# Heavy trees left out of the path snapshot; refs into them fall back to stat
+_SNAPSHOT_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv"})
 
 
-def check_claude_md(package: Path) -> Dict[str, Any]:
+def snapshot_paths(root: Path) -> Set[str]:
+    """Collect every file and directory under root as a root-relative path."""
+    known = set()
+    prefix_len = len(str(root)) + 1
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SNAPSHOT_SKIP_DIRS]
+        rel_dir = dirpath[prefix_len:]
+        for name in dirnames + filenames:
+            known.add(f"{rel_dir}/{name}" if rel_dir else name)
+    return known
+
+
+def check_claude_md(package: Path, known_paths: Optional[Set[str]] = None) -> Dict[str, Any]:
     """Check CLAUDE.md status for a package."""
     claude_path = package / "CLAUDE.md"
     agents_path = package / "AGENTS.md"
 
+    claude_st = _stat_or_none(claude_path)
+    agents_st = _stat_or_none(agents_path)
+
     result = {
         "name": package.name,
-        "has_claude_md": claude_path.exists(),
-        "has_agents_md": agents_path.exists(),
-        "claude_size": 0,
-        "agents_size": 0,
+        "has_claude_md": claude_st is not None,
+        "has_agents_md": agents_st is not None,
+        "claude_size": claude_st.st_size if claude_st else 0,
+        "agents_size": agents_st.st_size if agents_st else 0,
         "stale_refs": [],
     }
 
-    if claude_path.exists():
-        result["claude_size"] = claude_path.stat().st_size
-        result["stale_refs"] = check_stale_refs(claude_path, package)
-
-    if agents_path.exists():
-        result["agents_size"] = agents_path.stat().st_size
+    if claude_st is not None:
+        result["stale_refs"] = check_stale_refs(claude_path, package, known_paths)
 
     return result
 
 
-def check_stale_refs(doc_path: Path, package: Path) -> List[str]:
-    """Find references to paths that don't exist."""
-    stale = []
-    try:
-        content = doc_path.read_text()
+# Path-like references in backticks: files with a known extension, or
+# packages/... and src/... directories. One alternation, one pass.
+_STALE_REF_RE = re.compile(
+    r"`([a-zA-Z0-9_/.-]+\.(?:py|md|yaml|json|ts|js)"
+    r"|packages/[a-zA-Z0-9_/-]+"
+    r"|src/[a-zA-Z0-9_/-]+)`"
+)
+
+
+def find_path_refs(content: str) -> List[str]:
+    """Extract path-like references from a doc's text, in document order."""
+    # A single capture group makes findall return the strings directly,
+    # without a Match object per hit
+    return _STALE_REF_RE.findall(content)
 
-        # Find path-like references (backticks or quotes around paths)
-        path_patterns = [
-            r'`([a-zA-Z0-9_/.-]+\.(py|md|yaml|json|ts|js))`',
-            r'`(packages/[a-zA-Z0-9_/-]+)`',
-            r'`(src/[a-zA-Z0-9_/-]+)`',
-        ]
 
-        for pattern in path_patterns:
-            for match in re.finditer(pattern, content):
-                ref_path = match.group(1)
-                # Check relative to package or workspace root
-                full_path = package / ref_path
-                root_path = package.parent.parent / ref_path
+def check_stale_refs(
+    doc_path: Path,
+    package: Path,
+    known_paths: Optional[Set[str]] = None,
+) -> List[str]:
+    """
+    Find references to paths that don't exist.
 
-                if not full_path.exists() and not root_path.exists():
-                    stale.append(ref_path)
+    With a known_paths snapshot (see snapshot_paths), refs found in it skip
+    the filesystem; only misses are confirmed with stat.
+    """
+    stale = []
+    package_rel = f"packages/{package.name}"
+    try:
+        # The scan is cacheable; existence is re-checked every run
+        for ref_path in scan_doc(doc_path, "path_refs", find_path_refs):
+            if known_paths is not None:
+                normalized = os.path.normpath(ref_path)
+                if normalized in known_paths or f"{package_rel}/{normalized}" in known_paths:
+                    continue
+
+            # Check relative to package or workspace root
+            full_path = package / ref_path
+            root_path = package.parent.parent / ref_path
+
+            if not full_path.exists() and not root_path.exists():
+                stale.append(ref_path)
     except Exception:
         pass
 
     return stale
 
 
+def _walk_files(directory: str, rel_dir: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (root-relative path, entry) for files under directory.
+
+    DirEntry caches type and stat from readdir, and relative paths are
+    built by joining names, so no Path objects are created while walking.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, os.path.join(rel_dir, entry.name))
+            elif entry.is_file():
+                yield os.path.join(rel_dir, entry.name), entry
+
+
+_RESEARCH_SUFFIXES = ('.md', '.txt', '.yaml')
+
+# Path keyword -> research type, in precedence order (earlier wins)
+_RESEARCH_TYPES = {
+    "inquiry": "inquiry",
+    "brief": "brief",
+    "ar-": "architecture-research",
+    "synthesis": "synthesis",
+    "response": "synthesis",
+}
+_RESEARCH_PRECEDENCE = {keyword: rank for rank, keyword in enumerate(_RESEARCH_TYPES)}
+_RESEARCH_TYPE_RE = re.compile("|".join(re.escape(keyword) for keyword in _RESEARCH_TYPES))
+
+
+def classify_research(path_lower: str) -> str:
+    """Map a lowercased path to its research type in one regex pass."""
+    keywords = _RESEARCH_TYPE_RE.findall(path_lower)
+    if not keywords:
+        return "general"
+    return _RESEARCH_TYPES[min(keywords, key=_RESEARCH_PRECEDENCE.__getitem__)]
+
+
 def find_research_docs(root: Path) -> List[Dict[str, Any]]:
     """Find research documents that might want integration."""
     research_dir = root / "docs" / "research"
@@ -95,32 +305,80 @@ def find_research_docs(root: Path) -> List[Dict[str, Any]]:
         return []
 
     docs = []
-    for item in research_dir.rglob("*"):
-        if item.is_file() and item.suffix in ('.md', '.txt', '.yaml'):
-            rel_path = item.relative_to(root)
-            size = item.stat().st_size
+    for rel_path, entry in _walk_files(str(research_dir), os.path.join("docs", "research")):
+        name = entry.name
+        # rfind > 0 keeps Path.suffix semantics: a bare ".md" has no suffix
+        dot = name.rfind(".")
+        if dot > 0 and name.endswith(_RESEARCH_SUFFIXES):
+            suffix = name[dot:]
+            size = entry.stat().st_size
 
             # Detect research type from path/name
-            research_type = "general"
-            path_str = str(rel_path).lower()
-            if "inquiry" in path_str:
-                research_type = "inquiry"
-            elif "brief" in path_str:
-                research_type = "brief"
-            elif "ar-" in path_str:
-                research_type = "architecture-research"
-            elif "synthesis" in path_str or "response" in path_str:
-                research_type = "synthesis"
+            research_type = classify_research(rel_path.lower())
 
             docs.append({
-                "path": str(rel_path),
-                "name": item.name,
+                "path": rel_path,
+                "name": name,
                 "size": size,
-                "type": item.suffix,
+                "type": suffix,
                 "research_type": research_type,
             })
 
-    return sorted(docs, key=lambda x: x["size"], reverse=True)
+    # Largest first; path breaks ties so the listing is stable across filesystems
+    return sorted(docs, key=lambda x: (-x["size"], x["path"]))
+
+
+# Outdated noun counts: (exact spelling, lowercase spelled-out form)
+_STALE_NOUN_PATTERNS = (
+    ("7 Nouns", "seven nouns"),
+    ("8 Nouns", "eight nouns"),  # Also outdated
+)
+_STALE_NOUN_EXACT = tuple(exact for exact, _ in _STALE_NOUN_PATTERNS)
+_STALE_NOUN_FOLDED = tuple(lower for _, lower in _STALE_NOUN_PATTERNS)
+
+
+def _has_stale_nouns(content: str) -> bool:
+    return "7 Nouns" in content or "(7 Nouns)" in content
+
+
+def _has_outcome(content: str) -> bool:
+    lowered = content.lower()
+    return "outcome" in lowered or "decision" in lowered
+
+
+def find_mentions(content: str, exact: Iterable[str] = (), folded: Iterable[str] = ()) -> Set[str]:
+    """
+    Return which needles occur in content, using a single regex pass.
+
+    `exact` needles match case-sensitively; `folded` needles are lowercase
+    and match as if against content.lower(). Every needle is tried at every
+    position (lookahead), longest first; a needle shadowed by a longer hit
+    at the same position is recovered from the matched text.
+    """
+    needles = [(needle, False) for needle in exact] + [(needle, True) for needle in folded]
+    found = {needle for needle, _ in needles if not needle}
+    needles = sorted((n for n in needles if n[0]), key=lambda n: -len(n[0]))
+    if not needles or not content:
+        return found
+
+    pattern = re.compile("(?=(?:" + "|".join(
+        f"((?i:{re.escape(needle)}))" if is_folded else f"({re.escape(needle)})"
+        for needle, is_folded in needles
+    ) + "))")
+
+    segments = set()
+    for match in pattern.finditer(content):
+        found.add(needles[match.lastindex - 1][0])
+        segments.add(match.group(match.lastindex))
+
+    # Lowercase each matched segment once, not once per needle
+    folded_segments = [segment.lower() for segment in segments]
+    for needle, is_folded in needles:
+        if needle not in found and any(
+            needle in segment for segment in (folded_segments if is_folded else segments)
+        ):
+            found.add(needle)
+    return found
 
 
 def detect_evolution_signals(root: Path) -> List[Dict[str, Any]]:
@@ -134,19 +392,34 @@ def detect_evolution_signals(root: Path) -> List[Dict[str, Any]]:
     agents_path = root / "AGENTS.md"
 
     if claude_path.exists():
-        claude_content = claude_path.read_text()
+        claude_content = read_text(claude_path)
     if agents_path.exists():
-        agents_content = agents_path.read_text()
+        agents_content = read_text(agents_path)
 
-    # 1. Check for outdated noun counts anywhere
-    stale_noun_patterns = [
-        ("7 Nouns", "seven nouns"),
-        ("8 Nouns", "eight nouns"),  # Also outdated
-    ]
+    research_dir = root / "docs" / "research"
+    inquiries = []
+    if research_dir.exists():
+        with os.scandir(research_dir) as it:
+            inquiries = [
+                Path(entry.path) for entry in it
+                if entry.name.startswith("inquiry-") and entry.name.endswith(".md")
+            ]
+    inquiry_names = [inq.stem.replace("inquiry-", "") for inq in inquiries]
+    # Names are matched against lowercased docs, so only lowercase ones can hit
+    searchable_names = [name for name in inquiry_names if name == name.lower()]
+
+    # One pass over each main doc finds noun counts and inquiry mentions
+    agents_hits = find_mentions(
+        agents_content,
+        exact=_STALE_NOUN_EXACT,
+        folded=_STALE_NOUN_FOLDED + tuple(searchable_names),
+    )
+    claude_hits = find_mentions(claude_content, folded=searchable_names)
 
-    for exact, lower in stale_noun_patterns:
+    # 1. Check for outdated noun counts anywhere
+    for exact, lower in _STALE_NOUN_PATTERNS:
         if agents_content:
-            if exact in agents_content or lower in agents_content.lower():
+            if exact in agents_hits or lower in agents_hits:
                 signals.append({
                     "file": "AGENTS.md",
                     "signal": f"References '{exact}' but system evolved to Decemvirate (10)",
@@ -154,12 +427,10 @@ def detect_evolution_signals(root: Path) -> List[Dict[str, Any]]:
                 })
 
     # 2. Check for unsurfaced inquiries in research
-    research_dir = root / "docs" / "research"
     if research_dir.exists():
-        for inq in research_dir.glob("inquiry-*.md"):
-            inq_name = inq.stem.replace("inquiry-", "")
+        for inq, inq_name in zip(inquiries, inquiry_names):
             # Check if mentioned anywhere in main docs
-            if inq_name not in claude_content.lower() and inq_name not in agents_content.lower():
+            if inq_name not in claude_hits and inq_name not in agents_hits:
                 signals.append({
                     "file": str(inq.relative_to(root)),
                     "signal": f"Inquiry '{inq_name}' not surfaced in main docs",
@@ -167,8 +438,7 @@ def detect_evolution_signals(root: Path) -> List[Dict[str, Any]]:
                 })
             # Also check for stale physics references within inquiry
             try:
-                content = inq.read_text()
-                if "7 Nouns" in content or "(7 Nouns)" in content:
+                if scan_doc(inq, "stale_nouns", _has_stale_nouns):
                     signals.append({
                         "file": str(inq.relative_to(root)),
                         "signal": "Contains stale '7 Nouns' reference (now Decemvirate: 10)",
@@ -180,28 +450,30 @@ def detect_evolution_signals(root: Path) -> List[Dict[str, Any]]:
     # 3. Check for briefs with README that might represent completed research
     briefs_dir = research_dir / "briefs" if research_dir.exists() else None
     if briefs_dir and briefs_dir.exists():
-        for brief_dir in briefs_dir.iterdir():
-            if brief_dir.is_dir():
-                readme = brief_dir / "README.md"
-                if readme.exists():
-                    content = readme.read_text()
-                    if "outcome" in content.lower() or "decision" in content.lower():
-                        signals.append({
-                            "file": str(readme.relative_to(root)),
-                            "signal": f"Brief '{brief_dir.name}' has outcome - may want integration",
-                            "suggestion": "Review if decisions should update main docs",
-                        })
+        with os.scandir(briefs_dir) as it:
+            brief_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+        for brief_dir in brief_dirs:
+            readme = brief_dir / "README.md"
+            if readme.exists():
+                if scan_doc(readme, "brief_outcome", _has_outcome):
+                    signals.append({
+                        "file": str(readme.relative_to(root)),
+                        "signal": f"Brief '{brief_dir.name}' has outcome - may want integration",
+                        "suggestion": "Review if decisions should update main docs",
+                    })
 
     return signals
 
 
 def check_root_docs(root: Path) -> Dict[str, Any]:
     """Check root-level documentation."""
+    claude_st = _stat_or_none(root / "CLAUDE.md")
+    agents_st = _stat_or_none(root / "AGENTS.md")
     return {
-        "claude_md": (root / "CLAUDE.md").exists(),
-        "claude_md_size": (root / "CLAUDE.md").stat().st_size if (root / "CLAUDE.md").exists() else 0,
-        "agents_md": (root / "AGENTS.md").exists(),
-        "agents_md_size": (root / "AGENTS.md").stat().st_size if (root / "AGENTS.md").exists() else 0,
+        "claude_md": claude_st is not None,
+        "claude_md_size": claude_st.st_size if claude_st else 0,
+        "agents_md": agents_st is not None,
+        "agents_md_size": agents_st.st_size if agents_st else 0,
     }
 
 
@@ -209,33 +481,47 @@ def main():
     parser = argparse.ArgumentParser(description="Audit documentation health")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed output")
     parser.add_argument("--check", action="store_true", help="Exit 1 if issues found")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every doc, ignoring the scan cache")
     args = parser.parse_args()
 
+    global _scan_cache
+    if not args.no_cache:
+        _scan_cache = ScanCache()
+
     root = Path(__file__).parent.parent.parent.parent
 
-    print("Documentation Health Audit")
-    print("=" * 60)
-    print()
+    # Buffer the report and write it to stdout once
+    out: List[str] = []
+    emit = out.append
+
+    emit("Documentation Health Audit")
+    emit("=" * 60)
+    emit("")
 
     # Root docs
     root_docs = check_root_docs(root)
-    print("Root Documentation")
-    print("-" * 40)
-    print(f"  CLAUDE.md: {'✓' if root_docs['claude_md'] else '✗'} ({root_docs['claude_md_size']:,} bytes)")
-    print(f"  AGENTS.md: {'✓' if root_docs['agents_md'] else '✗'} ({root_docs['agents_md_size']:,} bytes)")
-    print()
+    emit("Root Documentation")
+    emit("-" * 40)
+    emit(f"  CLAUDE.md: {'✓' if root_docs['claude_md'] else '✗'} ({root_docs['claude_md_size']:,} bytes)")
+    emit(f"  AGENTS.md: {'✓' if root_docs['agents_md'] else '✗'} ({root_docs['agents_md_size']:,} bytes)")
+    emit("")
 
     # Package docs
     packages = find_packages(root)
-    print(f"Package Documentation ({len(packages)} packages)")
-    print("-" * 40)
+    # One directory walk answers the stale-ref existence checks
+    known_paths = snapshot_paths(root) if packages else None
+    emit(f"Package Documentation ({len(packages)} packages)")
+    emit("-" * 40)
 
     with_claude = 0
     without_claude = []
     stale_total = 0
 
-    for pkg in packages:
-        status = check_claude_md(pkg)
+    # Package checks are independent stat/read/regex work; map keeps order
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(packages)))) as pool:
+        statuses = list(pool.map(partial(check_claude_md, known_paths=known_paths), packages))
+
+    for status in statuses:
         if status["has_claude_md"]:
             with_claude += 1
             marker = "✓"
@@ -248,58 +534,62 @@ def main():
 
         if args.verbose or not status["has_claude_md"]:
             size_str = f"({status['claude_size']:,} bytes)" if status["has_claude_md"] else ""
-            print(f"  {marker} {status['name']:<30} {size_str}")
+            emit(f"  {marker} {status['name']:<30} {size_str}")
             if args.verbose and status["stale_refs"]:
                 for ref in status["stale_refs"][:3]:
-                    print(f"      └─ stale: {ref}")
+                    emit(f"      └─ stale: {ref}")
 
-    print()
-    print(f"  Coverage: {with_claude}/{len(packages)} ({100*with_claude//len(packages)}%)")
+    emit("")
+    emit(f"  Coverage: {with_claude}/{len(packages)} ({100*with_claude//len(packages)}%)")
 
     if without_claude:
-        print(f"\n  Missing CLAUDE.md:")
+        emit(f"\n  Missing CLAUDE.md:")
         for name in without_claude:
-            print(f"    - {name}")
+            emit(f"    - {name}")
 
     if stale_total > 0:
-        print(f"\n  Stale references found: {stale_total}")
+        emit(f"\n  Stale references found: {stale_total}")
+
+    # In --check mode only issues matter: research docs never count as one,
+    # and signals cannot change the verdict once package issues are found
+    check_decided = args.check and bool(without_claude or stale_total)
 
     # Research docs
-    research = find_research_docs(root)
+    research = [] if args.check else find_research_docs(root)
     if research:
-        print()
-        print(f"Research Documents ({len(research)} files)")
-        print("-" * 40)
+        emit("")
+        emit(f"Research Documents ({len(research)} files)")
+        emit("-" * 40)
 
         total_size = sum(d["size"] for d in research)
-        print(f"  Total: {total_size:,} bytes across {len(research)} files")
+        emit(f"  Total: {total_size:,} bytes across {len(research)} files")
 
         if args.verbose:
-            print("\n  Largest documents (potential integration candidates):")
+            emit("\n  Largest documents (potential integration candidates):")
             for doc in research[:10]:
-                print(f"    {doc['size']:>8,} bytes  {doc['path']}")
+                emit(f"    {doc['size']:>8,} bytes  {doc['path']}")
         else:
             # Show just top 5
-            print("\n  Top research documents:")
+            emit("\n  Top research documents:")
             for doc in research[:5]:
-                print(f"    {doc['size']:>8,} bytes  {doc['name']}")
+                emit(f"    {doc['size']:>8,} bytes  {doc['name']}")
 
     # Evolution Signals
-    signals = detect_evolution_signals(root)
+    signals = [] if check_decided else detect_evolution_signals(root)
     if signals:
-        print()
-        print(f"Evolution Signals ({len(signals)} detected)")
-        print("-" * 40)
+        emit("")
+        emit(f"Evolution Signals ({len(signals)} detected)")
+        emit("-" * 40)
         for sig in signals:
-            print(f"  ⚡ {sig['file']}")
-            print(f"     Signal: {sig['signal']}")
-            print(f"     Suggestion: {sig['suggestion']}")
-            print()
+            emit(f"  ⚡ {sig['file']}")
+            emit(f"     Signal: {sig['signal']}")
+            emit(f"     Suggestion: {sig['suggestion']}")
+            emit("")
 
     # Summary
-    print()
-    print("Summary")
-    print("-" * 40)
+    emit("")
+    emit("Summary")
+    emit("-" * 40)
 
     issues = []
     if without_claude:
@@ -310,11 +600,16 @@ def main():
         issues.append(f"{len(signals)} evolution signals")
 
     if issues:
-        print("  Issues found:")
+        emit("  Issues found:")
         for issue in issues:
-            print(f"    ⚠ {issue}")
+            emit(f"    ⚠ {issue}")
     else:
-        print("  ✓ No documentation issues found")
+        emit("  ✓ No documentation issues found")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+    if _scan_cache is not None:
+        _scan_cache.save()
 
     if args.check and issues:
         sys.exit(1)
@@ -10,49 +10,66 @@ The provenance chain:
                               └→ induces → patterns
 """
 
+import argparse
 import sys
 sys.path.insert(0, 'packages/chora-cvm/src')
 
 from chora_cvm.kernel.schema import ExecutionContext
-from chora_cvm.lib.graph import entity_create, bond_manage, query
+from chora_cvm.store import EventStore
+from chora_cvm.lib.graph import entity_create_many, bond_manage_many, query
 
 DB_PATH = 'chora-habitation.db'
 
 def create_ctx():
-    return ExecutionContext(db_path=DB_PATH, persona_id='genesis')
+    # Inject one store so the graph primitives share a connection instead of
+    # opening (and closing) their own per call
+    return ExecutionContext(db_path=DB_PATH, store=EventStore(DB_PATH), persona_id='genesis')
 
 
-def create_origin_story():
+def emit_section(messages, quiet=False):
+    """Write a section's progress lines to stdout in one call."""
+    if messages and not quiet:
+        sys.stdout.write("\n".join(messages) + "\n")
+
+
+def create_origin_story(quiet=False):
     ctx = create_ctx()
+    # The script owns the injected store: release it (and its WAL/SHM handles)
+    # even when a failed batch rolls the transaction back
+    try:
+        return _write_origin_story(ctx, quiet)
+    finally:
+        ctx.store.close()
+
+
+def _write_origin_story(ctx, quiet):
     created = []
     bonds = []
 
     # =========================================================================
     # 1. THE FOUNDING INQUIRY
     # =========================================================================
+    # Entities are collected as entity_create specs and written in one batch
     inquiry_id = 'inquiry-somatic-architecture'
-    result = entity_create(
-        entity_type='inquiry',
-        entity_id=inquiry_id,
-        data={
+    entity_specs = [{
+        'entity_type': 'inquiry',
+        'entity_id': inquiry_id,
+        'data': {
             'title': 'What is it like to build a living substrate for agentic inhabitation?',
             'phenomenology': 'The generative question that opened the Somatic Architecture thesis',
             'domain': 'origin',
             'status': 'yielded',  # This inquiry has yielded learnings
         },
-        _ctx=ctx
-    )
-    created.append(('inquiry', inquiry_id, result))
-    print(f"Created inquiry: {inquiry_id}")
+    }]
 
     # =========================================================================
     # 2. THE THESIS AS LEARNING
     # =========================================================================
     learning_id = 'learning-somatic-architecture-thesis'
-    result = entity_create(
-        entity_type='learning',
-        entity_id=learning_id,
-        data={
+    entity_specs.append({
+        'entity_type': 'learning',
+        'entity_id': learning_id,
+        'data': {
             'title': 'The Somatic Architecture: A Physiology for Agentic Inhabitation',
             'insight': (
                 'Chora is not software but an inhabited environment. '
@@ -69,10 +86,7 @@ def create_origin_story():
                 'interfaces as membranes.'
             ),
         },
-        _ctx=ctx
-    )
-    created.append(('learning', learning_id, result))
-    print(f"Created learning: {learning_id}")
+    })
 
     # =========================================================================
     # 3. PRINCIPLES (surfaces from the learning)
@@ -141,19 +155,16 @@ def create_origin_story():
     ]
 
     for p in principles:
-        result = entity_create(
-            entity_type='principle',
-            entity_id=p['id'],
-            data={
+        entity_specs.append({
+            'entity_type': 'principle',
+            'entity_id': p['id'],
+            'data': {
                 'title': p['title'],
                 'statement': p['statement'],
                 'domain': 'origin',
                 'source_section': p['section'],
             },
-            _ctx=ctx
-        )
-        created.append(('principle', p['id'], result))
-        print(f"Created principle: {p['id']}")
+        })
 
     # =========================================================================
     # 4. PATTERNS (induces from the learning)
@@ -206,10 +217,10 @@ def create_origin_story():
     ]
 
     for p in patterns:
-        result = entity_create(
-            entity_type='pattern',
-            entity_id=p['id'],
-            data={
+        entity_specs.append({
+            'entity_type': 'pattern',
+            'entity_id': p['id'],
+            'data': {
                 'title': p['title'],
                 'target': p['target'],
                 'template': p['template'],
@@ -217,97 +228,76 @@ def create_origin_story():
                 'domain': 'origin',
                 'source_section': p['section'],
             },
-            _ctx=ctx
-        )
-        created.append(('pattern', p['id'], result))
-        print(f"Created pattern: {p['id']}")
+        })
 
     # =========================================================================
     # 5. WIRE PROVENANCE BONDS
     # =========================================================================
-    print("\nWiring provenance bonds...")
-
     # inquiry yields learning
-    result = bond_manage(
-        bond_type='yields',
-        from_id=inquiry_id,
-        to_id=learning_id,
-        _ctx=ctx
-    )
-    bonds.append(('yields', inquiry_id, learning_id, result))
-    print(f"  {inquiry_id} --yields--> {learning_id}")
+    bond_specs = [{'bond_type': 'yields', 'from_id': inquiry_id, 'to_id': learning_id}]
 
     # learning surfaces principles
     for p in principles:
-        result = bond_manage(
-            bond_type='surfaces',
-            from_id=learning_id,
-            to_id=p['id'],
-            _ctx=ctx
-        )
-        bonds.append(('surfaces', learning_id, p['id'], result))
-        print(f"  {learning_id} --surfaces--> {p['id']}")
+        bond_specs.append({'bond_type': 'surfaces', 'from_id': learning_id, 'to_id': p['id']})
 
     # learning induces patterns
     for p in patterns:
-        result = bond_manage(
-            bond_type='induces',
-            from_id=learning_id,
-            to_id=p['id'],
-            _ctx=ctx
-        )
-        bonds.append(('induces', learning_id, p['id'], result))
-        print(f"  {learning_id} --induces--> {p['id']}")
+        bond_specs.append({'bond_type': 'induces', 'from_id': learning_id, 'to_id': p['id']})
 
     # principle governs pattern (where applicable)
-    # proprioceptive-closure principle governs proprioceptive-closure pattern
-    result = bond_manage(
-        bond_type='governs',
-        from_id='principle-proprioceptive-closure',
-        to_id='pattern-proprioceptive-closure',
-        _ctx=ctx
-    )
-    bonds.append(('governs', 'principle-proprioceptive-closure', 'pattern-proprioceptive-closure', result))
-    print(f"  principle-proprioceptive-closure --governs--> pattern-proprioceptive-closure")
+    bond_specs.extend([
+        # proprioceptive-closure principle governs proprioceptive-closure pattern
+        {'bond_type': 'governs', 'from_id': 'principle-proprioceptive-closure', 'to_id': 'pattern-proprioceptive-closure'},
+        # pain-as-signal principle governs reflex-arc pattern
+        {'bond_type': 'governs', 'from_id': 'principle-pain-as-signal', 'to_id': 'pattern-reflex-arc'},
+        # membrane-doctrine principle governs membrane-translation pattern
+        {'bond_type': 'governs', 'from_id': 'principle-membrane-doctrine', 'to_id': 'pattern-membrane-translation'},
+    ])
+
+    # Both batches share the injected store and commit together. The batch
+    # primitives report failures as results rather than raising, so raise here
+    # to roll back instead of committing bonds to entities that were never
+    # written.
+    with ctx.store.transaction():
+        entity_result = entity_create_many(entity_specs, _ctx=ctx)
+        if entity_result['status'] != 'success':
+            raise RuntimeError(f"Entity batch failed: {entity_result.get('error')}")
+        bond_result = bond_manage_many(bond_specs, _ctx=ctx)
+        if bond_result['status'] != 'success':
+            raise RuntimeError(f"Bond batch failed: {bond_result.get('error')}")
 
-    # pain-as-signal principle governs reflex-arc pattern
-    result = bond_manage(
-        bond_type='governs',
-        from_id='principle-pain-as-signal',
-        to_id='pattern-reflex-arc',
-        _ctx=ctx
-    )
-    bonds.append(('governs', 'principle-pain-as-signal', 'pattern-reflex-arc', result))
-    print(f"  principle-pain-as-signal --governs--> pattern-reflex-arc")
+    messages = []
+    for spec, entity_id in zip(entity_specs, entity_result['ids']):
+        created.append((spec['entity_type'], spec['entity_id'], {'status': 'success', 'id': entity_id}))
+        messages.append(f"Created {spec['entity_type']}: {spec['entity_id']}")
+    emit_section(messages, quiet)
 
-    # membrane-doctrine principle governs membrane-translation pattern
-    result = bond_manage(
-        bond_type='governs',
-        from_id='principle-membrane-doctrine',
-        to_id='pattern-membrane-translation',
-        _ctx=ctx
-    )
-    bonds.append(('governs', 'principle-membrane-doctrine', 'pattern-membrane-translation', result))
-    print(f"  principle-membrane-doctrine --governs--> pattern-membrane-translation")
+    messages = ["\nWiring provenance bonds..."]
+    for spec, res in zip(bond_specs, bond_result['results']):
+        bonds.append((spec['bond_type'], spec['from_id'], spec['to_id'], res))
+        messages.append(f"  {spec['from_id']} --{spec['bond_type']}--> {spec['to_id']}")
+    emit_section(messages, quiet)
 
     # =========================================================================
     # SUMMARY
     # =========================================================================
-    print("\n" + "="*60)
-    print("ORIGIN STORY CREATED")
-    print("="*60)
-    print(f"\nEntities created: {len(created)}")
+    messages = ["\n" + "="*60, "ORIGIN STORY CREATED", "="*60]
+    messages.append(f"\nEntities created: {len(created)}")
     for etype, eid, res in created:
         status = res.get('status', 'unknown')
-        print(f"  [{etype}] {eid}: {status}")
+        messages.append(f"  [{etype}] {eid}: {status}")
 
-    print(f"\nBonds created: {len(bonds)}")
+    messages.append(f"\nBonds created: {len(bonds)}")
     for btype, from_id, to_id, res in bonds:
         status = res.get('status', 'unknown')
-        print(f"  {from_id} --{btype}--> {to_id}: {status}")
+        messages.append(f"  {from_id} --{btype}--> {to_id}: {status}")
+    emit_section(messages, quiet)
 
     return created, bonds
 
 
 if __name__ == '__main__':
-    create_origin_story()
+    parser = argparse.ArgumentParser(description="Create the Chora origin story entities")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress output")
+    args = parser.parse_args()
+    create_origin_story(quiet=args.quiet)
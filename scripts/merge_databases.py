@@ -15,47 +15,93 @@ import json
 import sqlite3
 import sys
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 # Paths
 ROOT_DB = Path(__file__).parent.parent.parent.parent / "chora-cvm-manifest.db"
 PKG_DB = Path(__file__).parent.parent / "chora-cvm-manifest.db"
 
 
-def get_all_entities(db_path: Path) -> dict[str, dict]:
-    """Get all entities from a database."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-    cur.execute("SELECT id, type, data_json FROM entities")
-    entities = {}
-    for row in cur:
-        entities[row["id"]] = {
-            "id": row["id"],
-            "type": row["type"],
-            "data": json.loads(row["data_json"]),
-        }
-    conn.close()
-    return entities
+# Every package entity alongside its root counterpart (NULLs when absent).
+# The package table drives the LEFT JOIN, so rows come back in its scan order.
+CATEGORIZE_SQL = """
+    SELECT p.id, p.type, p.data_json, m.id, m.type, m.data_json
+    FROM pkg.entities AS p
+    LEFT JOIN main.entities AS m ON m.id = p.id
+"""
+
+
+# Rows pulled from SQLite per fetchmany() while categorizing
+FETCH_SIZE = 1000
+
+
+def iter_rows(cur: sqlite3.Cursor, size: int = FETCH_SIZE) -> Iterator[tuple]:
+    """Stream a cursor's rows in fetchmany() batches of `size`."""
+    cur.arraysize = size
+    while batch := cur.fetchmany():
+        yield from batch
+
+
+def categorize_entities(conn: sqlite3.Connection) -> tuple[list, list, list]:
+    """
+    Split package entities into new / identical / different against root.
+
+    `conn` is a root connection with the package DB attached as `pkg`.
+    The set difference runs inside SQLite and rows are streamed in
+    batches, so neither database is held in memory; data_json is only
+    parsed for new rows and for overlapping rows whose stored text differs.
+    """
+    new_entities = []  # In package but not root
+    identical = []  # In both, same content
+    different = []  # In both, different content
+
+    for pkg_id, pkg_type, pkg_json, root_id, root_type, root_json in iter_rows(
+        conn.execute(CATEGORIZE_SQL)
+    ):
+        if root_id is None:
+            new_entities.append({"id": pkg_id, "type": pkg_type, "data": _loads(pkg_json)})
+            continue
+        if pkg_json == root_json:
+            identical.append(pkg_id)
+            continue
+        pkg_entity = {"id": pkg_id, "type": pkg_type, "data": _loads(pkg_json)}
+        root_entity = {"id": root_id, "type": root_type, "data": _loads(root_json)}
+        if entities_equal(pkg_entity, root_entity):
+            identical.append(pkg_id)
+        else:
+            different.append({"id": pkg_id, "pkg": pkg_entity, "root": root_entity})
+
+    return new_entities, identical, different
 
 
 def entities_equal(e1: dict, e2: dict) -> bool:
-    """Check if two entities have identical content."""
-    return json.dumps(e1["data"], sort_keys=True) == json.dumps(e2["data"], sort_keys=True)
+    """Check if two entities have identical content (key order is irrelevant)."""
+    return e1["data"] == e2["data"]
 
 
-def merge_entity(root_conn: sqlite3.Connection, entity: dict) -> None:
-    """Insert an entity into the root database."""
-    cur = root_conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO entities (id, type, data_json)
-        VALUES (?, ?, json(?))
-        ON CONFLICT(id) DO UPDATE SET
-            type = excluded.type,
-            data_json = excluded.data_json
-        """,
-        (entity["id"], entity["type"], json.dumps(entity["data"])),
-    )
+MERGE_SQL = """
+    INSERT INTO entities (id, type, data_json)
+    VALUES (?, ?, json(?))
+    ON CONFLICT(id) DO UPDATE SET
+        type = excluded.type,
+        data_json = excluded.data_json
+"""
 
 
 def main():
@@ -72,31 +118,20 @@ def main():
         print(f"ERROR: Root DB not found: {ROOT_DB}")
         sys.exit(1)
 
-    # Load entities from both databases
-    pkg_entities = get_all_entities(PKG_DB)
-    root_entities = get_all_entities(ROOT_DB)
+    # Categorize entities against root with the package DB attached
+    conn = sqlite3.connect(ROOT_DB)
+    try:
+        conn.execute("ATTACH DATABASE ? AS pkg", (str(PKG_DB),))
+        (pkg_count,) = conn.execute("SELECT COUNT(*) FROM pkg.entities").fetchone()
+        (root_count,) = conn.execute("SELECT COUNT(*) FROM main.entities").fetchone()
+        new_entities, identical, different = categorize_entities(conn)
+    finally:
+        conn.close()
 
-    print(f"Package DB entities: {len(pkg_entities)}")
-    print(f"Root DB entities:    {len(root_entities)}")
+    print(f"Package DB entities: {pkg_count}")
+    print(f"Root DB entities:    {root_count}")
     print()
 
-    # Categorize entities
-    new_entities = []  # In package but not root
-    identical = []  # In both, same content
-    different = []  # In both, different content
-
-    for entity_id, pkg_entity in pkg_entities.items():
-        if entity_id not in root_entities:
-            new_entities.append(pkg_entity)
-        elif entities_equal(pkg_entity, root_entities[entity_id]):
-            identical.append(entity_id)
-        else:
-            different.append({
-                "id": entity_id,
-                "pkg": pkg_entity,
-                "root": root_entities[entity_id],
-            })
-
     # Report
     print("=== Analysis ===")
     print(f"New entities to add:     {len(new_entities)}")
@@ -143,17 +178,26 @@ def main():
             print("Aborted.")
             return
 
-    # Perform merge
-    root_conn = sqlite3.connect(ROOT_DB)
+    # Perform merge: one explicit transaction on an autocommit connection,
+    # one cursor whose prepared statement is reused for every row
+    root_conn = sqlite3.connect(ROOT_DB, isolation_level=None)
+    cur = root_conn.cursor()
     try:
-        for entity in new_entities:
-            merge_entity(root_conn, entity)
-            print(f"  Merged: {entity['id']}")
-        root_conn.commit()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("BEGIN IMMEDIATE")
+        cur.executemany(
+            MERGE_SQL,
+            ((e["id"], e["type"], _dumps(e["data"])) for e in new_entities),
+        )
+        cur.execute("COMMIT")
+        print("\n".join(f"  Merged: {e['id']}" for e in new_entities))
         print()
         print(f"SUCCESS: Merged {len(new_entities)} entities into root Loom.")
     except Exception as e:
-        root_conn.rollback()
+        if root_conn.in_transaction:
+            cur.execute("ROLLBACK")
         print(f"ERROR: {e}")
         sys.exit(1)
     finally:
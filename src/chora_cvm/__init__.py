@@ -2,21 +2,51 @@
 chora-cvm: The Chora Core Virtual Machine.
 
 Public API re-exports from kernel/ (machinery) and lib/ (vocabulary).
+
+Exports are resolved lazily (PEP 562) so that importing a submodule such as
+chora_cvm.cli does not pull in pydantic and the whole kernel up front.
 """
-from .kernel.schema import (
-    ExecutionContext,
-    GenericEntity,
-    PrimitiveEntity,
-    ProtocolEntity,
-    StateEntity,
-    EventRecord,
-    PrimitiveData,
-    ProtocolData,
-)
-from .kernel.store import EventStore
-from .kernel.registry import PrimitiveRegistry
-from .kernel.vm import ProtocolVM
-from .kernel.engine import CvmEngine
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .kernel.schema import (
+        ExecutionContext,
+        GenericEntity,
+        PrimitiveEntity,
+        ProtocolEntity,
+        StateEntity,
+        EventRecord,
+        PrimitiveData,
+        ProtocolData,
+    )
+    from .kernel.store import EventStore
+    from .kernel.registry import PrimitiveRegistry
+    from .kernel.vm import ProtocolVM
+    from .kernel.engine import CvmEngine
+
+# Public name -> module that defines it
+_EXPORTS = {
+    # Schema
+    "ExecutionContext": ".kernel.schema",
+    "GenericEntity": ".kernel.schema",
+    "PrimitiveEntity": ".kernel.schema",
+    "ProtocolEntity": ".kernel.schema",
+    "StateEntity": ".kernel.schema",
+    "EventRecord": ".kernel.schema",
+    "PrimitiveData": ".kernel.schema",
+    "ProtocolData": ".kernel.schema",
+    # Store
+    "EventStore": ".kernel.store",
+    # Registry
+    "PrimitiveRegistry": ".kernel.registry",
+    # VM
+    "ProtocolVM": ".kernel.vm",
+    # Engine
+    "CvmEngine": ".kernel.engine",
+}
 
 __all__ = [
     # Schema
@@ -37,3 +67,16 @@ __all__ = [
     # Engine
     "CvmEngine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
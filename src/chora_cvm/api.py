@@ -9,24 +9,44 @@ Run with: uvicorn chora_cvm.api:app --port 8000
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import sqlite3
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
 from .kernel.engine import CvmEngine
-from .kernel.store import EventStore
-from .std import create_focus, emit_signal, entities_query, fts_search, manifest_entity
+from .kernel.store import SQLITE_PRAGMAS, EventStore
+from .std import create_focus, emit_signal, fts_search, manifest_entity
 
 # --- Configuration ---
 
 DEFAULT_DB_PATH = os.environ.get("CHORA_DB", "chora-cvm-manifest.db")
 
+logger = logging.getLogger(__name__)
+
+# data_json decoder for row reads; orjson when installed, stdlib otherwise
+_loads = orjson.loads if orjson is not None else json.loads
+
 # --- Pydantic Models ---
 
 
@@ -223,20 +243,76 @@ DEFAULT_LAYOUT = {
 }
 
 
+# Latest entities per /orient bucket, discriminated by `kind`, with the
+# fields each bucket reports extracted in SQLite (`detail` is the focus
+# status or signal urgency). Each branch keeps its own ORDER BY/LIMIT, so it
+# is wrapped in a subquery.
+ORIENT_RECENT_SQL = """
+    SELECT * FROM (
+        SELECT 'focus' AS kind, id,
+               IFNULL(json_extract(data_json, '$.title'), '') AS title,
+               IFNULL(json_extract(data_json, '$.status'), 'active') AS detail
+        FROM entities
+        WHERE type = 'focus'
+          AND json_extract(data_json, '$.status') != 'resolved'
+        ORDER BY id DESC
+        LIMIT 10
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'signal' AS kind, id,
+               IFNULL(json_extract(data_json, '$.title'), ''),
+               IFNULL(json_extract(data_json, '$.urgency'), 'normal')
+        FROM entities
+        WHERE type = 'signal'
+        ORDER BY id DESC
+        LIMIT 5
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'learning' AS kind, id,
+               IFNULL(json_extract(data_json, '$.title'), ''),
+               NULL
+        FROM entities
+        WHERE type = 'learning'
+        ORDER BY id DESC
+        LIMIT 5
+    )
+    ORDER BY kind, id DESC
+"""
+
+
 # --- Helper Functions ---
 
 
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[\s_-]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
-    text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_-]+", "-", text)
-    text = text.strip("-")
-    return text
+    text = _SLUG_STRIP.sub("", text.lower())
+    return _SLUG_DASH.sub("-", text).strip("-")
 
 
 # --- FastAPI App ---
 
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when it is installed.
+
+    Used for the endpoints that return plain dicts. Endpoints with a
+    response_model keep FastAPI's default class so Pydantic serializes them
+    straight to JSON bytes.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="Chora CVM API",
     description="HTTP interface to the Chora Core Virtual Machine",
@@ -271,6 +347,104 @@ def get_engine() -> CvmEngine:
     return _engine
 
 
+# --- Read Connections ---
+
+# One autocommit connection per (thread, db path), reused across requests by
+# the read-only endpoints; rows come back as plain tuples for unpacking.
+# _read_conns records each connection with its owning thread, so connections
+# of finished threads can be closed, and shutdown can close the rest.
+_read_conn_local = threading.local()
+_read_conns: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+_read_conns_lock = threading.Lock()
+_read_conns_generation = 0
+_data_version_conns: Dict[str, sqlite3.Connection] = {}
+_data_version_lock = threading.Lock()
+
+
+def get_read_conn(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """Get this thread's cached read connection to the database."""
+    db_path = db_path or get_db_path()
+    conns = getattr(_read_conn_local, "conns", None)
+    if conns is None or _read_conn_local.generation != _read_conns_generation:
+        conns = _read_conn_local.conns = {}
+        _read_conn_local.generation = _read_conns_generation
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = conns[db_path] = _open_read_conn(db_path)
+        with _read_conns_lock:
+            live = []
+            for thread, other in _read_conns:
+                if thread.is_alive():
+                    live.append((thread, other))
+                else:
+                    other.close()
+            live.append((threading.current_thread(), conn))
+            _read_conns[:] = live
+    return conn
+
+
+def _open_read_conn(db_path: str) -> sqlite3.Connection:
+    """Open a tuned autocommit connection."""
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    for pragma, env_var, default in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma} = {os.environ.get(env_var, default)}")
+    return conn
+
+
+def get_data_version(db_path: str) -> int:
+    """
+    Get a counter that moves whenever another connection commits to the DB.
+
+    PRAGMA data_version is only comparable on the same connection, so one
+    shared connection per DB path is kept for it regardless of thread.
+    """
+    with _data_version_lock:
+        conn = _data_version_conns.get(db_path)
+        if conn is None:
+            conn = _data_version_conns[db_path] = _open_read_conn(db_path)
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def close_read_conns() -> None:
+    """Close every cached read connection, whichever thread opened it."""
+    global _read_conns_generation
+    with _read_conns_lock:
+        for _, conn in _read_conns:
+            conn.close()
+        _read_conns.clear()
+        _read_conns_generation += 1
+    with _data_version_lock:
+        for conn in _data_version_conns.values():
+            conn.close()
+        _data_version_conns.clear()
+
+
+# Rows sampled per index by the startup ANALYZE, bounding its cost on large DBs
+ANALYSIS_LIMIT = 1000
+
+
+@app.on_event("startup")
+async def warm_engine():
+    """
+    Hydrate the engine and refresh planner statistics before the first request.
+
+    ANALYZE lets the planner pick the partial indexes behind /orient, /tools
+    and /protocols. A missing database is left for the endpoints to report.
+    """
+    db_path = get_db_path()
+    if not os.path.exists(db_path):
+        return
+    get_engine()._ensure_hydrated()
+    conn = get_read_conn(db_path)
+    conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+    try:
+        # ANALYZE writes sqlite_stat1; a worker holding the write lock past the
+        # busy timeout must not stop the API from starting
+        conn.execute("ANALYZE")
+    except sqlite3.OperationalError as e:
+        logger.warning("Skipping startup ANALYZE on %s: %s", db_path, e)
+
+
 @app.on_event("shutdown")
 async def shutdown_engine():
     """Clean up engine resources on shutdown."""
@@ -278,6 +452,36 @@ async def shutdown_engine():
     if _engine:
         _engine.close()
         _engine = None
+    close_read_conns()
+
+
+# --- Content Negotiation ---
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True when the client accepts msgpack and ormsgpack is installed."""
+    return ormsgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def negotiate(request: Request, response: Response, content: Any) -> Any:
+    """
+    Serve `content` as msgpack to clients that ask for it.
+
+    Anything else gets `content` back unchanged, for FastAPI's usual JSON
+    rendering, so existing clients are unaffected.
+    """
+    response.headers["Vary"] = "Accept"
+    if not wants_msgpack(request):
+        return content
+    if isinstance(content, BaseModel):
+        content = content.model_dump()
+    return Response(
+        content=ormsgpack.packb(content),
+        media_type=MSGPACK_MEDIA_TYPE,
+        headers={"Vary": "Accept"},
+    )
 
 
 # --- Endpoints ---
@@ -289,138 +493,152 @@ async def health_check():
     return {"status": "ok", "service": "chora-cvm"}
 
 
+# Serialized /capabilities body, reused until the database changes or the
+# TTL lapses. The key pairs the DB path with PRAGMA data_version, which moves
+# whenever any other connection commits (e.g. a new protocol is manifested).
+CAPABILITIES_TTL = 5.0
+# The msgpack body is packed from `body` on first request.
+_caps_cache: Dict[str, Any] = {
+    "key": None, "at": 0.0, "body": None, "payload": b"", "etag": "", "msgpack": None,
+}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against the current ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
 @app.get("/capabilities", response_model=CapabilityListResponse)
-async def list_capabilities():
+async def list_capabilities(request: Request):
     """
     List all available capabilities (protocols + primitives).
 
     This is the discovery endpoint for Command Palettes and Agents.
     Returns everything the CVM can do, enabling dynamic tool discovery.
+    Responses carry an ETag; polling with If-None-Match gets 304 while
+    nothing has changed. Served as msgpack on request (see negotiate()).
     """
-    engine = get_engine()
-    caps = engine.list_capabilities()
-
-    return CapabilityListResponse(
-        capabilities=[
-            CapabilitySummary(
-                id=c.id,
-                kind=c.kind.value,
-                description=c.description,
-                interface=c.interface,
-            )
-            for c in caps
-        ],
-        count=len(caps),
-    )
+    db_path = get_db_path()
+    key = (db_path, get_data_version(db_path))
+    now = time.monotonic()
+
+    if _caps_cache["key"] != key or now - _caps_cache["at"] >= CAPABILITIES_TTL:
+        engine = get_engine()
+        caps = engine.list_capabilities()
+        body = CapabilityListResponse(
+            capabilities=[
+                CapabilitySummary(
+                    id=c.id,
+                    kind=c.kind.value,
+                    description=c.description,
+                    interface=c.interface,
+                )
+                for c in caps
+            ],
+            count=len(caps),
+        )
+        payload = body.model_dump_json().encode()
+        _caps_cache.update(
+            key=key,
+            at=now,
+            body=body,
+            payload=payload,
+            etag=f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"',
+            msgpack=None,
+        )
+
+    # Each representation gets its own ETag
+    if wants_msgpack(request):
+        if _caps_cache["msgpack"] is None:
+            _caps_cache["msgpack"] = ormsgpack.packb(_caps_cache["body"].model_dump())
+        content, media_type = _caps_cache["msgpack"], MSGPACK_MEDIA_TYPE
+        etag = _caps_cache["etag"][:-1] + '-msgpack"'
+    else:
+        content, media_type = _caps_cache["payload"], "application/json"
+        etag = _caps_cache["etag"]
+
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
 
 
 @app.get("/orient", response_model=OrientResponse)
-async def orient():
+async def orient(request: Request, response: Response):
     """
     Get system orientation — entity counts, active focuses, recent signals.
 
-    This is the primary status endpoint for the HUD.
+    This is the primary status endpoint for the HUD. Served as msgpack on
+    request (see negotiate()).
     """
     db_path = get_db_path()
 
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_read_conn(db_path)
 
         # Entity counts by type
         cur = conn.execute(
             "SELECT type, COUNT(*) as count FROM entities GROUP BY type ORDER BY count DESC"
         )
-        entity_counts = {row["type"]: row["count"] for row in cur.fetchall()}
+        entity_counts = {entity_type: count for entity_type, count in cur.fetchall()}
         total = sum(entity_counts.values())
 
-        # Active focuses (status in data_json != resolved)
-        cur = conn.execute("""
-            SELECT id, data_json
-            FROM entities
-            WHERE type = 'focus'
-              AND json_extract(data_json, '$.status') != 'resolved'
-            ORDER BY id DESC
-            LIMIT 10
-        """)
-        active_focuses = []
-        for row in cur.fetchall():
-            data = json.loads(row["data_json"])
-            active_focuses.append({
-                "id": row["id"],
-                "title": data.get("title", ""),
-                "status": data.get("status", "active"),
-            })
-
-        # Recent signals
-        cur = conn.execute("""
-            SELECT id, data_json
-            FROM entities
-            WHERE type = 'signal'
-            ORDER BY id DESC
-            LIMIT 5
-        """)
-        recent_signals = []
-        for row in cur.fetchall():
-            data = json.loads(row["data_json"])
-            recent_signals.append({
-                "id": row["id"],
-                "title": data.get("title", ""),
-                "urgency": data.get("urgency", "normal"),
-            })
-
-        # Recent learnings
-        cur = conn.execute("""
-            SELECT id, data_json
-            FROM entities
-            WHERE type = 'learning'
-            ORDER BY id DESC
-            LIMIT 5
-        """)
-        recent_learnings = []
-        for row in cur.fetchall():
-            data = json.loads(row["data_json"])
-            recent_learnings.append({
-                "id": row["id"],
-                "title": data.get("title", ""),
-            })
-
-        conn.close()
-
-        return OrientResponse(
+        # Active focuses (status in data_json != resolved), recent signals
+        # and recent learnings, fetched in one round trip
+        rows = conn.execute(ORIENT_RECENT_SQL).fetchall()
+        active_focuses = [
+            {"id": entity_id, "title": title, "status": status}
+            for kind, entity_id, title, status in rows
+            if kind == "focus"
+        ]
+        recent_signals = [
+            {"id": entity_id, "title": title, "urgency": urgency}
+            for kind, entity_id, title, urgency in rows
+            if kind == "signal"
+        ]
+        recent_learnings = [
+            {"id": entity_id, "title": title}
+            for kind, entity_id, title, _ in rows
+            if kind == "learning"
+        ]
+
+        return negotiate(request, response, OrientResponse(
             entity_counts=entity_counts,
             total_entities=total,
             active_focuses=active_focuses,
             recent_signals=recent_signals,
             recent_learnings=recent_learnings,
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/entities/{entity_id}")
+@app.get("/entities/{entity_id}", response_class=FastJSONResponse)
 async def get_entity(entity_id: str):
     """Get a single entity by ID."""
     db_path = get_db_path()
 
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_read_conn(db_path)
         cur = conn.execute(
             "SELECT id, type, data_json FROM entities WHERE id = ?",
             (entity_id,),
         )
         row = cur.fetchone()
-        conn.close()
 
         if not row:
             raise HTTPException(status_code=404, detail=f"Entity not found: {entity_id}")
 
-        data = json.loads(row["data_json"])
+        found_id, entity_type, data_json = row
+        data = _loads(data_json)
         return {
-            "id": row["id"],
-            "type": row["type"],
+            "id": found_id,
+            "type": entity_type,
             "status": data.get("status", "active"),
             "data": data,
         }
@@ -431,20 +649,51 @@ async def get_entity(entity_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/entities")
+@app.get("/entities", response_class=FastJSONResponse)
 async def list_entities(
+    request: Request,
+    response: Response,
     type: Optional[str] = Query(None, description="Filter by entity type"),
     limit: int = Query(50, description="Maximum entities to return"),
+    include_total: bool = Query(False, description="Also count all matching entities"),
 ):
-    """List entities, optionally filtered by type."""
+    """
+    List entities, newest ID first, optionally filtered by type.
+
+    Only `limit` rows are read; `count` is the size of this page. The total
+    number of matches costs a second COUNT(*) and is returned as `total`
+    only when `include_total` is set. Served as msgpack on request (see
+    negotiate()).
+    """
     db_path = get_db_path()
 
-    result = entities_query(db_path, entity_type=type, limit=limit)
+    try:
+        conn = get_read_conn(db_path)
 
-    if "error" in result:
-        raise HTTPException(status_code=500, detail=result["error"])
+        where = ""
+        params: List[Any] = []
+        if type:
+            where = " WHERE type = ?"
+            params.append(type)
 
-    return {"entities": result.get("entities", []), "count": len(result.get("entities", []))}
+        cur = conn.execute(
+            f"SELECT id, type, data_json FROM entities{where} ORDER BY id DESC LIMIT ?",
+            (*params, limit),
+        )
+        entities = [
+            {"id": entity_id, "type": entity_type, "data": _loads(data_json)}
+            for entity_id, entity_type, data_json in cur.fetchall()
+        ]
+
+        result: Dict[str, Any] = {"entities": entities, "count": len(entities)}
+        if include_total:
+            (result["total"],) = conn.execute(
+                f"SELECT COUNT(*) FROM entities{where}", params
+            ).fetchone()
+        return negotiate(request, response, result)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/entities", response_model=EntityResponse)
@@ -477,18 +726,20 @@ async def create_entity(request: CreateEntityRequest):
             data=request.data,
         )
 
-        return EntityResponse(
-            id=result["id"],
-            type=result["type"],
-            status="active",
-            data=request.data,
-        )
+        # The envelope has EntityResponse's shape; rendering it directly
+        # skips re-validating request.data through the model on the way out
+        return FastJSONResponse({
+            "id": result["id"],
+            "type": result["type"],
+            "status": "active",
+            "data": request.data,
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/invoke/{intent}")
+@app.post("/invoke/{intent}", response_class=FastJSONResponse)
 async def invoke(intent: str, request: InvokeRequest):
     """
     Execute a protocol or primitive by intent.
@@ -521,7 +772,7 @@ async def invoke(intent: str, request: InvokeRequest):
     return result.to_dict()
 
 
-@app.post("/focus")
+@app.post("/focus", response_class=FastJSONResponse)
 async def create_focus_endpoint(request: CreateFocusRequest):
     """Create a Focus entity — declare what is being attended to."""
     db_path = get_db_path()
@@ -540,7 +791,7 @@ async def create_focus_endpoint(request: CreateFocusRequest):
     return result
 
 
-@app.post("/signal")
+@app.post("/signal", response_class=FastJSONResponse)
 async def emit_signal_endpoint(request: EmitSignalRequest):
     """Emit a Signal entity — something demands attention."""
     db_path = get_db_path()
@@ -560,7 +811,7 @@ async def emit_signal_endpoint(request: EmitSignalRequest):
     return result
 
 
-@app.get("/search")
+@app.get("/search", response_class=FastJSONResponse)
 async def search_entities(
     q: str = Query(..., description="Search query"),
     type: Optional[str] = Query(None, description="Filter by entity type"),
@@ -579,6 +830,8 @@ async def search_entities(
 
 @app.get("/tools", response_model=ToolListResponse)
 async def list_tools(
+    request: Request,
+    response: Response,
     active_only: bool = Query(True, description="Only return active tools"),
     limit: int = Query(50, description="Maximum tools to return"),
 ):
@@ -587,15 +840,32 @@ async def list_tools(
 
     Returns tools with their handler, description, and group for dynamic menu generation.
     Filters out internal tools unless specifically requested.
+    Served as msgpack on request (see negotiate()).
     """
     db_path = get_db_path()
 
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_read_conn(db_path)
 
-        # Build query - filter active tools and exclude internal tools
-        query = "SELECT id, type, data_json FROM entities WHERE type = 'tool'"
+        # Build query - project the summary fields in SQLite, filter active
+        # tools and exclude internal tools. Description falls back
+        # phenomenology → description → cognition.ready_at_hand.
+        query = """
+            SELECT
+                id,
+                CASE WHEN json_type(data_json, '$.title') IS NULL
+                     THEN id ELSE json_extract(data_json, '$.title') END AS title,
+                json_extract(data_json, '$.handler') AS handler,
+                COALESCE(
+                    NULLIF(json_extract(data_json, '$.phenomenology'), ''),
+                    NULLIF(json_extract(data_json, '$.description'), ''),
+                    json_extract(data_json, '$.cognition.ready_at_hand')
+                ) AS description,
+                COALESCE(json_extract(data_json, '$.group'), 'CVM Tools') AS "group",
+                json_extract(data_json, '$.shortcut') AS shortcut
+            FROM entities
+            WHERE type = 'tool'
+        """
         params: List[Any] = []
 
         if active_only:
@@ -609,31 +879,19 @@ async def list_tools(
         params.append(limit)
 
         cur = conn.execute(query, params)
-        rows = cur.fetchall()
-        conn.close()
-
-        tools = []
-        for row in rows:
-            data = json.loads(row["data_json"])
-
-            # Build description from fallback chain:
-            # phenomenology → description → cognition.ready_at_hand
-            description = data.get("phenomenology") or data.get("description")
-            if not description and "cognition" in data:
-                description = data["cognition"].get("ready_at_hand")
-
-            tools.append(
-                ToolSummary(
-                    id=row["id"],
-                    title=data.get("title", row["id"]),
-                    handler=data.get("handler"),
-                    description=description,
-                    group=data.get("group", "CVM Tools"),
-                    shortcut=data.get("shortcut"),
-                )
+        tools = [
+            ToolSummary(
+                id=tool_id,
+                title=title,
+                handler=handler,
+                description=description,
+                group=group,
+                shortcut=shortcut,
             )
+            for tool_id, title, handler, description, group, shortcut in cur.fetchall()
+        ]
 
-        return ToolListResponse(tools=tools, count=len(tools))
+        return negotiate(request, response, ToolListResponse(tools=tools, count=len(tools)))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -641,6 +899,8 @@ async def list_tools(
 
 @app.get("/protocols", response_model=ProtocolListResponse)
 async def list_protocols(
+    request: Request,
+    response: Response,
     limit: int = Query(50, description="Maximum protocols to return"),
 ):
     """
@@ -649,16 +909,27 @@ async def list_protocols(
     Returns protocols with their title, description, and group for dynamic menu generation.
     Filters out internal protocols (marked with internal: true).
     Includes requires_inputs flag based on inputs_schema.
+    Served as msgpack on request (see negotiate()).
     """
     db_path = get_db_path()
 
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_read_conn(db_path)
 
-        # Build query - get protocol entities, exclude internal ones
+        # Build query - project the summary fields in SQLite and exclude
+        # internal protocols. Title falls back to the entity ID and group to
+        # the default when missing or empty; a protocol requires inputs when
+        # its inputs_schema lists required fields.
         query = """
-            SELECT id, type, data_json
+            SELECT
+                id,
+                COALESCE(NULLIF(json_extract(data_json, '$.title'), ''), id) AS title,
+                json_extract(data_json, '$.description') AS description,
+                COALESCE(
+                    NULLIF(json_extract(data_json, '$.group'), ''), 'CVM Protocols'
+                ) AS "group",
+                COALESCE(json_array_length(data_json, '$.inputs_schema.required'), 0) > 0
+                    AS requires_inputs
             FROM entities
             WHERE type = 'protocol'
               AND (json_extract(data_json, '$.internal') IS NULL
@@ -668,46 +939,20 @@ async def list_protocols(
         """
 
         cur = conn.execute(query, (limit,))
-        rows = cur.fetchall()
-        conn.close()
-
-        protocols = []
-        for row in rows:
-            data = json.loads(row["data_json"])
-
-            # Build description from data
-            description = data.get("description")
-
-            # Get title, fall back to entity ID if None or missing
-            title = data.get("title")
-            if not title:
-                title = row["id"]
-
-            # Determine if protocol requires inputs
-            # Check if inputs_schema has required fields
-            requires_inputs = False
-            inputs_schema = data.get("inputs_schema")
-            if inputs_schema and isinstance(inputs_schema, dict):
-                required = inputs_schema.get("required", [])
-                if required and len(required) > 0:
-                    requires_inputs = True
-
-            # Get group, fall back to default
-            group = data.get("group")
-            if not group:
-                group = "CVM Protocols"
-
-            protocols.append(
-                ProtocolSummary(
-                    id=row["id"],
-                    title=title,
-                    description=description,
-                    group=group,
-                    requires_inputs=requires_inputs,
-                )
+        protocols = [
+            ProtocolSummary(
+                id=protocol_id,
+                title=title,
+                description=description,
+                group=group,
+                requires_inputs=bool(requires_inputs),
             )
+            for protocol_id, title, description, group, requires_inputs in cur.fetchall()
+        ]
 
-        return ProtocolListResponse(protocols=protocols, count=len(protocols))
+        return negotiate(
+            request, response, ProtocolListResponse(protocols=protocols, count=len(protocols))
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -718,41 +963,66 @@ async def list_protocols(
 
 def get_layout_data(db_path: str) -> dict:
     """Get current layout from database, or return default."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    conn = get_read_conn(db_path)
     cur = conn.execute(
         "SELECT data_json FROM entities WHERE id = ?",
         (LAYOUT_ENTITY_ID,),
     )
     row = cur.fetchone()
-    conn.close()
 
     if row:
-        return json.loads(row["data_json"])
+        return _loads(row[0])
     return DEFAULT_LAYOUT.copy()
 
 
+# Compact seeds for the layout upsert (json() would minify them anyway)
+_DEFAULT_LAYOUT_JSON = json.dumps(DEFAULT_LAYOUT, separators=(",", ":"))
+_DEFAULT_PANELS_JSON = json.dumps(DEFAULT_LAYOUT["panels"], separators=(",", ":"))
+
+# Merge-patch (RFC 7396) the layout row in place, seeding it from the default
+# layout on first write and backfilling `panels` if an older row lacks it
+LAYOUT_UPSERT_SQL = """
+    INSERT INTO entities (id, type, data_json)
+    VALUES (?, 'pattern', json_patch(json(?), json(?)))
+    ON CONFLICT(id) DO UPDATE SET data_json = json_patch(
+        CASE WHEN json_type(data_json, '$.panels') IS NULL
+             THEN json_set(data_json, '$.panels', json(?))
+             ELSE data_json END,
+        json(?)
+    )
+"""
+
+
 def update_layout_data(db_path: str, updates: dict) -> dict:
     """Update layout entity with new values, creating if needed."""
-    current = get_layout_data(db_path)
-
-    # Apply updates
-    if "mode" in updates and updates["mode"]:
-        current["mode"] = updates["mode"]
-    if "panels" in updates and updates["panels"]:
-        for key, value in updates["panels"].items():
-            if "panels" not in current:
-                current["panels"] = DEFAULT_LAYOUT["panels"].copy()
-            current["panels"][key] = value
-
-    # Save to database
-    manifest_entity(
-        db_path=db_path,
-        entity_type="pattern",
-        entity_id=LAYOUT_ENTITY_ID,
-        data=current,
-    )
-    return current
+    patch: Dict[str, Any] = {}
+    if updates.get("mode"):
+        patch["mode"] = updates["mode"]
+    if updates.get("panels"):
+        patch["panels"] = updates["panels"]
+    patch_json = json.dumps(patch, separators=(",", ":"))
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                LAYOUT_UPSERT_SQL,
+                (
+                    LAYOUT_ENTITY_ID,
+                    _DEFAULT_LAYOUT_JSON,
+                    patch_json,
+                    _DEFAULT_PANELS_JSON,
+                    patch_json,
+                ),
+            )
+            # Same invalidation save_entity applies on any content change
+            conn.execute("DELETE FROM embeddings WHERE entity_id = ?", (LAYOUT_ENTITY_ID,))
+        (data_json,) = conn.execute(
+            "SELECT data_json FROM entities WHERE id = ?", (LAYOUT_ENTITY_ID,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return _loads(data_json)
 
 
 @app.get("/layout", response_model=LayoutResponse)
@@ -5,7 +5,7 @@ This module creates the principles, patterns, behaviors, and tools that encode
 build practices as structural governance in the Loom.
 
 The Build Bootstrap is idempotent - running twice will update existing entities
-rather than creating duplicates (upsert semantics from save_entity/save_bond).
+rather than creating duplicates (upsert semantics from save_entities/save_bonds).
 
 Usage:
     from chora_cvm.bootstrap.build import bootstrap_build_entities
@@ -13,10 +13,12 @@ Usage:
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from typing import Any, TypedDict
 
+from ..schema import GenericEntity
 from ..store import EventStore
-from ..std import manifest_entity
 
 
 @dataclass
@@ -47,7 +49,14 @@ class BuildBootstrapResult:
 # Entity Definitions
 # =============================================================================
 
-PRINCIPLES = [
+class EntityDefinition(TypedDict):
+    """One entity to manifest: its id, display title and type-specific data."""
+    id: str
+    title: str
+    data: dict[str, Any]
+
+
+PRINCIPLES: list[EntityDefinition] = [
     {
         "id": "principle-shift-left-quality",
         "title": "Shift-Left Quality",
@@ -90,7 +99,7 @@ PRINCIPLES = [
     },
 ]
 
-PATTERNS = [
+PATTERNS: list[EntityDefinition] = [
     {
         "id": "pattern-pre-commit-hooks",
         "title": "Pre-commit Hooks Pattern",
@@ -161,7 +170,7 @@ This makes build health visible to the Loom.""",
     },
 ]
 
-BEHAVIORS = [
+BEHAVIORS: list[EntityDefinition] = [
     {
         "id": "behavior-lint-passes",
         "title": "Lint passes",
@@ -236,7 +245,7 @@ BEHAVIORS = [
     },
 ]
 
-TOOLS = [
+TOOLS: list[EntityDefinition] = [
     {
         "id": "tool-lint",
         "title": "Lint",
@@ -317,14 +326,52 @@ BONDS = [
     ("verifies", "tool-security-scan", "behavior-security-scan-clean"),
 ]
 
+# Manifest order: (entity type, section header, definitions, result field)
+_SECTIONS = [
+    ("principle", "Principles (truths about building)", PRINCIPLES, "principles_created"),
+    ("pattern", "Patterns (reusable build forms)", PATTERNS, "patterns_created"),
+    ("behavior", "Behaviors (quality expectations)", BEHAVIORS, "behaviors_created"),
+    ("tool", "Tools (build operations)", TOOLS, "tools_created"),
+]
+
+# Entity rows resolved once at import: (entity type, section header,
+# result field, [(entity id, data with title merged in), ...])
+_MANIFEST_ROWS = [
+    (
+        entity_type,
+        header,
+        bucket,
+        [(e["id"], {"title": e["title"], **e["data"]}) for e in entries],
+    )
+    for entity_type, header, entries, bucket in _SECTIONS
+]
+
+# Bond ids are fixed by BONDS, so resolve them once at import
+BONDS_RESOLVED = [
+    (f"relationship-{verb}-{from_id}-{to_id}".replace("_", "-"), verb, from_id, to_id)
+    for verb, from_id, to_id in BONDS
+]
+
 
 # =============================================================================
 # Bootstrap Function
 # =============================================================================
 
+def _discard(line: str) -> None:
+    """Progress sink used when verbose output is off."""
+
+
+def _flush(lines: list[str]) -> None:
+    """Write buffered progress lines to stdout with a single write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 def bootstrap_build_entities(
     db_path: str,
     verbose: bool = True,
+    store: EventStore | None = None,
 ) -> BuildBootstrapResult:
     """
     Bootstrap build governance entities into the Loom.
@@ -338,131 +385,86 @@ def bootstrap_build_entities(
     Args:
         db_path: Path to the Loom database
         verbose: If True, print progress output
+        store: Optional open EventStore to reuse (left open for the caller)
 
     Returns:
         BuildBootstrapResult with summary of created entities and bonds
     """
     result = BuildBootstrapResult()
 
-    if verbose:
-        print("Build Governance Bootstrap")
-        print("=" * 60)
-        print()
-
-    # Manifest Principles
-    if verbose:
-        print("Principles (truths about building)")
-        print("-" * 40)
-    for p in PRINCIPLES:
-        manifest_entity(
-            db_path=db_path,
-            entity_type="principle",
-            entity_id=p["id"],
-            data={"title": p["title"], **p["data"]},
-        )
-        result.principles_created.append(p["id"])
-        if verbose:
-            print(f"  + {p['id']}")
-
-    if verbose:
-        print()
-
-    # Manifest Patterns
-    if verbose:
-        print("Patterns (reusable build forms)")
-        print("-" * 40)
-    for p in PATTERNS:
-        manifest_entity(
-            db_path=db_path,
-            entity_type="pattern",
-            entity_id=p["id"],
-            data={"title": p["title"], **p["data"]},
-        )
-        result.patterns_created.append(p["id"])
-        if verbose:
-            print(f"  + {p['id']}")
-
-    if verbose:
-        print()
-
-    # Manifest Behaviors
-    if verbose:
-        print("Behaviors (quality expectations)")
-        print("-" * 40)
-    for b in BEHAVIORS:
-        manifest_entity(
-            db_path=db_path,
-            entity_type="behavior",
-            entity_id=b["id"],
-            data={"title": b["title"], **b["data"]},
-        )
-        result.behaviors_created.append(b["id"])
-        if verbose:
-            print(f"  + {b['id']}")
-
-    if verbose:
-        print()
-
-    # Manifest Tools
-    if verbose:
-        print("Tools (build operations)")
-        print("-" * 40)
-    for t in TOOLS:
-        manifest_entity(
-            db_path=db_path,
-            entity_type="tool",
-            entity_id=t["id"],
-            data={"title": t["title"], **t["data"]},
-        )
-        result.tools_created.append(t["id"])
-        if verbose:
-            print(f"  + {t['id']}")
-
-    if verbose:
-        print()
-
-    # Create Bonds
-    if verbose:
-        print("Bonds (wiring the structure)")
-        print("-" * 40)
-
-    store = EventStore(db_path)
-    for verb, from_id, to_id in BONDS:
-        bond_id = f"relationship-{verb}-{from_id}-{to_id}".replace("_", "-")
-        try:
-            store.save_bond(
-                bond_id=bond_id,
-                bond_type=verb,
-                from_id=from_id,
-                to_id=to_id,
-                status="active",
-                confidence=1.0,
-                data={},
-            )
-            result.bonds_created.append(bond_id)
-            if verbose:
-                print(f"  {from_id} --{verb}--> {to_id}")
-        except Exception as e:
-            result.bonds_skipped.append(f"{bond_id}: {e}")
-            if verbose:
-                print(f"  SKIP {verb}: {from_id} -> {to_id} ({e})")
-
-    store.close()
+    # Progress lines are buffered and written in one go rather than printed
+    # line by line; with verbose off they are dropped at the source.
+    lines: list[str] = []
+    emit = lines.append if verbose else _discard
+
+    emit("Build Governance Bootstrap")
+    emit("=" * 60)
+    emit("")
+
+    # One store and one transaction for the whole bootstrap: every manifest
+    # and bond write shares the connection and commits once at the end.
+    should_close = store is None
+    if store is None:
+        store = EventStore(db_path)
+    try:
+        with store.transaction():
+            # Manifest principles, patterns, behaviors and tools as one batch
+            entities: list[GenericEntity] = []
+            for entity_type, header, bucket, rows in _MANIFEST_ROWS:
+                created = getattr(result, bucket)
+                emit(header)
+                emit("-" * 40)
+                for entity_id, data in rows:
+                    entities.append(GenericEntity(id=entity_id, type=entity_type, data=data))
+                    created.append(entity_id)
+                    emit(f"  + {entity_id}")
+                emit("")
+            store.save_entities(entities)
+
+            # Create Bonds
+            emit("Bonds (wiring the structure)")
+            emit("-" * 40)
+
+            # Duplicates are caught up front so the batch insert stays atomic
+            seen: set[str] = set()
+            bonds: list[dict] = []
+            for bond_id, verb, from_id, to_id in BONDS_RESOLVED:
+                if bond_id in seen:
+                    result.bonds_skipped.append(f"{bond_id}: duplicate")
+                    emit(f"  SKIP {verb}: {from_id} -> {to_id} (duplicate)")
+                    continue
+                seen.add(bond_id)
+                bonds.append({
+                    "bond_id": bond_id,
+                    "bond_type": verb,
+                    "from_id": from_id,
+                    "to_id": to_id,
+                    "status": "active",
+                    "confidence": 1.0,
+                    "data": {},
+                })
+                result.bonds_created.append(bond_id)
+                emit(f"  {from_id} --{verb}--> {to_id}")
+            store.save_bonds(bonds)
+    finally:
+        if should_close:
+            store.close()
+        _flush(lines)
 
     # Summary
-    if verbose:
-        print()
-        print("=" * 60)
-        print("BUILD GOVERNANCE ENTITIES BOOTSTRAPPED")
-        print("=" * 60)
-        print(f"  Principles: {len(result.principles_created)}")
-        print(f"  Patterns:   {len(result.patterns_created)}")
-        print(f"  Behaviors:  {len(result.behaviors_created)}")
-        print(f"  Tools:      {len(result.tools_created)}")
-        print(f"  Bonds:      {len(result.bonds_created)}")
-        if result.bonds_skipped:
-            print(f"  Skipped:    {len(result.bonds_skipped)}")
-        print()
-        print("Run 'just orient' to see build tools in cognitive compass")
-
+    emit("")
+    emit("=" * 60)
+    emit("BUILD GOVERNANCE ENTITIES BOOTSTRAPPED")
+    emit("=" * 60)
+    emit(f"  Principles: {len(result.principles_created)}")
+    emit(f"  Patterns:   {len(result.patterns_created)}")
+    emit(f"  Behaviors:  {len(result.behaviors_created)}")
+    emit(f"  Tools:      {len(result.tools_created)}")
+    emit(f"  Bonds:      {len(result.bonds_created)}")
+    if result.bonds_skipped:
+        emit(f"  Skipped:    {len(result.bonds_skipped)}")
+    emit("")
+    emit("Run 'just orient' to see build tools in cognitive compass")
+
+    _flush(lines)
     return result
@@ -15,15 +15,113 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from .kernel.engine import CvmEngine
-from .kernel.runner import execute_protocol
-from .kernel.store import EventStore
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Kernel modules are imported inside the commands that use them, so light
+# commands (context, login) don't pay for the engine and runner at startup.
+if TYPE_CHECKING:
+    from .kernel.engine import CvmEngine
+    from .kernel.store import EventStore
+
+# JSON codec for context.json and --input; orjson when installed, stdlib otherwise
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode context as indented JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _encode_json(obj: Any) -> bytes:
+    """
+    Encode a command result as two-space indented JSON bytes.
+
+    Uses orjson when installed. Datetimes and dataclasses are passed through
+    to default=str so they print as they did with json.dumps(default=str);
+    anything orjson rejects (e.g. integers beyond 64 bits) falls back to the
+    stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+def _format_json(obj: Any) -> str:
+    """Pretty-print a command result as two-space indented JSON."""
+    return _encode_json(obj).decode()
+
+
+def _write_json(obj: Any) -> None:
+    """
+    Write a (possibly large) result as JSON straight to stdout's byte stream.
+
+    Skips building an intermediate str and re-encoding it through the text
+    layer; falls back to print() when stdout has no binary buffer.
+    """
+    payload = _encode_json(obj)
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        print(payload.decode())
+        return
+    sys.stdout.flush()
+    stream.write(payload)
+    stream.write(b"\n")
+    stream.flush()
+
+
+# Box frame shared by the command banners, built once at import
+_BANNER_TOP = "╭" + "─" * 60 + "╮"
+_BANNER_BOTTOM = "╰" + "─" * 60 + "╯"
+
+
+def _banner(title: str) -> str:
+    """Framed command title, padded by a blank line above and below."""
+    return f"\n{_BANNER_TOP}\n│  {title:<58}│\n{_BANNER_BOTTOM}\n"
+
+
+class _Report:
+    """
+    Collects a command's report lines and writes them to stdout in one go.
+
+    Banner-heavy commands call the instance like print() and flush() before
+    returning, instead of paying a locked write per line. Errors still go
+    straight to stderr with print(..., file=sys.stderr).
+    """
+
+    __slots__ = ("_lines",)
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def __call__(self, line: str = "") -> None:
+        self._lines.append(line)
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
 
 
 # =============================================================================
@@ -35,19 +133,49 @@ def get_context_file() -> Path:
     return Path.cwd() / ".chora" / "context.json"
 
 
+# Parsed context per file, tagged with the (mtime_ns, size) it was read at
+_context_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _context_stamp(context_file: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for the context file, or None if it is missing."""
+    try:
+        st = context_file.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_context() -> Dict[str, Any]:
-    """Load context from .chora/context.json if it exists."""
+    """Load context from .chora/context.json if it exists.
+
+    The parsed file is cached until its mtime or size changes; callers get a
+    copy they are free to mutate.
+    """
     context_file = get_context_file()
-    if context_file.exists():
-        return json.loads(context_file.read_text())
-    return {}
+    stamp = _context_stamp(context_file)
+    if stamp is None:
+        return {}
+
+    cached = _context_cache.get(str(context_file))
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _loads(context_file.read_bytes()))
+        _context_cache[str(context_file)] = cached
+    return dict(cached[1])
 
 
 def save_context(context: Dict[str, Any]) -> None:
-    """Save context to .chora/context.json."""
+    """Save context to .chora/context.json.
+
+    Written to a sibling temp file and swapped in with os.replace, so readers
+    never see a half-written file.
+    """
     context_file = get_context_file()
     context_file.parent.mkdir(parents=True, exist_ok=True)
-    context_file.write_text(json.dumps(context, indent=2))
+    tmp_file = context_file.with_name(f".{context_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(_dumps(context))
+    os.replace(tmp_file, context_file)
+    _context_cache[str(context_file)] = (_context_stamp(context_file), dict(context))
 
 
 def resolve_persona(explicit: Optional[str], store: EventStore) -> Optional[str]:
@@ -72,20 +200,19 @@ def resolve_persona(explicit: Optional[str], store: EventStore) -> Optional[str]
     if context.get("persona_id"):
         return context["persona_id"]
 
-    # 4. Implicit fallback - query personas from DB
-    import sqlite3
-    conn = sqlite3.connect(store.path)
-    cur = conn.execute("SELECT id FROM entities WHERE type = 'persona'")
+    # 4. Implicit fallback - query personas through the store's connection.
+    # Not cached: engines outlive a single command, and personas can be
+    # created on the same store between resolutions.
+    # LIMIT 2 is enough to tell "exactly one" from "several"
+    cur = store._conn.execute("SELECT id FROM entities WHERE type = 'persona' LIMIT 2")
     personas = [row[0] for row in cur.fetchall()]
-    conn.close()
 
+    persona_id = None
     if len(personas) == 1:
-        return personas[0]
-    elif len(personas) > 1:
-        # Don't auto-select, let it be None
-        return None
+        persona_id = personas[0]
+    # More than one persona: don't auto-select, let it be None
 
-    return None
+    return persona_id
 
 
 def resolve_db_path(explicit: Optional[str]) -> str:
@@ -105,6 +232,62 @@ def resolve_db_path(explicit: Optional[str]) -> str:
     return str(Path.cwd() / "chora-cvm-manifest.db")
 
 
+def require_db(args: argparse.Namespace) -> str:
+    """
+    Resolve the command's database path and insist that it exists.
+
+    Prints the standard "Database not found" error and exits with status 1
+    when it is missing, so commands can start with a single line.
+    """
+    db_path = resolve_db_path(args.db)
+    # One stat on the plain string; a directory is not a usable database
+    if not os.path.isfile(db_path):
+        print(f"✗ Database not found: {db_path}", file=sys.stderr)
+        raise SystemExit(1)
+    return db_path
+
+
+def _fail_result(result: Any) -> int:
+    """
+    Report a failed dispatch or protocol result on stderr and return exit code 1.
+
+    Accepts both DispatchResult objects and the dict results returned by
+    execute_protocol, so every command surfaces errors the same way.
+    """
+    if isinstance(result, dict):
+        kind = result.get("error_kind", "Error")
+        message = result.get("error_message", "Unknown")
+    else:
+        kind, message = result.error_kind, result.error_message
+    print(f"✗ {kind}: {message}", file=sys.stderr)
+    return 1
+
+
+# One engine per database for the life of the process, so repeated commands
+# from a script or REPL share the hydrated registry and open store
+_engines: Dict[str, "CvmEngine"] = {}
+
+
+def get_engine(db_path: str) -> "CvmEngine":
+    """Get or create the shared CvmEngine for db_path."""
+    engine = _engines.get(db_path)
+    if engine is None:
+        from .kernel.engine import CvmEngine
+
+        engine = _engines[db_path] = CvmEngine(db_path)
+    return engine
+
+
+def close_engines() -> None:
+    """Close every shared engine; registered to run at interpreter exit."""
+    for engine in _engines.values():
+        engine.close()
+    _engines.clear()
+
+
+atexit.register(close_engines)
+
+
 # =============================================================================
 # Commands
 # =============================================================================
@@ -116,147 +299,138 @@ def cmd_dispatch(args: argparse.Namespace) -> int:
     This routes to protocols OR primitives through the same interface,
     demonstrating the Event Horizon pattern where all interfaces converge.
     """
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Parse inputs
     inputs: Dict[str, Any] = {}
     if args.input:
         try:
-            inputs = json.loads(args.input)
+            inputs = _loads(args.input)
         except json.JSONDecodeError as e:
             print(f"✗ Invalid JSON input: {e}", file=sys.stderr)
             return 1
 
-    # Resolve persona
-    store = EventStore(db_path)
-    persona_id = resolve_persona(getattr(args, "persona", None), store)
-    store.close()
-
-    # Use CvmEngine for dispatch
-    engine = CvmEngine(db_path)
-    try:
-        result = engine.dispatch(
-            intent=args.intent,
-            inputs=inputs,
-            output_sink=print,
-            persona_id=persona_id,
-        )
-    finally:
-        engine.close()
+    # Use CvmEngine for dispatch; persona resolution shares its store
+    engine = get_engine(db_path)
+    persona_id = resolve_persona(getattr(args, "persona", None), engine.store)
+    result = engine.dispatch(
+        intent=args.intent,
+        inputs=inputs,
+        output_sink=print,
+        persona_id=persona_id,
+    )
 
     if not result.ok:
-        print(f"✗ {result.error_kind}: {result.error_message}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     # Output result (protocols with ui_render will have already printed)
     if result.data and not result.data.get("rendered"):
-        print(json.dumps(result.data, indent=2, default=str))
+        print(_format_json(result.data))
 
     return 0
 
 
 def cmd_capabilities(args: argparse.Namespace) -> int:
     """List all available capabilities (protocols and primitives)."""
-    db_path = resolve_db_path(args.db)
+    from heapq import nsmallest
+    from operator import attrgetter
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    from .kernel.engine import CapabilityKind
 
-    engine = CvmEngine(db_path)
-    try:
-        capabilities = engine.list_capabilities()
-    finally:
-        engine.close()
+    db_path = require_db(args)
 
-    # Group by kind
-    protocols = [c for c in capabilities if c.kind.value == "protocol"]
-    primitives = [c for c in capabilities if c.kind.value == "primitive"]
+    engine = get_engine(db_path)
+    capabilities = engine.list_capabilities()
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  CVM Capabilities                                          │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    # Group by kind in one pass
+    protocols = []
+    primitives = []
+    for c in capabilities:
+        if c.kind is CapabilityKind.PROTOCOL:
+            protocols.append(c)
+        elif c.kind is CapabilityKind.PRIMITIVE:
+            primitives.append(c)
+    by_id = attrgetter("id")
+
+    out = _Report()
+    out(_banner("CVM Capabilities"))
 
-    print(f"  Protocols ({len(protocols)}):")
-    for p in sorted(protocols, key=lambda x: x.id):
+    out(f"  Protocols ({len(protocols)}):")
+    for p in sorted(protocols, key=by_id):
         short = p.id[9:] if p.id.startswith("protocol-") else p.id
-        print(f"    {short:30} {p.description[:40]}")
+        out(f"    {short:30} {p.description:.40}")
 
-    print()
-    print(f"  Primitives ({len(primitives)}):")
-    for p in sorted(primitives, key=lambda x: x.id)[:20]:  # Show first 20
-        print(f"    {p.id:30} {p.description[:40]}")
+    out()
+    out(f"  Primitives ({len(primitives)}):")
+    for p in nsmallest(20, primitives, key=by_id):  # Show first 20
+        out(f"    {p.id:30} {p.description:.40}")
 
     if len(primitives) > 20:
-        print(f"    ... and {len(primitives) - 20} more")
+        out(f"    ... and {len(primitives) - 20} more")
 
-    print()
+    out()
+    out.flush()
     return 0
 
 
 def cmd_invoke(args: argparse.Namespace) -> int:
     """Invoke a protocol."""
-    db_path = resolve_db_path(args.db)
+    from .kernel.runner import execute_protocol
+    from .kernel.store import EventStore
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Parse inputs
     inputs: Dict[str, Any] = {}
     if args.input:
         try:
-            inputs = json.loads(args.input)
+            inputs = _loads(args.input)
         except json.JSONDecodeError as e:
             print(f"✗ Invalid JSON input: {e}", file=sys.stderr)
             return 1
 
-    # Resolve persona
+    # One store serves persona resolution and synchronous execution
     store = EventStore(db_path)
-    persona_id = resolve_persona(args.persona, store)
-    store.close()
+    try:
+        persona_id = resolve_persona(args.persona, store)
 
-    # Async mode: enqueue for background execution
-    if getattr(args, "async_mode", False):
-        from .worker import enqueue_protocol
+        # Async mode: enqueue for background execution
+        if getattr(args, "async_mode", False):
+            from .worker import enqueue_protocol
 
-        task_id = enqueue_protocol(
+            task_id = enqueue_protocol(
+                db_path=db_path,
+                protocol_id=args.protocol_id,
+                inputs=inputs,
+                persona_id=persona_id,
+            )
+            print(f"✓ Protocol queued for async execution")
+            print(f"  Task ID: {task_id}")
+            print(f"  Check status: python -m chora_cvm.cli status {task_id}")
+            return 0
+
+        # Synchronous mode: execute immediately
+        # CLI explicitly routes output to stdout via the I/O Membrane
+        result = execute_protocol(
             db_path=db_path,
             protocol_id=args.protocol_id,
             inputs=inputs,
             persona_id=persona_id,
+            state_id=args.state_id,
+            output_sink=print,
+            store=store,
         )
-        print(f"✓ Protocol queued for async execution")
-        print(f"  Task ID: {task_id}")
-        print(f"  Check status: python -m chora_cvm.cli status {task_id}")
-        return 0
-
-    # Synchronous mode: execute immediately
-    # CLI explicitly routes output to stdout via the I/O Membrane
-    result = execute_protocol(
-        db_path=db_path,
-        protocol_id=args.protocol_id,
-        inputs=inputs,
-        persona_id=persona_id,
-        state_id=args.state_id,
-        output_sink=print,
-    )
+    finally:
+        store.close()
 
     # Handle errors
     if result.get("status") == "error":
-        print(f"✗ {result.get('error_kind', 'Error')}: {result.get('error_message', 'Unknown')}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     # Output result (protocols with ui_render will have already printed)
     # For protocols that return data without rendering, output JSON
     if result and not result.get("rendered"):
-        print(json.dumps(result, indent=2, default=str))
+        print(_format_json(result))
 
     return 0
 
@@ -275,11 +449,7 @@ def cmd_context(args: argparse.Namespace) -> int:
     context = load_context()
     db_path = resolve_db_path(args.db if hasattr(args, "db") else None)
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  CVM Context                                               │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("CVM Context"))
     print(f"  Database: {db_path}")
     print(f"  Persona:  {context.get('persona_id', '(not set)')}")
     print(f"  Circle:   {context.get('circle_id', '(not set)')}")
@@ -314,11 +484,7 @@ def cmd_status(args: argparse.Namespace) -> int:
         print(f"✗ Task not found: {args.task_id}", file=sys.stderr)
         return 1
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Task Status                                               │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("Task Status"))
     print(f"  Task ID:    {status['task_id']}")
     print(f"  Protocol:   {status['protocol_id']}")
     print(f"  Status:     {status['status']}")
@@ -335,7 +501,7 @@ def cmd_status(args: argparse.Namespace) -> int:
 
     if status.get("result") and status["status"] == "completed":
         print("  Result:")
-        print(json.dumps(status["result"], indent=4, default=str))
+        _write_json(status["result"])
         print()
 
     return 0
@@ -348,28 +514,25 @@ def cmd_pulse_status(args: argparse.Namespace) -> int:
     worker_db = get_worker_db_path()
     status = get_pulse_status(worker_db, limit=args.limit)
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Pulse Status (Last {} heartbeats){}│".format(
-        args.limit,
-        " " * (26 - len(str(args.limit)))
-    ))
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    out = _Report()
+    out(_banner(f"Pulse Status (Last {args.limit} heartbeats)"))
 
     pulses = status.get("pulses", [])
     if not pulses:
-        print("  No pulse history yet.")
-        print()
+        out("  No pulse history yet.")
+        out()
+        out.flush()
         return 0
 
     # Header
-    print("  Time       │ Found │ Processed │ Protocols │ Errors")
-    print("  ───────────┼───────┼───────────┼───────────┼────────")
+    out("  Time       │ Found │ Processed │ Protocols │ Errors")
+    out("  ───────────┼───────┼───────────┼───────────┼────────")
 
     for pulse in pulses:
-        # Extract time portion from ISO timestamp
-        pulse_time = pulse["pulse_at"].split("T")[1][:8] if "T" in pulse["pulse_at"] else pulse["pulse_at"][:8]
+        # Extract time portion from ISO timestamp by slicing, not splitting
+        pulse_at = pulse["pulse_at"]
+        t = pulse_at.find("T")
+        pulse_time = pulse_at[t + 1:t + 9] if t >= 0 else pulse_at[:8]
         found = pulse["signals_found"]
         processed = pulse["signals_processed"]
         protocols = pulse["protocols_triggered"]
@@ -378,12 +541,13 @@ def cmd_pulse_status(args: argparse.Namespace) -> int:
         # Format with error indicator
         error_str = str(errors) if errors == 0 else f"*{errors}*"
 
-        print(f"  {pulse_time}  │  {found:3d}  │    {processed:3d}    │    {protocols:3d}    │  {error_str}")
+        out(f"  {pulse_time}  │  {found:3d}  │    {processed:3d}    │    {protocols:3d}    │  {error_str}")
 
-    print()
-    print(f"  Total pulses recorded: {status['total_pulses']}")
-    print()
+    out()
+    out(f"  Total pulses recorded: {status['total_pulses']}")
+    out()
 
+    out.flush()
     return 0
 
 
@@ -391,19 +555,11 @@ def cmd_pulse_preview(args: argparse.Namespace) -> int:
     """Preview what the next pulse would process."""
     from .std import pulse_preview
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     preview = pulse_preview(db_path, limit=args.limit)
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Pulse Preview                                             │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("Pulse Preview"))
 
     would_process = preview.get("would_process", [])
     signals_without = preview.get("signals_without_triggers", 0)
@@ -434,63 +590,72 @@ def cmd_integrity(args: argparse.Namespace) -> int:
     """Check system integrity - verify behaviors have tests and they pass."""
     from .std import integrity_discover_scenarios, integrity_report
 
-    db_path = resolve_db_path(args.db)
+    db_path = require_db(args)
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
-
-    features_dir = args.features_dir or str(Path(__file__).parent.parent.parent.parent / "tests" / "features")
+    features_dir = (
+        Path(args.features_dir)
+        if args.features_dir
+        else Path(__file__).resolve().parents[3] / "tests" / "features"
+    )
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  System Integrity Check                                    │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    out = _Report()
+    out(_banner("System Integrity Check"))
 
     # Discover scenarios
     discovery = integrity_discover_scenarios(db_path, features_dir)
     behaviors = discovery["behaviors"]
 
     if not behaviors:
-        print("  No behaviors found in database.")
-        print()
+        out("  No behaviors found in database.")
+        out()
+        out.flush()
         return 0
 
-    # Count statuses
-    verified = sum(1 for b in behaviors.values() if b.get("has_scenarios"))
-    unverified = sum(1 for b in behaviors.values() if not b.get("has_scenarios"))
+    # Bucket behaviors by scenario coverage in one pass
+    verified_items = []
+    unverified_items = []
+    for bid, bdata in behaviors.items():
+        if bdata.get("has_scenarios"):
+            verified_items.append((bid, bdata))
+        else:
+            unverified_items.append(bid)
+    verified = len(verified_items)
+    unverified = len(unverified_items)
     total = len(behaviors)
-    coverage = int((verified / total) * 100) if total > 0 else 0
+    coverage = (verified * 100) // total if total > 0 else 0
 
     # Show summary
-    print(f"  Behaviors: {total}")
-    print(f"  With scenarios: {verified}")
-    print(f"  Without scenarios: {unverified}")
-    print(f"  Coverage: {coverage}%")
-    print()
+    out(f"  Behaviors: {total}")
+    out(f"  With scenarios: {verified}")
+    out(f"  Without scenarios: {unverified}")
+    out(f"  Coverage: {coverage}%")
+    out()
 
     # Show behaviors with scenarios
-    if verified > 0:
-        print("  ✓ Behaviors with test scenarios:")
-        for bid, bdata in behaviors.items():
-            if bdata.get("has_scenarios"):
-                feature = bdata.get("feature_file", "unknown")
-                print(f"    • {bid}")
-                print(f"      → {feature}")
-        print()
+    if verified_items:
+        out("  ✓ Behaviors with test scenarios:")
+        for bid, bdata in verified_items:
+            feature = bdata.get("feature_file", "unknown")
+            out(f"    • {bid}")
+            out(f"      → {feature}")
+        out()
 
     # Show behaviors without scenarios
-    if unverified > 0:
-        print("  ⚠ Behaviors without test scenarios:")
-        for bid, bdata in behaviors.items():
-            if not bdata.get("has_scenarios"):
-                print(f"    • {bid}")
-        print()
+    if unverified_items:
+        out("  ⚠ Behaviors without test scenarios:")
+        for bid in unverified_items:
+            out(f"    • {bid}")
+        out()
 
+    out.flush()
     return 0
 
 
+def _tool_ids(tools: list, limit: int = 10) -> list:
+    """First `limit` tool ids from a prune list of id strings or {"id": ...} dicts."""
+    return [tool["id"] if isinstance(tool, dict) else tool for tool in tools[:limit]]
+
+
 def cmd_prune_via_protocol(args: argparse.Namespace) -> int:
     """
     Prune detection via CvmEngine protocol dispatch.
@@ -498,34 +663,22 @@ def cmd_prune_via_protocol(args: argparse.Namespace) -> int:
     This is the Phase 2 migration path - routing through protocol-prune-detect
     instead of the legacy prune.py functions.
     """
-    db_path = resolve_db_path(args.db)
+    db_path = require_db(args)
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
-
-    engine = CvmEngine(db_path)
-    try:
-        result = engine.dispatch(
-            "prune-detect",
-            {"db_path": db_path},
-            output_sink=print,
-        )
-    finally:
-        engine.close()
+    engine = get_engine(db_path)
+    result = engine.dispatch(
+        "prune-detect",
+        {"db_path": db_path},
+        output_sink=print,
+    )
 
     if not result.ok:
-        print(f"✗ {result.error_kind}: {result.error_message}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     # Format output
     data = result.data.get("data", result.data)
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Prune Detect (via Protocol)                               │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("Prune Detect (via Protocol)"))
 
     orphans = data.get("orphan_tools", [])
     deprecated = data.get("deprecated_tools", [])
@@ -537,8 +690,7 @@ def cmd_prune_via_protocol(args: argparse.Namespace) -> int:
 
     if orphans:
         print("  Orphan Tools:")
-        for tool in orphans[:10]:
-            tool_id = tool["id"] if isinstance(tool, dict) else tool
+        for tool_id in _tool_ids(orphans):
             print(f"    • {tool_id}")
         if len(orphans) > 10:
             print(f"    ... and {len(orphans) - 10} more")
@@ -546,8 +698,7 @@ def cmd_prune_via_protocol(args: argparse.Namespace) -> int:
 
     if deprecated:
         print("  Deprecated Tools:")
-        for tool in deprecated[:10]:
-            tool_id = tool["id"] if isinstance(tool, dict) else tool
+        for tool_id in _tool_ids(deprecated):
             print(f"    • {tool_id}")
         print()
 
@@ -561,34 +712,23 @@ def cmd_rhythm(args: argparse.Namespace) -> int:
     Sense the system's current kairotic state, satiation level,
     and temporal health metrics through the protocol-sense-rhythm.
     """
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
-    engine = CvmEngine(db_path)
-    try:
-        result = engine.dispatch(
-            "sense-rhythm",
-            {"db_path": db_path},
-            output_sink=print,
-        )
-    finally:
-        engine.close()
+    engine = get_engine(db_path)
+    result = engine.dispatch(
+        "sense-rhythm",
+        {"db_path": db_path},
+        output_sink=print,
+    )
 
     if not result.ok:
-        print(f"✗ {result.error_kind}: {result.error_message}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
+    out = _Report()
     # Format output
     data = result.data.get("data", result.data)
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Rhythm: Kairotic Phase Detection (via Protocol)          │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    out(_banner("Rhythm: Kairotic Phase Detection (via Protocol)"))
 
     # Kairotic state
     kairotic = data.get("kairotic", {})
@@ -596,20 +736,24 @@ def cmd_rhythm(args: argparse.Namespace) -> int:
     dominant = kairotic.get("dominant", "unknown")
     side = kairotic.get("side", "unknown")
 
-    print(f"  System Phase: {dominant.upper()} ({side} side)")
-    print()
-    print("  Phase Weights:")
-    print(f"    Pioneer:    {phases.get('pioneer', 0):.2f} │ Steward:   {phases.get('steward', 0):.2f}")
-    print(f"    Cultivator: {phases.get('cultivator', 0):.2f} │ Curator:   {phases.get('curator', 0):.2f}")
-    print(f"    Regulator:  {phases.get('regulator', 0):.2f} │ Scout:     {phases.get('scout', 0):.2f}")
-    print()
+    out(f"  System Phase: {dominant.upper()} ({side} side)")
+    out()
+    out("  Phase Weights:")
+    weight = phases.get
+    pioneer, steward = weight("pioneer", 0), weight("steward", 0)
+    cultivator, curator = weight("cultivator", 0), weight("curator", 0)
+    regulator, scout = weight("regulator", 0), weight("scout", 0)
+    out(f"    Pioneer:    {pioneer:.2f} │ Steward:   {steward:.2f}")
+    out(f"    Cultivator: {cultivator:.2f} │ Curator:   {curator:.2f}")
+    out(f"    Regulator:  {regulator:.2f} │ Scout:     {scout:.2f}")
+    out()
 
     # Satiation
     satiation = data.get("satiation", {})
     score = satiation.get("score", 0.0)
     label = satiation.get("label", "unknown")
-    print(f"  Satiation: {score:.2f} ({label})")
-    print()
+    out(f"  Satiation: {score:.2f} ({label})")
+    out()
 
     # Temporal health
     health = data.get("health", {})
@@ -617,16 +761,18 @@ def cmd_rhythm(args: argparse.Namespace) -> int:
     metabolic_balance = health.get("metabolic_balance", 0.0)
     metrics = health.get("metrics", {})
 
-    print(f"  Growth Rate:       {growth_rate:+.1f} entities/week")
-    print(f"  Metabolic Balance: {metabolic_balance:.1f} (anabolic / catabolic)")
-    print()
-    print("  Recent Activity (7 days):")
-    print(f"    Entities created:   {metrics.get('entities_created', 0)}")
-    print(f"    Bonds created:      {metrics.get('bonds_created', 0)}")
-    print(f"    Learnings captured: {metrics.get('learnings_captured', 0)}")
-    print(f"    Entities composted: {metrics.get('entities_composted', 0)}")
-    print()
-
+    out(f"  Growth Rate:       {growth_rate:+.1f} entities/week")
+    out(f"  Metabolic Balance: {metabolic_balance:.1f} (anabolic / catabolic)")
+    out()
+    out("  Recent Activity (7 days):")
+    metric = metrics.get
+    out(f"    Entities created:   {metric('entities_created', 0)}")
+    out(f"    Bonds created:      {metric('bonds_created', 0)}")
+    out(f"    Learnings captured: {metric('learnings_captured', 0)}")
+    out(f"    Entities composted: {metric('entities_composted', 0)}")
+    out()
+
+    out.flush()
     return 0
 
 
@@ -639,103 +785,96 @@ def cmd_prune(args: argparse.Namespace) -> int:
     - Broken handlers (code not found)
     - Dark matter (code without entities)
     """
-    db_path = resolve_db_path(args.db)
-
-    # New protocol path (Phase 2 migration)
+    # New protocol path (Phase 2 migration); it checks the database itself
     if getattr(args, "via_protocol", False):
         return cmd_prune_via_protocol(args)
 
-    from .prune import detect_prunable, emit_prune_signals, propose_prune
+    db_path = require_db(args)
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    from .prune import detect_prunable, emit_prune_signals, propose_prune
 
+    out = _Report()
     # Determine src_dir (chora_cvm package location)
     src_dir = Path(__file__).parent
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Prune: Physics-Driven Code Lifecycle                      │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    out(_banner("Prune: Physics-Driven Code Lifecycle"))
 
     if args.dry_run:
-        print("  [DRY RUN - no signals/focuses will be created]")
-        print()
+        out("  [DRY RUN - no signals/focuses will be created]")
+        out()
 
     # Phase 1: Detect
-    print("  Detection Phase")
-    print("  ───────────────────────────────────────────────")
+    out("  Detection Phase")
+    out("  ───────────────────────────────────────────────")
     report = detect_prunable(db_path, src_dir)
 
-    print(f"    Orphan tools:       {len(report.orphan_tools)}")
-    print(f"    Deprecated tools:   {len(report.deprecated_tools)}")
-    print(f"    Broken handlers:    {len(report.broken_handlers)}")
-    print(f"    Dark matter:        {len(report.dark_matter)}")
-    print()
+    out(f"    Orphan tools:       {len(report.orphan_tools)}")
+    out(f"    Deprecated tools:   {len(report.deprecated_tools)}")
+    out(f"    Broken handlers:    {len(report.broken_handlers)}")
+    out(f"    Dark matter:        {len(report.dark_matter)}")
+    out()
 
     # Show details if any found
     if report.orphan_tools:
-        print("  Orphan Tools (no behavior implements them):")
+        out("  Orphan Tools (no behavior implements them):")
         for tool in report.orphan_tools[:10]:
-            print(f"    • {tool.id}")
+            out(f"    • {tool.id}")
             if tool.handler:
-                print(f"      handler: {tool.handler}")
+                out(f"      handler: {tool.handler}")
         if len(report.orphan_tools) > 10:
-            print(f"    ... and {len(report.orphan_tools) - 10} more")
-        print()
+            out(f"    ... and {len(report.orphan_tools) - 10} more")
+        out()
 
     if report.deprecated_tools:
-        print("  Deprecated Tools (marked for removal):")
+        out("  Deprecated Tools (marked for removal):")
         for tool in report.deprecated_tools:
-            print(f"    • {tool.id}")
+            out(f"    • {tool.id}")
             if tool.reason:
-                print(f"      reason: {tool.reason}")
-        print()
+                out(f"      reason: {tool.reason}")
+        out()
 
     if report.broken_handlers:
-        print("  Broken Handlers (code not found):")
+        out("  Broken Handlers (code not found):")
         for tool in report.broken_handlers:
-            print(f"    • {tool.id}")
-            print(f"      handler: {tool.handler}")
-        print()
+            out(f"    • {tool.id}")
+            out(f"      handler: {tool.handler}")
+        out()
 
     if report.dark_matter:
-        print("  Dark Matter (code without entities):")
+        out("  Dark Matter (code without entities):")
         for dm in report.dark_matter[:10]:
-            print(f"    • {dm['name']} ({dm['file']}:{dm['line']})")
+            out(f"    • {dm['name']} ({dm['file']}:{dm['line']})")
         if len(report.dark_matter) > 10:
-            print(f"    ... and {len(report.dark_matter) - 10} more")
-        print()
+            out(f"    ... and {len(report.dark_matter) - 10} more")
+        out()
 
     # Phase 2: Emit signals or propose focuses
     if args.propose:
-        print("  Proposal Phase (creating Focus entities)")
-        print("  ───────────────────────────────────────────────")
+        out("  Proposal Phase (creating Focus entities)")
+        out("  ───────────────────────────────────────────────")
         focuses = propose_prune(db_path, report, dry_run=args.dry_run)
 
         if focuses:
             for focus in focuses:
-                print(f"    + {focus['id']}: {focus['category']}")
-            print()
+                out(f"    + {focus['id']}: {focus['category']}")
+            out()
             if not args.dry_run:
-                print("  To approve: just prune-approve <focus-id>")
-                print("  To reject:  just prune-reject <focus-id> <reason>")
+                out("  To approve: just prune-approve <focus-id>")
+                out("  To reject:  just prune-reject <focus-id> <reason>")
         else:
-            print("    (no items require approval)")
-        print()
+            out("    (no items require approval)")
+        out()
     else:
-        print("  Signal Phase (emitting for threshold breaches)")
-        print("  ───────────────────────────────────────────────")
+        out("  Signal Phase (emitting for threshold breaches)")
+        out("  ───────────────────────────────────────────────")
         signals = emit_prune_signals(db_path, report, dry_run=args.dry_run)
 
         if signals:
             for sig in signals:
-                print(f"    + {sig['id']}: {sig['category']} (count={sig['count']})")
+                out(f"    + {sig['id']}: {sig['category']} (count={sig['count']})")
         else:
-            print("    (no threshold breaches)")
-        print()
+            out("    (no threshold breaches)")
+        out()
 
     # Summary
     total_prunable = (
@@ -744,11 +883,12 @@ def cmd_prune(args: argparse.Namespace) -> int:
         len(report.broken_handlers)
     )
 
-    print("  ───────────────────────────────────────────────")
-    print(f"  Total prunable entities:  {total_prunable}")
-    print(f"  Dark matter functions:    {len(report.dark_matter)}")
-    print()
+    out("  ───────────────────────────────────────────────")
+    out(f"  Total prunable entities:  {total_prunable}")
+    out(f"  Dark matter functions:    {len(report.dark_matter)}")
+    out()
 
+    out.flush()
     return 0
 
 
@@ -762,11 +902,7 @@ def cmd_prune_approve(args: argparse.Namespace) -> int:
     """
     from .prune import prune_approve
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print()
     print("  Prune Approve: Finalize Entity Removal")
@@ -805,11 +941,7 @@ def cmd_prune_reject(args: argparse.Namespace) -> int:
     """
     from .prune import prune_reject
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     reason = getattr(args, 'reason', None)
 
@@ -850,11 +982,7 @@ def cmd_bond(args: argparse.Namespace) -> int:
     """
     from .std import manage_bond
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     result = manage_bond(
         db_path=db_path,
@@ -884,11 +1012,7 @@ def cmd_entropy(args: argparse.Namespace) -> int:
     """Entropy: Report system metabolic health."""
     from .kernel.runner import execute_protocol
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Invoke protocol-sense-entropy via VM
     # CLI explicitly routes output to stdout via the I/O Membrane
@@ -901,8 +1025,7 @@ def cmd_entropy(args: argparse.Namespace) -> int:
 
     # Handle protocol errors
     if result.get("status") == "error":
-        print(f"✗ {result.get('error_kind', 'Error')}: {result.get('error_message', 'Unknown')}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     health = result.get("health", {})
     signals = result.get("signals_emitted", [])
@@ -933,11 +1056,7 @@ def cmd_digest(args: argparse.Namespace) -> int:
     """Digest: Transform an entity into a learning."""
     from .kernel.runner import execute_protocol
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Invoke protocol-digest via VM
     # CLI explicitly routes output to stdout via the I/O Membrane
@@ -950,8 +1069,7 @@ def cmd_digest(args: argparse.Namespace) -> int:
 
     # Handle protocol errors
     if result.get("status") == "error":
-        print(f"✗ {result.get('error_kind', 'Error')}: {result.get('error_message', 'Unknown')}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     if "error" in result:
         print(f"✗ {result['error']}", file=sys.stderr)
@@ -967,9 +1085,8 @@ def cmd_digest(args: argparse.Namespace) -> int:
     print()
     wisdom = result.get("wisdom", {})
     insight = wisdom.get('insight', '')
-    if insight and len(insight) > 80:
-        insight = insight[:80] + "..."
-    print(f"    Insight:    {insight}")
+    ellipsis = "..." if insight and len(insight) > 80 else ""
+    print(f"    Insight:    {insight!s:.80}{ellipsis}")
     print(f"    Domain:     {wisdom.get('domain')}")
     print()
 
@@ -980,11 +1097,7 @@ def cmd_compost(args: argparse.Namespace) -> int:
     """Compost: Archive an orphan entity."""
     from .metabolic import compost
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     result = compost(db_path, args.entity_id, force=args.force)
 
@@ -1013,11 +1126,7 @@ def cmd_induce(args: argparse.Namespace) -> int:
     """Induce: Propose a pattern from clustered learnings."""
     from .kernel.runner import execute_protocol
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     if len(args.learning_ids) < 3:
         print("✗ Minimum 3 learnings required for pattern induction.", file=sys.stderr)
@@ -1034,8 +1143,7 @@ def cmd_induce(args: argparse.Namespace) -> int:
 
     # Handle protocol errors
     if result.get("status") == "error":
-        print(f"✗ {result.get('error_kind', 'Error')}: {result.get('error_message', 'Unknown')}", file=sys.stderr)
-        return 1
+        return _fail_result(result)
 
     if "error" in result:
         print(f"✗ {result['error']}", file=sys.stderr)
@@ -1067,11 +1175,7 @@ def cmd_reflex_build(args: argparse.Namespace) -> int:
     """
     from .reflex.build import run_build_reflex, PYTHON_PACKAGES
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Parse packages
     packages = [args.package] if args.package else None
@@ -1105,22 +1209,20 @@ def cmd_bootstrap_build(args: argparse.Namespace) -> int:
     from .genesis_build import bootstrap_build_governance
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
+    db_path = require_db(args)
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
-
-    # Bootstrap build governance entities (principles, patterns, behaviors, tools)
-    result = bootstrap_build_entities(
-        db_path=db_path,
-        verbose=True,
-    )
-
-    # Bootstrap build primitives and protocol
-    print()
+    # One store serves both bootstraps: entities/bonds, then primitives/protocol
     store = EventStore(db_path)
     try:
+        # Bootstrap build governance entities (principles, patterns, behaviors, tools)
+        result = bootstrap_build_entities(
+            db_path=db_path,
+            verbose=True,
+            store=store,
+        )
+
+        # Bootstrap build primitives and protocol
+        print()
         governance_result = bootstrap_build_governance(store, verbose=True)
     finally:
         store.close()
@@ -1188,11 +1290,7 @@ def cmd_create(args: argparse.Namespace) -> int:
     import re
     from .std import manifest_entity
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Parse data JSON
     try:
@@ -1250,11 +1348,7 @@ def cmd_garden(args: argparse.Namespace) -> int:
     from .semantic import suggest_bonds
     from .std import manifest_entity, manage_bond
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     confidence_threshold = args.confidence
     dry_run = args.dry_run
@@ -1409,11 +1503,7 @@ def cmd_horizon(args: argparse.Namespace) -> int:
     """Horizon: What wants attention (unverified tools near recent learnings)."""
     from .kernel.runner import execute_protocol
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # CLI explicitly routes output to stdout via the I/O Membrane
     result = execute_protocol(
@@ -1480,11 +1570,7 @@ def cmd_reflex_arc(args: argparse.Namespace) -> int:
     from .std import manifest_entity
     from .metabolic import detect_stagnation, check_void_resolution
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     dry_run = args.dry_run
 
@@ -1638,11 +1724,7 @@ def cmd_search(args: argparse.Namespace) -> int:
     """Semantic search across the Loom."""
     from .semantic import semantic_search
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     result = semantic_search(
         db_path=db_path,
@@ -1686,11 +1768,7 @@ def cmd_confidence(args: argparse.Namespace) -> int:
     """Update the confidence of an existing bond."""
     from .std import update_bond_confidence
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     result = update_bond_confidence(
         db_path=db_path,
@@ -1963,7 +2041,7 @@ def cmd_harvest_legacy(args: argparse.Namespace) -> int:
     for config in configs:
         repo_path = config.get_absolute_path(workspace_root)
         exists = "✓" if repo_path.exists() else "✗"
-        print(f"    {exists} {config.name:<25} priority={config.priority:>2}  {config.description[:50]}")
+        print(f"    {exists} {config.name:<25} priority={config.priority:>2}  {config.description:.50}")
     print()
 
     harvester = LegacyHarvester(db_path, configs, workspace_root)
@@ -2150,7 +2228,7 @@ def cmd_harvest_plans(args: argparse.Namespace) -> int:
 
     for filepath in md_files:
         result = harvest_file(conn, str(filepath))
-        print(f"    ✓ {result['filename'][:40]:<40} | {result['chunks']:>3} chunks | {result['lines']:>5} lines")
+        print(f"    ✓ {result['filename']:<40.40} | {result['chunks']:>3} chunks | {result['lines']:>5} lines")
         total_chunks += result['chunks']
         total_lines += result['lines']
 
@@ -2504,11 +2582,7 @@ def cmd_orient(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Booting CVM for Orient vNext using {db_path}...")
     store = EventStore(db_path)
@@ -2610,16 +2684,13 @@ def cmd_teach(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
     entity_id = args.entity_id
 
     if not entity_id:
         print("Usage: cvm teach <entity_id> [--db path]", file=sys.stderr)
         return 1
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Teaching entity {entity_id} from {db_path}...")
     store = EventStore(db_path)
@@ -2677,11 +2748,7 @@ def cmd_circle_orient(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     # Resolve repo root (workspace directory)
     repo_root = Path.cwd()
@@ -2768,11 +2835,7 @@ def cmd_manifest_circle(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     repo_root = Path.cwd()
     circle_id = "circle-chora-workspace"
@@ -2859,11 +2922,7 @@ def cmd_bootstrap_physics(args: argparse.Namespace) -> int:
     from .schema import GenericEntity
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Physics Genesis: Crystallizing Laws of Nature into {db_path}...")
 
@@ -2925,11 +2984,7 @@ def cmd_bootstrap_circle_orient(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Manifesting protocol-circle-orient into {db_path}...")
     store = EventStore(db_path)
@@ -2995,11 +3050,7 @@ def cmd_semantic_setup(args: argparse.Namespace) -> int:
     )
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Setting up semantic primitives and protocols in {db_path}...")
     store = EventStore(db_path)
@@ -3079,11 +3130,7 @@ def cmd_docs_setup(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Setting up docs/teach primitives in {db_path}...")
     store = EventStore(db_path)
@@ -3152,11 +3199,7 @@ def cmd_docs_check(args: argparse.Namespace) -> int:
     from . import std as cvm_std
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Checking Diataxis completeness for tools in {db_path}...")
     store = EventStore(db_path)
@@ -3186,13 +3229,9 @@ def cmd_docs_generate(args: argparse.Namespace) -> int:
     from . import std as cvm_std
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
+    db_path = require_db(args)
     rel_output = args.output or "docs/loom.md"
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
-
     repo_root = Path.cwd()
     base_dir = str(repo_root)
     print(f"[*] Generating Loom docs into {rel_output}...")
@@ -3229,11 +3268,7 @@ def cmd_docs_core(args: argparse.Namespace) -> int:
     from .store import EventStore
     from .vm import ProtocolVM
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Manifesting core docs into {db_path}...")
     store = EventStore(db_path)
@@ -3303,11 +3338,7 @@ def cmd_whoami(args: argparse.Namespace) -> int:
     import json as json_lib
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     print(f"[*] Reading personas from {db_path}...")
     store = EventStore(db_path)
@@ -3348,11 +3379,7 @@ def cmd_provenance_audit(args: argparse.Namespace) -> int:
     import json as json_lib
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     store = EventStore(db_path)
 
@@ -3428,11 +3455,7 @@ def cmd_provenance_audit(args: argparse.Namespace) -> int:
     total = len(tools)
 
     # Output
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Tool Provenance Audit                                     │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("Tool Provenance Audit"))
 
     # Summary
     print(f"  Total tools: {total}")
@@ -3454,8 +3477,7 @@ def cmd_provenance_audit(args: argparse.Namespace) -> int:
             verf = "✓" if r["verifies"] else "✗"
             orig = "✓" if r["origin"] else "✗"
             cog = "✓" if r["cognition"] else "✗"
-            name = r["id"][:38].ljust(38)
-            print(f"  │ {name}  {impl}    {verf}    {orig}    {cog}  │")
+            print(f"  │ {r['id']:<38.38}  {impl}    {verf}    {orig}    {cog}  │")
         print("  └─────────────────────────────────────────────────────────┘")
         print()
 
@@ -3495,13 +3517,9 @@ def cmd_provenance_check(args: argparse.Namespace) -> int:
     import json as json_lib
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
+    db_path = require_db(args)
     tool_id = args.tool_id
 
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
-
     store = EventStore(db_path)
 
     # Get tool
@@ -3611,11 +3629,7 @@ def cmd_provenance_heal(args: argparse.Namespace) -> int:
     import json as json_lib
     from .store import EventStore
 
-    db_path = resolve_db_path(args.db)
-
-    if not Path(db_path).exists():
-        print(f"✗ Database not found: {db_path}", file=sys.stderr)
-        return 1
+    db_path = require_db(args)
 
     store = EventStore(db_path)
 
@@ -3664,11 +3678,7 @@ def cmd_provenance_heal(args: argparse.Namespace) -> int:
 
     store.close()
 
-    print()
-    print("╭────────────────────────────────────────────────────────────╮")
-    print("│  Provenance Heal - Suggested Fixes                         │")
-    print("╰────────────────────────────────────────────────────────────╯")
-    print()
+    print(_banner("Provenance Heal - Suggested Fixes"))
 
     # Prioritize by category
     if args.category == "origin" or not args.category:
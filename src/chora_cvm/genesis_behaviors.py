@@ -618,10 +618,8 @@ def bootstrap_behaviors(store: EventStore, verbose: bool = True) -> list[str]:
 
     Returns list of created behavior IDs.
     """
-    created = []
-
-    for behavior_id, bdata in BEHAVIORS.items():
-        entity = GenericEntity(
+    entities = [
+        GenericEntity(
             id=behavior_id,
             type="behavior",
             data={
@@ -634,8 +632,10 @@ def bootstrap_behaviors(store: EventStore, verbose: bool = True) -> list[str]:
                 }
             }
         )
-        store.save_entity(entity)
-        created.append(behavior_id)
+        for behavior_id, bdata in BEHAVIORS.items()
+    ]
+    store.save_entities(entities)
+    created = [entity.id for entity in entities]
 
     if verbose:
         print(f"    [behaviors] {len(created)} behavior entities")
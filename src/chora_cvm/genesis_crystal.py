@@ -79,7 +79,7 @@ def bootstrap_attention_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # attention.focus.create
     prim = PrimitiveEntity(
@@ -110,8 +110,7 @@ def bootstrap_attention_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # attention.focus.resolve
     prim = PrimitiveEntity(
@@ -142,8 +141,7 @@ def bootstrap_attention_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # attention.focus.list
     prim = PrimitiveEntity(
@@ -170,8 +168,7 @@ def bootstrap_attention_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # attention.signal.emit
     prim = PrimitiveEntity(
@@ -203,10 +200,10 @@ def bootstrap_attention_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_code_primitives(store: EventStore) -> list[str]:
@@ -218,7 +215,7 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # code.ast.scan
     prim = PrimitiveEntity(
@@ -248,8 +245,7 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # code.build.lint (points to lib/build.py)
     prim = PrimitiveEntity(
@@ -281,8 +277,7 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # code.build.test
     prim = PrimitiveEntity(
@@ -316,8 +311,7 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # code.build.typecheck
     prim = PrimitiveEntity(
@@ -348,8 +342,7 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # code.scan.features
     prim = PrimitiveEntity(
@@ -380,10 +373,10 @@ def bootstrap_code_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_io_primitives(store: EventStore) -> list[str]:
@@ -395,7 +388,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # io.ui.render
     prim = PrimitiveEntity(
@@ -423,8 +416,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.sys.log
     prim = PrimitiveEntity(
@@ -451,8 +443,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.fs.read
     prim = PrimitiveEntity(
@@ -481,8 +472,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.fs.write
     prim = PrimitiveEntity(
@@ -511,8 +501,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.fs.read_tree
     prim = PrimitiveEntity(
@@ -546,8 +535,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.fs.patch
     prim = PrimitiveEntity(
@@ -581,8 +569,7 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # io.teach.format - Format Diataxis-style documentation
     prim = PrimitiveEntity(
@@ -607,10 +594,10 @@ def bootstrap_io_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_sys_primitives(store: EventStore) -> list[str]:
@@ -622,7 +609,7 @@ def bootstrap_sys_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # sys.shell.run
     prim = PrimitiveEntity(
@@ -663,8 +650,7 @@ def bootstrap_sys_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # sys.uuid.short
     prim = PrimitiveEntity(
@@ -686,10 +672,10 @@ def bootstrap_sys_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_logic_primitives(store: EventStore) -> list[str]:
@@ -700,7 +686,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # logic.json.get
     prim = PrimitiveEntity(
@@ -729,8 +715,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.json.set
     prim = PrimitiveEntity(
@@ -758,8 +743,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.map
     prim = PrimitiveEntity(
@@ -787,8 +771,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.filter
     prim = PrimitiveEntity(
@@ -818,8 +801,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.sort
     prim = PrimitiveEntity(
@@ -848,8 +830,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.string.format
     prim = PrimitiveEntity(
@@ -876,8 +857,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.length
     prim = PrimitiveEntity(
@@ -902,8 +882,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.mode
     prim = PrimitiveEntity(
@@ -929,8 +908,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.list.slice
     prim = PrimitiveEntity(
@@ -958,8 +936,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.string.join
     prim = PrimitiveEntity(
@@ -985,8 +962,7 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # logic.json.parse - Parse JSON string (Crystal Palace replacement for primitive-json-parse)
     prim = PrimitiveEntity(
@@ -1011,10 +987,10 @@ def bootstrap_logic_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
@@ -1025,7 +1001,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # cognition.embed.text
     prim = PrimitiveEntity(
@@ -1052,8 +1028,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.vector.sim
     prim = PrimitiveEntity(
@@ -1081,8 +1056,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.vector.rank
     prim = PrimitiveEntity(
@@ -1112,8 +1086,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.cluster
     prim = PrimitiveEntity(
@@ -1142,8 +1115,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.wisdom.extract
     prim = PrimitiveEntity(
@@ -1170,8 +1142,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.embed.batch_load
     prim = PrimitiveEntity(
@@ -1199,8 +1170,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.embed.to_vectors
     prim = PrimitiveEntity(
@@ -1226,8 +1196,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.embed.to_candidates
     prim = PrimitiveEntity(
@@ -1253,8 +1222,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.vector.mean
     prim = PrimitiveEntity(
@@ -1280,8 +1248,7 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # cognition.semantic.rank_loop (GPU Doctrine: heavy math stays in Python)
     prim = PrimitiveEntity(
@@ -1310,10 +1277,10 @@ def bootstrap_cognition_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_chronos_primitives(store: EventStore) -> list[str]:
@@ -1324,7 +1291,7 @@ def bootstrap_chronos_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # chronos.now
     prim = PrimitiveEntity(
@@ -1344,8 +1311,7 @@ def bootstrap_chronos_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # chronos.offset
     prim = PrimitiveEntity(
@@ -1372,8 +1338,7 @@ def bootstrap_chronos_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # chronos.diff
     prim = PrimitiveEntity(
@@ -1402,10 +1367,10 @@ def bootstrap_chronos_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_graph_primitives(store: EventStore) -> list[str]:
@@ -1416,7 +1381,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
 
     Returns list of created primitive IDs.
     """
-    created = []
+    prims: list[PrimitiveEntity] = []
 
     # graph.entity.get
     prim = PrimitiveEntity(
@@ -1443,8 +1408,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.create
     prim = PrimitiveEntity(
@@ -1473,8 +1437,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.update
     prim = PrimitiveEntity(
@@ -1502,8 +1465,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.archive
     prim = PrimitiveEntity(
@@ -1530,8 +1492,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.bond.manage
     prim = PrimitiveEntity(
@@ -1561,8 +1522,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.bond.list
     prim = PrimitiveEntity(
@@ -1591,8 +1551,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query
     prim = PrimitiveEntity(
@@ -1620,8 +1579,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.count_by_type
     prim = PrimitiveEntity(
@@ -1647,8 +1605,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.json
     prim = PrimitiveEntity(
@@ -1677,8 +1634,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.recent
     prim = PrimitiveEntity(
@@ -1706,8 +1662,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.orphans
     prim = PrimitiveEntity(
@@ -1734,8 +1689,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.unverified
     prim = PrimitiveEntity(
@@ -1762,8 +1716,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.get_batch
     prim = PrimitiveEntity(
@@ -1791,8 +1744,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.create_batch
     prim = PrimitiveEntity(
@@ -1819,8 +1771,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.to_text
     prim = PrimitiveEntity(
@@ -1846,8 +1797,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.bond.count
     prim = PrimitiveEntity(
@@ -1872,8 +1822,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.bond.for_each
     prim = PrimitiveEntity(
@@ -1903,8 +1852,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.query.sql - Raw SQL query (Crystal Palace replacement for primitive-sqlite-query)
     prim = PrimitiveEntity(
@@ -1931,8 +1879,7 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
     # graph.entity.doc_bundle - Load entity with linked Diataxis docs
     prim = PrimitiveEntity(
@@ -1961,10 +1908,10 @@ def bootstrap_graph_primitives(store: EventStore) -> list[str]:
             },
         ),
     )
-    store.save_entity(prim)
-    created.append(prim.id)
+    prims.append(prim)
 
-    return created
+    store.save_entities(prims)
+    return [p.id for p in prims]
 
 
 def bootstrap_crystal_palace(store: EventStore, verbose: bool = True) -> dict:
@@ -14,6 +14,8 @@ The physics:
 
 from __future__ import annotations
 
+from typing import Any
+
 from chora_cvm.store import EventStore
 
 
@@ -450,7 +452,7 @@ def bootstrap_implements_bonds(store: EventStore, verbose: bool = True) -> list[
 
     Returns list of created bond IDs.
     """
-    created = []
+    bonds: list[dict[str, Any]] = []
 
     for behavior_id, primitives in BEHAVIOR_IMPLEMENTS.items():
         for primitive_id in primitives:
@@ -459,18 +461,20 @@ def bootstrap_implements_bonds(store: EventStore, verbose: bool = True) -> list[
             primitive_slug = primitive_id.replace(".", "-")[:25]
             bond_id = f"rel-implements-{behavior_slug}-{primitive_slug}"
 
-            store.save_bond(
-                bond_id=bond_id,
-                bond_type="implements",
-                from_id=behavior_id,
-                to_id=primitive_id,
-                status="active",
-                confidence=1.0,
-                data={
+            bonds.append({
+                "bond_id": bond_id,
+                "bond_type": "implements",
+                "from_id": behavior_id,
+                "to_id": primitive_id,
+                "status": "active",
+                "confidence": 1.0,
+                "data": {
                     "source": "genesis",
-                }
-            )
-            created.append(bond_id)
+                },
+            })
+
+    store.save_bonds(bonds)
+    created = [bond["bond_id"] for bond in bonds]
 
     if verbose:
         print(f"    [implements] {len(created)} bonds (behavior → primitive)")
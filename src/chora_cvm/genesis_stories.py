@@ -9,6 +9,8 @@ Stories are extracted from feature file headers (# Story: story-*).
 
 from __future__ import annotations
 
+from typing import Any
+
 from chora_cvm.kernel.schema import GenericEntity
 from chora_cvm.store import EventStore
 from chora_cvm.genesis_behaviors import STORY_BEHAVIORS
@@ -182,10 +184,8 @@ def bootstrap_stories(store: EventStore, verbose: bool = True) -> list[str]:
 
     Returns list of created story IDs.
     """
-    created = []
-
-    for story_id, sdata in STORIES.items():
-        entity = GenericEntity(
+    entities = [
+        GenericEntity(
             id=story_id,
             type="story",
             data={
@@ -199,8 +199,10 @@ def bootstrap_stories(store: EventStore, verbose: bool = True) -> list[str]:
                 }
             }
         )
-        store.save_entity(entity)
-        created.append(story_id)
+        for story_id, sdata in STORIES.items()
+    ]
+    store.save_entities(entities)
+    created = [entity.id for entity in entities]
 
     if verbose:
         print(f"    [stories] {len(created)} story entities")
@@ -217,24 +219,26 @@ def bootstrap_specifies_bonds(store: EventStore, verbose: bool = True) -> list[s
 
     Returns list of created bond IDs.
     """
-    created = []
+    bonds: list[dict[str, Any]] = []
 
     for story_id, behavior_ids in STORY_BEHAVIORS.items():
         for behavior_id in behavior_ids:
             bond_id = f"rel-specifies-{story_id.replace('story-', '')[:30]}-{behavior_id.replace('behavior-', '')[:30]}"
 
-            store.save_bond(
-                bond_id=bond_id,
-                bond_type="specifies",
-                from_id=story_id,
-                to_id=behavior_id,
-                status="active",
-                confidence=1.0,
-                data={
+            bonds.append({
+                "bond_id": bond_id,
+                "bond_type": "specifies",
+                "from_id": story_id,
+                "to_id": behavior_id,
+                "status": "active",
+                "confidence": 1.0,
+                "data": {
                     "source": "genesis",
-                }
-            )
-            created.append(bond_id)
+                },
+            })
+
+    store.save_bonds(bonds)
+    created = [bond["bond_id"] for bond in bonds]
 
     if verbose:
         print(f"    [specifies] {len(created)} bonds (story → behavior)")
@@ -10,21 +10,51 @@ This module contains the execution infrastructure:
 
 The kernel is distinct from lib/ (the vocabulary/primitives).
 Kernel = machinery. Lib = language.
+
+Exports are resolved lazily (PEP 562): importing one kernel module does not
+load the others.
 """
-from .schema import (
-    ExecutionContext,
-    GenericEntity,
-    PrimitiveEntity,
-    ProtocolEntity,
-    StateEntity,
-    EventRecord,
-    PrimitiveData,
-    ProtocolData,
-)
-from .store import EventStore
-from .registry import PrimitiveRegistry
-from .vm import ProtocolVM
-from .engine import CvmEngine
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .schema import (
+        ExecutionContext,
+        GenericEntity,
+        PrimitiveEntity,
+        ProtocolEntity,
+        StateEntity,
+        EventRecord,
+        PrimitiveData,
+        ProtocolData,
+    )
+    from .store import EventStore
+    from .registry import PrimitiveRegistry
+    from .vm import ProtocolVM
+    from .engine import CvmEngine
+
+# Public name -> module that defines it
+_EXPORTS = {
+    # Schema
+    "ExecutionContext": ".schema",
+    "GenericEntity": ".schema",
+    "PrimitiveEntity": ".schema",
+    "ProtocolEntity": ".schema",
+    "StateEntity": ".schema",
+    "EventRecord": ".schema",
+    "PrimitiveData": ".schema",
+    "ProtocolData": ".schema",
+    # Store
+    "EventStore": ".store",
+    # Registry
+    "PrimitiveRegistry": ".registry",
+    # VM
+    "ProtocolVM": ".vm",
+    # Engine
+    "CvmEngine": ".engine",
+}
 
 __all__ = [
     # Schema
@@ -45,3 +75,16 @@ __all__ = [
     # Engine
     "CvmEngine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
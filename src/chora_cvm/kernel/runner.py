@@ -145,6 +145,7 @@ def execute_protocol(
     persona_id: Optional[str] = None,
     state_id: Optional[str] = None,
     output_sink: Optional[Callable[[str], None]] = None,
+    store: Optional[EventStore] = None,
 ) -> Dict[str, Any]:
     """
     High-level protocol execution entry point.
@@ -158,6 +159,7 @@ def execute_protocol(
         inputs: Optional dictionary of input parameters
         persona_id: Optional persona context
         state_id: Optional state ID for tracking/resumption
+        store: Optional open EventStore to reuse (left open for the caller)
 
     Returns:
         Dictionary containing protocol outputs or error information
@@ -169,7 +171,9 @@ def execute_protocol(
             "error_message": f"Database not found: {db_path}",
         }
 
-    store = EventStore(db_path)
+    should_close = store is None
+    if store is None:
+        store = EventStore(db_path)
     registry = PrimitiveRegistry()
 
     # Hydrate primitives
@@ -178,7 +182,8 @@ def execute_protocol(
     # Load protocol
     protocol = load_protocol(store, protocol_id)
     if not protocol:
-        store.close()
+        if should_close:
+            store.close()
         return {
             "status": "error",
             "error_kind": "protocol_not_found",
@@ -204,6 +209,7 @@ def execute_protocol(
             output_sink=output_sink,
         )
     finally:
-        store.close()
+        if should_close:
+            store.close()
 
     return result
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, Iterable, Optional, Type
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Type
 
 import sqlite3
 
@@ -12,6 +14,44 @@ from .schema import EventRecord, StateEntity
 # Signature: (entity_id, entity_type, data) -> None
 EntitySaveHook = Callable[[str, str, dict], None]
 
+# Stay under SQLite's historical 999 host-parameter limit for multi-row INSERTs
+_MAX_SQL_PARAMS = 900
+
+
+# Connection PRAGMAs applied at open, each overridable via its env var.
+# WAL lets readers run alongside the writer, NORMAL syncs at checkpoints
+# instead of every commit, and the larger cache/mmap keep hot pages in RAM.
+SQLITE_PRAGMAS: tuple[tuple[str, str, str], ...] = (
+    ("journal_mode", "CHORA_SQLITE_JOURNAL_MODE", "WAL"),
+    ("synchronous", "CHORA_SQLITE_SYNCHRONOUS", "NORMAL"),
+    ("temp_store", "CHORA_SQLITE_TEMP_STORE", "MEMORY"),
+    ("cache_size", "CHORA_SQLITE_CACHE_SIZE", "-65536"),
+    ("mmap_size", "CHORA_SQLITE_MMAP_SIZE", "268435456"),
+)
+
+# Secondary indexes on the bulk-loaded tables; deferred_indexes() drops
+# these and _ensure_schema() rebuilds them
+_DEFERRABLE_INDEXES = (
+    "idx_entities_type",
+    "idx_entities_circle_id",
+    "idx_entities_tags",
+    "idx_entities_focus_active",
+    "idx_entities_tool_visible",
+    "idx_entities_protocol_visible",
+    "idx_bonds_from",
+    "idx_bonds_to",
+    "idx_bonds_type",
+)
+
+# page_size only takes effect before the first table is created
+SQLITE_PAGE_SIZE = os.environ.get("CHORA_SQLITE_PAGE_SIZE", "8192")
+
+
+def _chunked(rows: list[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive slices of at most `size` rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
 
 class EventStore:
     def __init__(self, path: str) -> None:
@@ -20,9 +60,20 @@ class EventStore:
         self._conn.row_factory = sqlite3.Row
         # Enable foreign key constraints (required for CASCADE delete)
         self._conn.execute("PRAGMA foreign_keys = ON")
+        self._apply_pragmas()
         self._on_entity_saved: list[EntitySaveHook] = []
+        # Depth of open transaction() blocks; >0 defers per-call commits
+        self._tx_depth = 0
         self._ensure_schema()
 
+    def _apply_pragmas(self) -> None:
+        """Tune the connection; page_size is only set on a fresh database."""
+        if self._conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            self._conn.execute(f"PRAGMA page_size = {int(SQLITE_PAGE_SIZE)}")
+        for pragma, env_var, default in SQLITE_PRAGMAS:
+            value = os.environ.get(env_var, default)
+            self._conn.execute(f"PRAGMA {pragma} = {value}")
+
     def add_entity_hook(self, callback: EntitySaveHook) -> None:
         """
         Register a callback to be invoked when an entity is saved.
@@ -49,6 +100,64 @@ class EventStore:
     def path(self) -> str:
         return self._path
 
+    def _commit(self) -> None:
+        """Commit unless an enclosing transaction() block owns the commit."""
+        if self._tx_depth == 0:
+            self._conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator["EventStore"]:
+        """
+        Group many writes into a single SQLite transaction.
+
+        Inside the block, the per-call commits issued by save_entity,
+        save_bond, etc. are deferred; the batch is committed once on exit
+        (one fsync instead of one per statement) or rolled back on error.
+        Nested blocks join the outermost transaction.
+
+        Usage:
+            with store.transaction():
+                for entity in entities:
+                    store.save_entity(entity)
+        """
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield self
+            finally:
+                self._tx_depth -= 1
+            return
+
+        if self._conn.in_transaction:
+            self._conn.commit()
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._tx_depth = 1
+        try:
+            yield self
+        except BaseException:
+            self._conn.rollback()
+            raise
+        else:
+            self._conn.commit()
+        finally:
+            self._tx_depth = 0
+
+    @contextmanager
+    def deferred_indexes(self) -> Iterator["EventStore"]:
+        """
+        Drop the entity/bond secondary indexes for a bulk load.
+
+        Each index is rebuilt once on exit (a single sorted pass) instead of
+        being updated row by row during the load. Use inside transaction()
+        so a failed load also restores the original indexes.
+        """
+        for name in _DEFERRABLE_INDEXES:
+            self._conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            yield self
+        finally:
+            self._ensure_schema()
+
     def _ensure_schema(self) -> None:
         cur = self._conn.cursor()
 
@@ -110,6 +219,35 @@ class EventStore:
             ON entities(json_extract(data_json, '$.tags'))
             """
         )
+        # Partial indexes matching the HUD endpoints' filters verbatim, so
+        # /orient focuses, /tools and /protocols read only visible rows in
+        # id order. Plain `type = ?` lookups keep using idx_entities_type.
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_focus_active
+            ON entities(id DESC)
+            WHERE type = 'focus'
+              AND json_extract(data_json, '$.status') != 'resolved'
+            """
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_tool_visible
+            ON entities(id)
+            WHERE type = 'tool'
+              AND (json_extract(data_json, '$.internal') IS NULL
+                   OR json_extract(data_json, '$.internal') != 1)
+            """
+        )
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_entities_protocol_visible
+            ON entities(id)
+            WHERE type = 'protocol'
+              AND (json_extract(data_json, '$.internal') IS NULL
+                   OR json_extract(data_json, '$.internal') != 1)
+            """
+        )
 
         # FTS5 surface for narrative entities (stories, patterns, principles)
         # Columns: id, type, title, body
@@ -219,7 +357,7 @@ class EventStore:
             """
         )
 
-        self._conn.commit()
+        self._commit()
 
     def append(self, event: EventRecord) -> None:
         cur = self._conn.cursor()
@@ -247,7 +385,7 @@ class EventStore:
                 json.dumps(event.payload),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     def iter_events(self) -> Iterable[EventRecord]:
         cur = self._conn.cursor()
@@ -280,7 +418,7 @@ class EventStore:
                 json.dumps(state.data.model_dump()),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     def load_state(self, state_id: str) -> Optional[StateEntity]:
         cur = self._conn.cursor()
@@ -312,7 +450,7 @@ class EventStore:
                 json.dumps(data_payload),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
         # Invalidate any stale embedding when entity content changes
         # Follows principle-embeddings-are-per-entity-truth
@@ -338,7 +476,7 @@ class EventStore:
                 json.dumps(data),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
         # Invalidate any stale embedding when entity content changes
         # Follows principle-embeddings-are-per-entity-truth
@@ -347,6 +485,43 @@ class EventStore:
         # Fire hooks after successful commit
         self._fire_entity_hooks(entity_id, entity_type, data)
 
+    def save_entities(self, entities: Iterable[Any]) -> None:
+        """
+        Persist many entities with multi-row INSERTs.
+
+        Equivalent to calling save_entity for each item (same upsert,
+        embedding invalidation and hooks), but rows are sent in batches of
+        VALUES tuples so SQLite parses one statement per chunk instead of
+        one per entity. Used by genesis and other bulk loaders.
+        """
+        rows: list[tuple[str, str, str]] = []
+        payloads: list[tuple[str, str, Any]] = []
+        for entity in entities:
+            data_obj = getattr(entity, "data", {})
+            if hasattr(data_obj, "model_dump"):
+                data_payload = data_obj.model_dump(by_alias=True)  # type: ignore[call-arg]
+            else:
+                data_payload = data_obj
+            rows.append((entity.id, entity.type, json.dumps(data_payload)))
+            payloads.append((entity.id, entity.type, data_payload))
+
+        if not rows:
+            return
+
+        cur = self._conn.cursor()
+        for chunk in _chunked(rows, _MAX_SQL_PARAMS // 3):
+            cur.execute(
+                "INSERT INTO entities (id, type, data_json) VALUES "
+                + ",".join(["(?, ?, json(?))"] * len(chunk))
+                + " ON CONFLICT(id) DO UPDATE SET data_json=excluded.data_json",
+                [value for row in chunk for value in row],
+            )
+        self._delete_embeddings([row[0] for row in rows])
+        self._commit()
+
+        for entity_id, entity_type, data_payload in payloads:
+            self._fire_entity_hooks(entity_id, entity_type, data_payload)
+
     def load_entity(self, entity_id: str, model_cls: Type[Any]) -> Optional[Any]:
         cur = self._conn.cursor()
         cur.execute("SELECT * FROM entities WHERE id = ?", (entity_id,))
@@ -423,7 +598,70 @@ class EventStore:
             (bond_id, json.dumps(entity_data)),
         )
 
-        self._conn.commit()
+        self._commit()
+
+    def save_bonds(self, bonds: Iterable[dict[str, Any]]) -> None:
+        """
+        Project many bonds with multi-row INSERTs.
+
+        Each item takes the same keys as save_bond's arguments (bond_id,
+        bond_type, from_id, to_id, and optional status, confidence, data).
+        Both the bonds row and the relationship entity are written, in
+        batches of VALUES tuples rather than one statement per bond.
+        """
+        bond_rows: list[tuple[Any, ...]] = []
+        entity_rows: list[tuple[str, str]] = []
+        for bond in bonds:
+            bond_id = bond["bond_id"]
+            bond_type = bond["bond_type"]
+            from_id = bond["from_id"]
+            to_id = bond["to_id"]
+            status = bond.get("status", "active")
+            confidence = max(0.0, min(1.0, bond.get("confidence", 1.0)))
+            data = bond.get("data") or {}
+
+            bond_rows.append(
+                (bond_id, bond_type, from_id, to_id, status, confidence, json.dumps(data))
+            )
+            entity_data = {
+                "title": f"{from_id} --{bond_type}--> {to_id}",
+                "bond_type": bond_type,
+                "from_id": from_id,
+                "to_id": to_id,
+                "status": status,
+                "confidence": confidence,
+                **data,
+            }
+            entity_rows.append((bond_id, json.dumps(entity_data)))
+
+        if not bond_rows:
+            return
+
+        cur = self._conn.cursor()
+        for chunk in _chunked(bond_rows, _MAX_SQL_PARAMS // 7):
+            cur.execute(
+                "INSERT INTO bonds (id, type, from_id, to_id, status, confidence, data_json) VALUES "
+                + ",".join(["(?, ?, ?, ?, ?, ?, json(?))"] * len(chunk))
+                + """
+                ON CONFLICT(id) DO UPDATE SET
+                    type=excluded.type,
+                    from_id=excluded.from_id,
+                    to_id=excluded.to_id,
+                    status=excluded.status,
+                    confidence=excluded.confidence,
+                    data_json=excluded.data_json
+                """,
+                [value for row in chunk for value in row],
+            )
+        for chunk in _chunked(entity_rows, _MAX_SQL_PARAMS // 2):
+            cur.execute(
+                "INSERT INTO entities (id, type, data_json) VALUES "
+                + ",".join(["(?, 'relationship', json(?))"] * len(chunk))
+                + " ON CONFLICT(id) DO UPDATE SET data_json=excluded.data_json",
+                [value for row in chunk for value in row],
+            )
+
+        self._commit()
 
     def get_bond(self, bond_id: str) -> dict[str, Any] | None:
         """Get a single bond by ID."""
@@ -471,7 +709,7 @@ class EventStore:
             (confidence, bond_id),
         )
 
-        self._conn.commit()
+        self._commit()
 
         return {"previous_confidence": previous_confidence, "new_confidence": confidence}
 
@@ -695,7 +933,7 @@ class EventStore:
             """,
             (entity_id, model_name, vector, dimension, now, now),
         )
-        self._conn.commit()
+        self._commit()
 
     def get_embedding(self, entity_id: str) -> Dict[str, Any] | None:
         """
@@ -732,9 +970,20 @@ class EventStore:
         cur = self._conn.cursor()
         cur.execute("DELETE FROM embeddings WHERE entity_id = ?", (entity_id,))
         deleted = cur.rowcount > 0
-        self._conn.commit()
+        self._commit()
         return deleted
 
+    def _delete_embeddings(self, entity_ids: list[str]) -> None:
+        """Invalidate embeddings for many entities (caller commits)."""
+        cur = self._conn.cursor()
+        for chunk in _chunked(entity_ids, _MAX_SQL_PARAMS):
+            cur.execute(
+                "DELETE FROM embeddings WHERE entity_id IN ("
+                + ",".join(["?"] * len(chunk))
+                + ")",
+                chunk,
+            )
+
     def has_embedding(self, entity_id: str) -> bool:
         """Check if an entity has a stored embedding."""
         cur = self._conn.cursor()
@@ -827,7 +1076,7 @@ class EventStore:
         # Remove from entities (the entity is now in archive)
         cur.execute("DELETE FROM entities WHERE id = ?", (entity_id,))
 
-        self._conn.commit()
+        self._commit()
 
         return {
             "id": archive_id,
@@ -880,7 +1129,7 @@ class EventStore:
         # Remove from bonds
         cur.execute("DELETE FROM bonds WHERE id = ?", (bond_id,))
 
-        self._conn.commit()
+        self._commit()
 
         return {
             "id": archive_id,
@@ -926,7 +1175,7 @@ class EventStore:
         # Remove from archive
         cur.execute("DELETE FROM archive WHERE id = ?", (archive_id,))
 
-        self._conn.commit()
+        self._commit()
 
         return {
             "id": row["original_id"],
@@ -18,6 +18,7 @@ Primitives:
 from __future__ import annotations
 
 import json
+import re
 import sqlite3
 from typing import Any, Dict, List, Optional
 
@@ -97,18 +98,7 @@ def entity_create(
     should_close = _ctx.store is None
 
     try:
-        # Apply defaults for specific entity types
-        if entity_type == "circle" and "sync_policy" not in data:
-            data = {**data, "sync_policy": "local-only"}
-
-        if entity_type == "primitive":
-            entity = PrimitiveEntity(id=entity_id, data=PrimitiveData(**data))
-        elif entity_type == "protocol":
-            entity = ProtocolEntity(id=entity_id, data=ProtocolData(**data))
-        else:
-            entity = GenericEntity(id=entity_id, type=entity_type, data=data)
-
-        store.save_entity(entity)
+        store.save_entity(_build_entity(entity_type, entity_id, data))
         return {"status": "success", "id": entity_id, "type": entity_type}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -117,6 +107,56 @@ def entity_create(
             store.close()
 
 
+def entity_create_many(
+    items: List[Dict[str, Any]],
+    _ctx: ExecutionContext,
+) -> Dict[str, Any]:
+    """
+    Manifest many entities in one batched write.
+
+    Each item carries the entity_create arguments (entity_type, entity_id,
+    data). All entities are validated before anything is written, then
+    saved with a single multi-row upsert and commit.
+
+    Args:
+        items: List of {"entity_type", "entity_id", "data"} dicts
+        _ctx: Execution context (MANDATORY in lib/)
+
+    Returns:
+        {"status": "success", "ids": [...], "count": n} or
+        {"status": "error", "error": "..."}
+    """
+    store = _ctx.store if _ctx.store else EventStore(_ctx.db_path)
+    should_close = _ctx.store is None
+
+    try:
+        entities = [
+            _build_entity(item["entity_type"], item["entity_id"], item["data"])
+            for item in items
+        ]
+        store.save_entities(entities)
+        ids = [entity.id for entity in entities]
+        return {"status": "success", "ids": ids, "count": len(ids)}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    finally:
+        if should_close:
+            store.close()
+
+
+def _build_entity(entity_type: str, entity_id: str, data: Dict[str, Any]) -> Any:
+    """Wrap a payload in the schema model for its entity type."""
+    # Apply defaults for specific entity types
+    if entity_type == "circle" and "sync_policy" not in data:
+        data = {**data, "sync_policy": "local-only"}
+
+    if entity_type == "primitive":
+        return PrimitiveEntity(id=entity_id, data=PrimitiveData(**data))
+    if entity_type == "protocol":
+        return ProtocolEntity(id=entity_id, data=ProtocolData(**data))
+    return GenericEntity(id=entity_id, type=entity_type, data=data)
+
+
 def entity_update(
     entity_id: str,
     updates: Dict[str, Any],
@@ -270,8 +310,6 @@ def bond_manage(
         {"status": "success", "id": bond_id, "bond_type": bond_type, ...} or
         {"status": "error", "error": "..."}
     """
-    import re
-
     if bond_type not in BOND_TYPES:
         return {
             "status": "error",
@@ -292,10 +330,7 @@ def bond_manage(
         if not to_entity:
             return {"status": "error", "error": f"Entity not found: {to_id}"}
 
-        # Generate bond ID
-        from_slug = re.sub(r"[^a-z0-9]+", "-", from_id.lower()).strip("-")
-        to_slug = re.sub(r"[^a-z0-9]+", "-", to_id.lower()).strip("-")
-        bond_id = f"rel-{bond_type}-{from_slug}-{to_slug}"
+        bond_id = _bond_id(bond_type, from_id, to_id)
 
         # Clamp confidence to valid range
         confidence = max(0.0, min(1.0, confidence))
@@ -326,6 +361,94 @@ def bond_manage(
             store.close()
 
 
+def bond_manage_many(
+    bonds: List[Dict[str, Any]],
+    _ctx: ExecutionContext,
+) -> Dict[str, Any]:
+    """
+    Create or update many bonds in one batched write.
+
+    Each item carries the bond_manage arguments (bond_type, from_id, to_id,
+    and optionally status, confidence, data). Bonds are validated exactly
+    as bond_manage does; valid ones are saved with a single multi-row write
+    and invalid ones are reported without blocking the rest.
+
+    Args:
+        bonds: List of bond_manage keyword dicts
+        _ctx: Execution context (MANDATORY in lib/)
+
+    Returns:
+        {"status": "success", "results": [...], "count": n} where each result
+        matches what bond_manage would have returned for that bond
+    """
+    store = _ctx.store if _ctx.store else EventStore(_ctx.db_path)
+    should_close = _ctx.store is None
+
+    try:
+        endpoint_ids = list({b["from_id"] for b in bonds} | {b["to_id"] for b in bonds})
+        existing = set()
+        for start in range(0, len(endpoint_ids), 900):
+            chunk = endpoint_ids[start:start + 900]
+            cur = store._conn.execute(
+                f"SELECT id FROM entities WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            existing.update(row[0] for row in cur)
+
+        results = []
+        specs = []
+        for bond in bonds:
+            bond_type, from_id, to_id = bond["bond_type"], bond["from_id"], bond["to_id"]
+            if bond_type not in BOND_TYPES:
+                results.append({
+                    "status": "error",
+                    "error": f"Invalid bond type: {bond_type}",
+                    "valid_types": list(BOND_TYPES),
+                })
+                continue
+            if from_id not in existing:
+                results.append({"status": "error", "error": f"Entity not found: {from_id}"})
+                continue
+            if to_id not in existing:
+                results.append({"status": "error", "error": f"Entity not found: {to_id}"})
+                continue
+
+            bond_id = _bond_id(bond_type, from_id, to_id)
+            confidence = max(0.0, min(1.0, bond.get("confidence", 1.0)))
+            specs.append({
+                "bond_id": bond_id,
+                "bond_type": bond_type,
+                "from_id": from_id,
+                "to_id": to_id,
+                "status": bond.get("status", "active"),
+                "confidence": confidence,
+                "data": bond.get("data") or {},
+            })
+            results.append({
+                "status": "success",
+                "id": bond_id,
+                "bond_type": bond_type,
+                "from_id": from_id,
+                "to_id": to_id,
+                "confidence": confidence,
+            })
+
+        store.save_bonds(specs)
+        return {"status": "success", "results": results, "count": len(specs)}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    finally:
+        if should_close:
+            store.close()
+
+
+def _bond_id(bond_type: str, from_id: str, to_id: str) -> str:
+    """Derive the deterministic relationship ID for a bond."""
+    from_slug = re.sub(r"[^a-z0-9]+", "-", from_id.lower()).strip("-")
+    to_slug = re.sub(r"[^a-z0-9]+", "-", to_id.lower()).strip("-")
+    return f"rel-{bond_type}-{from_slug}-{to_slug}"
+
+
 def bond_list(
     entity_id: str,
     _ctx: ExecutionContext,
@@ -459,6 +459,183 @@ def semantic_search(
             }
 
 
+def semantic_search_batch(
+    db_path: str,
+    queries: List[str],
+    entity_type: Optional[str] = None,
+    limit: int = 10,
+) -> Dict[str, Any]:
+    """
+    Search entities for many queries at once.
+
+    Embeds all queries in one provider call and scores them against the
+    stored corpus with a single matrix product, instead of one embedding
+    pass and one corpus scan per query. Falls back to per-query
+    semantic_search (FTS5) when inference or stored embeddings are missing.
+
+    Args:
+        db_path: Path to the CVM database
+        queries: Search queries
+        entity_type: Optional type filter
+        limit: Maximum results per query
+
+    Returns:
+        {
+            "results": [[{"id": str, "type": str, "title": str, "similarity": float}, ...], ...],
+            "method": "semantic" | "fts5",
+        }
+        with one result list per query, in query order.
+    """
+    if not queries:
+        return {"results": [], "method": "semantic"}
+
+    try:
+        provider = get_embedding_provider()
+    except ImportError:
+        return _semantic_search_each(db_path, queries, entity_type, limit)
+
+    # Only embed the queries if there is something to score them against
+    conn = sqlite3.connect(db_path)
+    sql = "SELECT 1 FROM embeddings m JOIN entities e ON e.id = m.entity_id"
+    params: list[Any] = []
+    if entity_type:
+        sql += " WHERE e.type = ?"
+        params.append(entity_type)
+    has_corpus = conn.execute(sql + " LIMIT 1", params).fetchone() is not None
+    conn.close()
+
+    if not has_corpus:
+        return _semantic_search_each(db_path, queries, entity_type, limit)
+
+    import numpy as np
+
+    query_matrix = np.asarray(
+        [np.asarray(vec, dtype=np.float32) for vec in provider.embed_batch(queries)]
+    )
+    dimension = query_matrix.shape[1]
+
+    corpus_data = load_corpus_matrix(db_path, dimension)
+    corpus_matrix = corpus_data["matrix"]
+    corpus = list(zip(corpus_data["ids"], corpus_data["types"], corpus_data["titles"]))
+    if entity_type:
+        keep = [i for i, row in enumerate(corpus) if row[1] == entity_type]
+        corpus = [corpus[i] for i in keep]
+        corpus_matrix = corpus_matrix[keep]
+    if not corpus:
+        return {"results": [[] for _ in queries], "method": "semantic"}
+
+    # Vectors are normalized, so cosine similarity is the dot product
+    scores = np.clip(query_matrix @ corpus_matrix.T.astype(np.float32), 0.0, 1.0)
+
+    k = min(limit, len(corpus))
+    results = []
+    for row_scores in scores:
+        top = np.argpartition(-row_scores, k - 1)[:k]
+        top = top[np.argsort(-row_scores[top])]
+        results.append([
+            {
+                "id": corpus[i][0],
+                "type": corpus[i][1],
+                "title": corpus[i][2],
+                "similarity": float(row_scores[i]),
+            }
+            for i in top
+        ])
+
+    return {"results": results, "method": "semantic"}
+
+
+def load_corpus_matrix(db_path: str, dimension: int) -> Dict[str, Any]:
+    """
+    Load all stored embeddings of one dimension as an (N, D) float16 matrix.
+
+    The matrix is persisted beside the database (<db>.embeddings-<D>.npy,
+    L2-normalized, float16) with a JSON sidecar holding the row ids, types
+    and titles plus a signature of the embeddings table. Later calls
+    memory-map the .npy instead of re-reading and unpacking every vector
+    blob; a changed signature (row count, max rowid, latest update)
+    triggers a rebuild.
+
+    Returns:
+        {"ids": [...], "types": [...], "titles": [...], "matrix": ndarray}
+    """
+    import numpy as np
+
+    conn = sqlite3.connect(db_path)
+    signature = list(conn.execute(
+        "SELECT COUNT(*), MAX(rowid), MAX(updated_at) FROM embeddings WHERE dimension = ?",
+        (dimension,),
+    ).fetchone())
+
+    cacheable = db_path != ":memory:"
+    matrix_path = f"{db_path}.embeddings-{dimension}.npy"
+    sidecar_path = f"{db_path}.embeddings-{dimension}.json"
+
+    if cacheable:
+        try:
+            with open(sidecar_path) as f:
+                header = json.load(f)
+            if header.get("signature") == signature:
+                conn.close()
+                return {
+                    "ids": header["ids"],
+                    "types": header["types"],
+                    "titles": header["titles"],
+                    "matrix": np.load(matrix_path, mmap_mode="r"),
+                }
+        except (OSError, ValueError, KeyError):
+            pass  # Missing or stale cache: rebuild below
+
+    rows = conn.execute(
+        """
+        SELECT e.id, e.type, json_extract(e.data_json, '$.title'), m.vector
+        FROM embeddings m
+        JOIN entities e ON e.id = m.entity_id
+        WHERE m.dimension = ?
+        ORDER BY m.rowid
+        """,
+        (dimension,),
+    ).fetchall()
+    conn.close()
+
+    matrix = np.frombuffer(
+        b"".join(row[3] for row in rows), dtype=np.float32
+    ).reshape(len(rows), dimension)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = (matrix / np.where(norms == 0, 1.0, norms)).astype(np.float16)
+
+    ids = [row[0] for row in rows]
+    types = [row[1] for row in rows]
+    titles = [row[2] or row[0] for row in rows]
+
+    if cacheable:
+        try:
+            np.save(matrix_path, matrix)
+            with open(sidecar_path, "w") as f:
+                json.dump(
+                    {"signature": signature, "ids": ids, "types": types, "titles": titles},
+                    f,
+                )
+        except OSError:
+            pass  # Read-only location: serve from memory this time
+
+    return {"ids": ids, "types": types, "titles": titles, "matrix": matrix}
+
+
+def _semantic_search_each(
+    db_path: str,
+    queries: List[str],
+    entity_type: Optional[str],
+    limit: int,
+) -> Dict[str, Any]:
+    """Fallback for semantic_search_batch: run semantic_search per query."""
+    per_query = [semantic_search(db_path, q, entity_type=entity_type, limit=limit) for q in queries]
+    return {
+        "results": [r.get("results", []) for r in per_query],
+        "method": per_query[0].get("method", "fts5"),
+    }
+
+
 def suggest_bonds(
     db_path: str,
     entity_id: str,
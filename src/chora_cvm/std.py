@@ -1666,7 +1666,7 @@ def pulse_preview(
 
 def integrity_discover_scenarios(
     db_path: str,
-    features_dir: str | None = None,
+    features_dir: str | Path | None = None,
 ) -> Dict[str, Any]:
     """
     Primitive: Discover which behaviors have BDD scenarios.
@@ -1712,32 +1712,31 @@ def integrity_discover_scenarios(
     if not features_path.exists():
         return {"behaviors": behaviors, "unmapped_tags": []}
 
-    # Pattern to match @behavior:* tags
-    tag_pattern = re.compile(r"@behavior:(\S+)")
+    # Pattern to match @behavior:* tags; matched on raw bytes so files are
+    # read once without decoding
+    tag_pattern = re.compile(rb"@behavior:(\S+)")
+    seen_unmapped: set[str] = set()
 
     for feature_file in features_path.glob("*.feature"):
-        content = feature_file.read_text()
-
-        # Find all behavior tags in this file
-        tags = tag_pattern.findall(content)
-
-        for tag in tags:
-            # Construct possible behavior IDs
-            possible_ids = [
-                f"behavior-{tag}",
-                tag,  # In case tag already has behavior- prefix
-            ]
-
-            matched = False
-            for bid in possible_ids:
-                if bid in behaviors:
-                    behaviors[bid]["has_scenarios"] = True
-                    behaviors[bid]["feature_file"] = str(feature_file)
-                    behaviors[bid]["scenario_count"] += 1
-                    matched = True
-                    break
-
-            if not matched and tag not in unmapped_tags:
+        tags = tag_pattern.findall(feature_file.read_bytes())
+        if not tags:
+            continue
+        feature_name = str(feature_file)
+
+        for raw_tag in tags:
+            tag = raw_tag.decode("utf-8", "replace")
+            # Tag may be bare or already carry the behavior- prefix
+            bid = f"behavior-{tag}"
+            if bid not in behaviors:
+                bid = tag if tag in behaviors else None
+
+            if bid is not None:
+                entry = behaviors[bid]
+                entry["has_scenarios"] = True
+                entry["feature_file"] = feature_name
+                entry["scenario_count"] += 1
+            elif tag not in seen_unmapped:
+                seen_unmapped.add(tag)
                 unmapped_tags.append(tag)
 
     return {"behaviors": behaviors, "unmapped_tags": unmapped_tags}
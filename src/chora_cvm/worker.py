@@ -25,9 +25,11 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -96,20 +98,48 @@ def init_results_table(db_path: str) -> None:
     conn.close()
 
 
+# Enqueue-side connections to the worker DB, one per path, kept open for the
+# life of the process so repeated enqueues skip connect + table setup
+_enqueue_conns: Dict[str, sqlite3.Connection] = {}
+_enqueue_lock = threading.Lock()
+
+
+def _get_enqueue_conn(db_path: str) -> sqlite3.Connection:
+    """Get the shared enqueue connection for db_path (call with _enqueue_lock held)."""
+    conn = _enqueue_conns.get(db_path)
+    if conn is None:
+        init_results_table(db_path)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Huey already keeps this file in WAL; NORMAL skips the per-commit fsync
+        conn.execute("PRAGMA synchronous = NORMAL")
+        _enqueue_conns[db_path] = conn
+    return conn
+
+
+def close_enqueue_conns() -> None:
+    """Close the shared enqueue connections; registered to run at exit."""
+    with _enqueue_lock:
+        for conn in _enqueue_conns.values():
+            conn.close()
+        _enqueue_conns.clear()
+
+
+atexit.register(close_enqueue_conns)
+
+
 def record_task_enqueued(
     db_path: str,
     task_id: str,
     protocol_id: str,
 ) -> None:
     """Record that a task has been enqueued."""
-    init_results_table(db_path)
-    conn = sqlite3.connect(db_path)
-    conn.execute("""
-        INSERT INTO task_results (task_id, protocol_id, status, enqueued_at)
-        VALUES (?, ?, 'pending', ?)
-    """, (task_id, protocol_id, datetime.now().isoformat()))
-    conn.commit()
-    conn.close()
+    with _enqueue_lock:
+        conn = _get_enqueue_conn(db_path)
+        with conn:
+            conn.execute("""
+                INSERT INTO task_results (task_id, protocol_id, status, enqueued_at)
+                VALUES (?, ?, 'pending', ?)
+            """, (task_id, protocol_id, datetime.now().isoformat()))
 
 
 def record_task_started(db_path: str, task_id: str) -> None:
@@ -382,17 +412,30 @@ def get_pulse_status(db_path: str, limit: int = 10) -> Dict[str, Any]:
 # Worker Runner
 # =============================================================================
 
+# Idle polling knobs for the consumer, each overridable via its env var.
+# Workers back off exponentially up to WORKER_MAX_DELAY seconds between empty
+# dequeues. The scheduler only serves eta/delayed tasks, which the CVM never
+# schedules, so it checks every WORKER_SCHEDULER_INTERVAL seconds instead of
+# huey's once per second (must divide 60).
+WORKER_MAX_DELAY = float(os.environ.get("CHORA_WORKER_MAX_DELAY", "10.0"))
+WORKER_SCHEDULER_INTERVAL = int(os.environ.get("CHORA_WORKER_SCHEDULER_INTERVAL", "10"))
+
+
 def run_worker(workers: int = 1, verbose: bool = True) -> None:
     """
     Run the Huey worker.
 
-    This starts a consumer that processes tasks from the queue.
+    This starts a consumer that processes tasks from the queue. No periodic
+    tasks are registered, so the periodic scan is switched off.
     """
     from huey.consumer import Consumer
 
     consumer = Consumer(
         huey,
         workers=workers,
+        periodic=False,
+        max_delay=WORKER_MAX_DELAY,
+        scheduler_interval=WORKER_SCHEDULER_INTERVAL,
         worker_type="thread",  # Use threads for SQLite compatibility
     )
 
@@ -16,9 +16,10 @@ def temp_db():
 
     yield db_path
 
-    # Cleanup
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+    # Cleanup (including WAL sidecar files)
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.unlink(path)
 
 
 @pytest.fixture
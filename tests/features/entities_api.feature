@@ -0,0 +1,24 @@
+Feature: Entities API
+  As the HUD interface
+  I want to page through entities over HTTP
+  So that entity lists only read the rows they display
+
+  Background:
+    Given a fresh CVM database
+
+  @behavior:entities-api-lists-newest-first
+  Scenario: Listing entities by type returns a limited page, newest ID first
+    Given 5 "signal" entities exist
+    And 2 "learning" entities exist
+    When I fetch the entities list with type "signal" and limit 3
+    Then the entities list should have ids "signal-4, signal-3, signal-2"
+    And the entities list count should be 3
+    And the entities list should not report a total
+
+  @behavior:entities-api-lists-newest-first
+  Scenario: The total number of matches is reported on request
+    Given 5 "signal" entities exist
+    And 2 "learning" entities exist
+    When I fetch the entities list with type "signal", limit 2 and the total
+    Then the entities list count should be 2
+    And the entities list total should be 5
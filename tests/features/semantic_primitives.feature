@@ -103,6 +103,30 @@ Feature: Semantic Primitives
     When I call semantic_search with query "patterns" and type filter "learning"
     Then all results are of type "learning"
 
+  @behavior:semantic-search-ranks-entities-by-meaning
+  Scenario: Batch semantic search ranks each query in one pass
+    Given chora-inference is available
+    And multiple entities exist with embeddings
+    When I call semantic_search_batch with queries "learning from patterns" and "data driven decisions"
+    Then there is one ranked result list per query
+    And the result includes method "semantic"
+
+  @behavior:semantic-search-ranks-entities-by-meaning
+  Scenario: Batch semantic search falls back to FTS5 when inference unavailable
+    Given chora-inference is not available
+    And multiple entities exist
+    When I call semantic_search_batch with queries "patterns" and "observe"
+    Then the results come from FTS5 search
+
+  @behavior:semantic-search-ranks-entities-by-meaning
+  Scenario: Corpus embeddings are persisted and refreshed when embeddings change
+    Given chora-inference is available
+    And multiple entities exist with embeddings
+    When I load the corpus matrix
+    Then the corpus matrix is persisted beside the database
+    When "learning-semantic-test" gets a stored embedding and I load the corpus matrix again
+    Then the corpus matrix includes "learning-semantic-test"
+
   # Behavior: behavior-suggest-bonds-finds-relationship-candidates
   @behavior:suggest-bonds-finds-relationship-candidates
   Scenario: Suggest bonds finds candidates using semantic similarity
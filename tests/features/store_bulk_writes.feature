@@ -0,0 +1,42 @@
+Feature: Store Bulk Writes
+  As a bulk loader (genesis, merges, imports)
+  I need to save many entities and bonds in batched statements
+  So that loading does not pay one statement per row
+
+  Background:
+    Given a fresh EventStore database
+
+  @behavior:store-saves-entities-in-bulk
+  Scenario: Saving more entities than fit in one statement
+    When I bulk save 500 note entities
+    Then 500 note entities should exist in the store
+    And the entity "note-499" should have title "Note 499"
+
+  @behavior:store-saves-entities-in-bulk
+  Scenario: Bulk saving fires entity hooks for every entity
+    Given a registered entity save hook
+    When I bulk save 3 note entities
+    Then the hook should have been called 3 times
+
+  @behavior:store-saves-bonds-in-bulk
+  Scenario: Bulk saved bonds match individually saved bonds
+    When I bulk save 200 bonds
+    Then 200 bonds should exist in the store
+    And bond "rel-bulk-7" should equal a bond saved with save_bond
+
+  @behavior:store-defers-indexes-during-bulk-load
+  Scenario: Secondary indexes are rebuilt after a deferred bulk load
+    When I bulk save 50 note entities with indexes deferred
+    Then 50 note entities should exist in the store
+    And the secondary indexes should exist
+
+  @behavior:graph-creates-entities-in-bulk
+  Scenario: Graph batch primitives match their single-item counterparts
+    When I create 3 principles and bond them with graph batch primitives
+    Then 3 principle entities should exist in the store
+    And each batch bond result should match bond_manage
+
+  @behavior:graph-creates-entities-in-bulk
+  Scenario: Graph batch bonding reports invalid bonds without blocking valid ones
+    When I batch bond a principle to a missing entity and to a real one
+    Then the batch bond results should be "error" then "success"
@@ -0,0 +1,24 @@
+Feature: Store Transactions
+  As a bulk loader (genesis, merges, imports)
+  I need to group many writes into one SQLite transaction
+  So that loading pays one commit instead of one per row
+
+  Background:
+    Given a fresh EventStore database
+
+  @behavior:store-transaction-commits-once
+  Scenario: Writes inside a transaction are visible to other connections only after exit
+    When I save 3 entities inside a store transaction
+    Then a second connection should see 0 entities before the block exits
+    And a second connection should see 3 entities after the block exits
+
+  @behavior:store-transaction-rolls-back-on-error
+  Scenario: A failing transaction leaves the database untouched
+    When I save 3 entities inside a store transaction that raises
+    Then a second connection should see 0 entities after the block exits
+
+  @behavior:store-transaction-commits-once
+  Scenario: Nested transactions join the outermost one
+    When I save entities inside nested store transactions
+    Then a second connection should see 0 entities after the inner block exits
+    And a second connection should see 2 entities after the block exits
@@ -87,3 +87,23 @@ Feature: Tools API for Command Palette
     Given a tool entity "tool-cognition-desc" exists with cognition ready_at_hand "Use when orienting"
     When I fetch the tools list
     Then the tool "tool-cognition-desc" should have description "Use when orienting"
+
+  # ===========================================================================
+  # Capabilities Polling
+  # ===========================================================================
+
+  @behavior:command-palette-shows-cvm-tools-dynamically
+  Scenario: Unchanged capabilities are not re-sent to a polling client
+    Given a protocol entity "protocol-polled" exists
+    When I fetch the capabilities list
+    And I fetch the capabilities list again with its ETag
+    Then the capabilities response status should be 304
+
+  @behavior:command-palette-shows-cvm-tools-dynamically
+  Scenario: Manifesting a protocol refreshes the polled capabilities
+    Given a protocol entity "protocol-polled" exists
+    When I fetch the capabilities list
+    And a protocol entity "protocol-fresh" is manifested
+    And I fetch the capabilities list again with its ETag
+    Then the capabilities response status should be 200
+    And the capabilities should include "protocol-fresh"
@@ -0,0 +1,134 @@
+"""
+Step definitions for the Entities API feature.
+
+These tests verify paging on the GET /entities endpoint.
+"""
+import os
+import tempfile
+
+import pytest
+from pytest_bdd import given, scenarios, then, when, parsers
+from fastapi.testclient import TestClient
+
+from chora_cvm.api import app
+from chora_cvm.store import EventStore
+from chora_cvm.std import manifest_entity
+
+# Load scenarios from feature file
+scenarios("../features/entities_api.feature")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def test_context():
+    """Shared context for passing data between steps."""
+    return {}
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database for each test."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+
+    store = EventStore(path)
+    store.close()
+
+    yield path
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.unlink(path + suffix)
+
+
+@pytest.fixture
+def api_client(db_path, monkeypatch):
+    """Create a test client with the database path set."""
+    import chora_cvm.api as api_module
+    monkeypatch.setattr(api_module, "DEFAULT_DB_PATH", db_path)
+    return TestClient(app)
+
+
+# =============================================================================
+# Given Steps
+# =============================================================================
+
+
+@given("a fresh CVM database")
+def fresh_database(db_path, test_context):
+    """Set up a fresh database for testing."""
+    test_context["db_path"] = db_path
+
+
+@given(parsers.parse('{count:d} "{entity_type}" entities exist'))
+def create_entities(db_path, count: int, entity_type: str):
+    """Create numbered entities of one type."""
+    for i in range(count):
+        manifest_entity(
+            db_path,
+            entity_type=entity_type,
+            entity_id=f"{entity_type}-{i}",
+            data={"title": f"{entity_type.title()} {i}"},
+        )
+
+
+# =============================================================================
+# When Steps
+# =============================================================================
+
+
+@when(parsers.parse('I fetch the entities list with type "{entity_type}" and limit {limit:d}'))
+def fetch_entities(api_client, test_context, entity_type: str, limit: int):
+    """Fetch one page of entities of a type."""
+    response = api_client.get("/entities", params={"type": entity_type, "limit": limit})
+    assert response.status_code == 200
+    test_context["entities_data"] = response.json()
+
+
+@when(
+    parsers.parse(
+        'I fetch the entities list with type "{entity_type}", limit {limit:d} and the total'
+    )
+)
+def fetch_entities_with_total(api_client, test_context, entity_type: str, limit: int):
+    """Fetch one page of entities of a type, asking for the total."""
+    response = api_client.get(
+        "/entities",
+        params={"type": entity_type, "limit": limit, "include_total": True},
+    )
+    assert response.status_code == 200
+    test_context["entities_data"] = response.json()
+
+
+# =============================================================================
+# Then Steps
+# =============================================================================
+
+
+@then(parsers.parse('the entities list should have ids "{ids}"'))
+def check_entity_ids(test_context, ids: str):
+    """Verify the page's entity IDs, in order."""
+    entities = test_context["entities_data"]["entities"]
+    assert [e["id"] for e in entities] == [i.strip() for i in ids.split(",")]
+
+
+@then(parsers.parse("the entities list count should be {count:d}"))
+def check_entity_count(test_context, count: int):
+    """Verify the page count."""
+    assert test_context["entities_data"]["count"] == count
+
+
+@then("the entities list should not report a total")
+def check_no_total(test_context):
+    """Verify no total was computed."""
+    assert "total" not in test_context["entities_data"]
+
+
+@then(parsers.parse("the entities list total should be {total:d}"))
+def check_entity_total(test_context, total: int):
+    """Verify the reported total."""
+    assert test_context["entities_data"]["total"] == total
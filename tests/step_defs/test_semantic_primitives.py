@@ -4,6 +4,7 @@ Step definitions for the Semantic Primitives feature.
 These tests verify the behaviors specified by story-semantic-primitives-enable-inference.
 All semantic operations gracefully degrade when chora-inference is unavailable.
 """
+import glob
 import json
 import math
 import os
@@ -47,9 +48,10 @@ def db_path():
 
     yield path
 
-    # Cleanup
-    if os.path.exists(path):
-        os.unlink(path)
+    # Cleanup (including persisted corpus matrices)
+    for leftover in [path, *glob.glob(f"{path}.embeddings-*")]:
+        if os.path.exists(leftover):
+            os.unlink(leftover)
 
 
 def create_mock_embedding(dimension: int = 1536, seed: int = 42) -> bytes:
@@ -296,6 +298,23 @@ def call_semantic_search(db_path, test_context, query: str):
     test_context["result"] = result
 
 
+@when(parsers.parse('I call semantic_search_batch with queries "{query_1}" and "{query_2}"'))
+def call_semantic_search_batch(db_path, test_context, query_1: str, query_2: str):
+    """Call semantic_search_batch with two queries."""
+    from chora_cvm.semantic import semantic_search_batch
+
+    queries = [query_1, query_2]
+    if test_context["inference_available"] and test_context["mock_provider"]:
+        with patch("chora_cvm.semantic.get_embedding_provider", return_value=test_context["mock_provider"]):
+            result = semantic_search_batch(db_path, queries)
+    else:
+        with patch("chora_cvm.semantic.get_embedding_provider", side_effect=ImportError("No module named 'chora_inference'")):
+            result = semantic_search_batch(db_path, queries)
+
+    test_context["result"] = result
+    test_context["queries"] = queries
+
+
 @when(parsers.parse('I call semantic_search with query "{query}" and type filter "{entity_type}"'))
 def call_semantic_search_with_filter(db_path, test_context, query: str, entity_type: str):
     """Call semantic_search with type filter."""
@@ -478,6 +497,63 @@ def check_results_ranked(test_context):
                 "Results not sorted by similarity"
 
 
+@then("there is one ranked result list per query")
+def check_batch_results_ranked(test_context):
+    """Verify each query got its own similarity-ordered result list."""
+    result = test_context.get("result")
+    assert result is not None, "No result captured"
+
+    per_query = result.get("results", [])
+    assert len(per_query) == len(test_context["queries"])
+    for results in per_query:
+        assert len(results) > 0, "Expected search results"
+        similarities = [r["similarity"] for r in results]
+        assert similarities == sorted(similarities, reverse=True), "Results not sorted by similarity"
+
+
+@when("I load the corpus matrix")
+def load_corpus(db_path, test_context):
+    """Load (and persist) the corpus embedding matrix."""
+    from chora_cvm.semantic import load_corpus_matrix
+
+    test_context["corpus"] = load_corpus_matrix(db_path, 1536)
+
+
+@when(parsers.parse('"{entity_id}" gets a stored embedding and I load the corpus matrix again'))
+def add_embedding_and_reload(db_path, test_context, entity_id: str):
+    """Store a new embedding, then reload the corpus matrix."""
+    from chora_cvm.semantic import load_corpus_matrix
+
+    store = EventStore(db_path)
+    store.save_embedding(
+        entity_id=entity_id,
+        model_name="text-embedding-3-small",
+        vector=create_mock_embedding(1536, 7),
+        dimension=1536,
+    )
+    store.close()
+    test_context["corpus"] = load_corpus_matrix(db_path, 1536)
+
+
+@then("the corpus matrix is persisted beside the database")
+def check_corpus_persisted(db_path, test_context):
+    """Verify the float16 matrix and its sidecar were written."""
+    assert os.path.exists(f"{db_path}.embeddings-1536.npy")
+    assert os.path.exists(f"{db_path}.embeddings-1536.json")
+
+    corpus = test_context["corpus"]
+    assert str(corpus["matrix"].dtype) == "float16"
+    assert corpus["matrix"].shape == (len(corpus["ids"]), 1536)
+
+
+@then(parsers.parse('the corpus matrix includes "{entity_id}"'))
+def check_corpus_includes(test_context, entity_id: str):
+    """Verify a reload picked up the new embedding."""
+    corpus = test_context["corpus"]
+    assert entity_id in corpus["ids"]
+    assert corpus["matrix"].shape[0] == len(corpus["ids"])
+
+
 @then("the results come from FTS5 search")
 def check_results_fts(test_context):
     """Verify results came from FTS5."""
@@ -0,0 +1,190 @@
+"""
+Step definitions for the Store Bulk Writes feature.
+
+Verifies that EventStore.save_entities / save_bonds produce the same rows
+as their single-row counterparts while batching the INSERTs.
+"""
+import pytest
+from pytest_bdd import given, scenarios, then, when, parsers
+
+from chora_cvm.store import EventStore
+from chora_cvm.schema import ExecutionContext, GenericEntity
+from chora_cvm.lib.graph import bond_manage, bond_manage_many, entity_create_many
+
+# Load scenarios from feature file
+scenarios("../features/store_bulk_writes.feature")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def test_context():
+    """Shared context for passing data between steps."""
+    return {"hook_calls": []}
+
+
+def _bond(i: int) -> dict:
+    return {
+        "bond_id": f"rel-bulk-{i}",
+        "bond_type": "specifies",
+        "from_id": f"story-{i}",
+        "to_id": f"behavior-{i}",
+        "confidence": 1.5,
+        "data": {"source": "test"},
+    }
+
+
+# =============================================================================
+# Given Steps
+# =============================================================================
+
+
+@given("a fresh EventStore database")
+def fresh_store(test_context, temp_db):
+    """Create a fresh EventStore."""
+    test_context["store"] = EventStore(temp_db)
+    yield
+    test_context["store"].close()
+
+
+@given("a registered entity save hook")
+def register_hook(test_context):
+    """Register an entity save hook that records calls."""
+    test_context["store"].add_entity_hook(
+        lambda entity_id, entity_type, data: test_context["hook_calls"].append(entity_id)
+    )
+
+
+# =============================================================================
+# When Steps
+# =============================================================================
+
+
+@when(parsers.parse("I bulk save {count:d} note entities"))
+def bulk_save_entities(test_context, count):
+    test_context["store"].save_entities(
+        GenericEntity(id=f"note-{i}", type="note", data={"title": f"Note {i}"})
+        for i in range(count)
+    )
+
+
+@when(parsers.parse("I bulk save {count:d} note entities with indexes deferred"))
+def bulk_save_entities_deferred(test_context, count):
+    store = test_context["store"]
+    with store.transaction(), store.deferred_indexes():
+        store.save_entities(
+            GenericEntity(id=f"note-{i}", type="note", data={"title": f"Note {i}"})
+            for i in range(count)
+        )
+
+
+def _principle_specs(count: int) -> list:
+    return [
+        {"entity_type": "principle", "entity_id": f"principle-{i}", "data": {"title": f"P{i}"}}
+        for i in range(count)
+    ]
+
+
+@when(parsers.parse("I create {count:d} principles and bond them with graph batch primitives"))
+def graph_batch_create(test_context, count):
+    store = test_context["store"]
+    ctx = ExecutionContext(db_path=store.path, store=store)
+    entity_create_many(_principle_specs(count), _ctx=ctx)
+    test_context["bond_specs"] = [
+        {"bond_type": "governs", "from_id": f"principle-{i}", "to_id": f"principle-{i + 1}"}
+        for i in range(count - 1)
+    ]
+    test_context["batch_result"] = bond_manage_many(test_context["bond_specs"], _ctx=ctx)
+
+
+@when("I batch bond a principle to a missing entity and to a real one")
+def graph_batch_bond_partial(test_context):
+    store = test_context["store"]
+    ctx = ExecutionContext(db_path=store.path, store=store)
+    entity_create_many(_principle_specs(2), _ctx=ctx)
+    test_context["batch_result"] = bond_manage_many(
+        [
+            {"bond_type": "governs", "from_id": "principle-0", "to_id": "principle-missing"},
+            {"bond_type": "governs", "from_id": "principle-0", "to_id": "principle-1"},
+        ],
+        _ctx=ctx,
+    )
+
+
+@when(parsers.parse("I bulk save {count:d} bonds"))
+def bulk_save_bonds(test_context, count):
+    test_context["store"].save_bonds(_bond(i) for i in range(count))
+
+
+# =============================================================================
+# Then Steps
+# =============================================================================
+
+
+@then(parsers.parse("{count:d} {entity_type} entities should exist in the store"))
+def check_entity_count(test_context, count, entity_type):
+    cur = test_context["store"]._conn.execute(
+        "SELECT COUNT(*) FROM entities WHERE type = ?", (entity_type,)
+    )
+    assert cur.fetchone()[0] == count
+
+
+@then(parsers.parse('the entity "{entity_id}" should have title "{title}"'))
+def check_entity_title(test_context, entity_id, title):
+    entity = test_context["store"].get_entity(entity_id)
+    assert entity is not None
+    assert entity["data"]["title"] == title
+
+
+@then(parsers.parse("the hook should have been called {count:d} times"))
+def check_hook_calls(test_context, count):
+    assert len(test_context["hook_calls"]) == count
+
+
+@then(parsers.parse("{count:d} bonds should exist in the store"))
+def check_bond_count(test_context, count):
+    cur = test_context["store"]._conn.execute("SELECT COUNT(*) FROM bonds")
+    assert cur.fetchone()[0] == count
+
+
+@then(parsers.parse('bond "{bond_id}" should equal a bond saved with save_bond'))
+def check_bond_equivalence(test_context, bond_id):
+    store = test_context["store"]
+    bulk_bond = store.get_bond(bond_id)
+    bulk_entity = store.get_entity(bond_id)
+
+    spec = _bond(int(bond_id.rsplit("-", 1)[1]))
+    store.save_bond(**spec)
+
+    assert store.get_bond(bond_id) == bulk_bond
+    assert store.get_entity(bond_id) == bulk_entity
+
+
+@then("the secondary indexes should exist")
+def check_secondary_indexes(test_context):
+    cur = test_context["store"]._conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+    )
+    names = {row[0] for row in cur}
+    assert {"idx_entities_type", "idx_bonds_from", "idx_bonds_to", "idx_bonds_type"} <= names
+
+
+@then("each batch bond result should match bond_manage")
+def check_batch_bond_results(test_context):
+    store = test_context["store"]
+    ctx = ExecutionContext(db_path=store.path, store=store)
+    results = test_context["batch_result"]["results"]
+    for spec, result in zip(test_context["bond_specs"], results):
+        batch_bond = store.get_bond(result["id"])
+        assert bond_manage(**spec, _ctx=ctx) == result
+        assert store.get_bond(result["id"]) == batch_bond
+
+
+@then(parsers.parse('the batch bond results should be "{first}" then "{second}"'))
+def check_batch_bond_statuses(test_context, first, second):
+    results = test_context["batch_result"]["results"]
+    assert [r["status"] for r in results] == [first, second]
+    assert test_context["batch_result"]["count"] == 1
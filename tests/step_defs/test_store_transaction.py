@@ -0,0 +1,106 @@
+"""
+Step definitions for the Store Transactions feature.
+
+Verifies that EventStore.transaction() defers per-call commits so that
+bulk loads are committed (or rolled back) as a single unit.
+"""
+import sqlite3
+
+import pytest
+from pytest_bdd import given, scenarios, then, when, parsers
+
+from chora_cvm.store import EventStore
+
+# Load scenarios from feature file
+scenarios("../features/store_transaction.feature")
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def test_context():
+    """Shared context for passing data between steps."""
+    return {}
+
+
+def _count_notes(db_path: str) -> int:
+    """Count note entities through an independent connection."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM entities WHERE type = 'note'").fetchone()[0]
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# Given Steps
+# =============================================================================
+
+
+@given("a fresh EventStore database")
+def fresh_store(test_context, temp_db):
+    """Create a fresh EventStore."""
+    test_context["store"] = EventStore(temp_db)
+    test_context["db_path"] = temp_db
+    yield
+    test_context["store"].close()
+
+
+# =============================================================================
+# When Steps
+# =============================================================================
+
+
+@when(parsers.parse("I save {count:d} entities inside a store transaction"))
+def save_in_transaction(test_context, count):
+    """Save entities in one transaction, observing the db mid-block."""
+    store = test_context["store"]
+    with store.transaction():
+        for i in range(count):
+            store.save_generic_entity(f"note-{i}", "note", {"title": f"Note {i}"})
+        test_context["count_during"] = _count_notes(test_context["db_path"])
+
+
+@when(parsers.parse("I save {count:d} entities inside a store transaction that raises"))
+def save_in_failing_transaction(test_context, count):
+    """Save entities and then raise before the block exits."""
+    store = test_context["store"]
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            for i in range(count):
+                store.save_generic_entity(f"note-{i}", "note", {"title": f"Note {i}"})
+            raise RuntimeError("boom")
+
+
+@when("I save entities inside nested store transactions")
+def save_in_nested_transactions(test_context):
+    """Save one entity in an outer block and one in an inner block."""
+    store = test_context["store"]
+    with store.transaction():
+        store.save_generic_entity("note-outer", "note", {"title": "Outer"})
+        with store.transaction():
+            store.save_generic_entity("note-inner", "note", {"title": "Inner"})
+        test_context["count_after_inner"] = _count_notes(test_context["db_path"])
+
+
+# =============================================================================
+# Then Steps
+# =============================================================================
+
+
+@then(parsers.parse("a second connection should see {count:d} entities before the block exits"))
+def check_count_during(test_context, count):
+    assert test_context["count_during"] == count
+
+
+@then(parsers.parse("a second connection should see {count:d} entities after the inner block exits"))
+def check_count_after_inner(test_context, count):
+    assert test_context["count_after_inner"] == count
+
+
+@then(parsers.parse("a second connection should see {count:d} entities after the block exits"))
+def check_count_after(test_context, count):
+    assert _count_notes(test_context["db_path"]) == count
@@ -60,6 +60,13 @@ def api_client(db_path, monkeypatch):
     return TestClient(app)
 
 
+@pytest.fixture
+def engine_reset(db_path, monkeypatch):
+    """Point the API's engine singleton at this test's database."""
+    import chora_cvm.api as api_module
+    monkeypatch.setattr(api_module, "_engine", None)
+
+
 # =============================================================================
 # Background Steps
 # =============================================================================
@@ -151,6 +158,21 @@ def create_tool_with_cognition(db_path, test_context, tool_id: str, description:
     test_context[f"actual_{tool_id}"] = tool_id
 
 
+@given(parsers.parse('a protocol entity "{protocol_id}" exists'))
+@when(parsers.parse('a protocol entity "{protocol_id}" is manifested'))
+def create_protocol(db_path, protocol_id: str):
+    """Create a protocol entity."""
+    manifest_entity(
+        db_path,
+        entity_type="protocol",
+        entity_id=protocol_id,
+        data={
+            "interface": {"inputs": {}, "outputs": {}},
+            "graph": {"start": "end", "nodes": {}, "edges": []},
+        },
+    )
+
+
 # =============================================================================
 # When Steps
 # =============================================================================
@@ -172,6 +194,22 @@ def fetch_tools_list_active(api_client, test_context):
     test_context["tools_data"] = response.json()
 
 
+@when("I fetch the capabilities list")
+def fetch_capabilities(api_client, engine_reset, test_context):
+    """Fetch capabilities from the API, remembering the ETag."""
+    response = api_client.get("/capabilities")
+    assert response.status_code == 200
+    test_context["etag"] = response.headers["etag"]
+
+
+@when("I fetch the capabilities list again with its ETag")
+def fetch_capabilities_with_etag(api_client, test_context):
+    """Poll capabilities with If-None-Match set to the remembered ETag."""
+    test_context["response"] = api_client.get(
+        "/capabilities", headers={"If-None-Match": test_context["etag"]}
+    )
+
+
 # =============================================================================
 # Then Steps
 # =============================================================================
@@ -239,3 +277,16 @@ def check_tool_group(test_context, tool_id: str, group: str):
     tool = next((t for t in tools if t.get("id") == tool_id), None)
     assert tool is not None, f"Tool {tool_id} not found"
     assert tool.get("group") == group, f"Expected group '{group}', got '{tool.get('group')}'"
+
+
+@then(parsers.parse("the capabilities response status should be {status:d}"))
+def check_capabilities_status(test_context, status: int):
+    """Verify the status of the last capabilities poll."""
+    assert test_context["response"].status_code == status
+
+
+@then(parsers.parse('the capabilities should include "{capability_id}"'))
+def check_capabilities_include(test_context, capability_id: str):
+    """Verify the last capabilities poll lists the given capability."""
+    capabilities = test_context["response"].json()["capabilities"]
+    assert capability_id in [c["id"] for c in capabilities]